@@ -1,26 +1,46 @@
 """Game constants and configuration values"""
-import pygame
+from collections import namedtuple
 
-# Initialize Pygame for display info
-pygame.init()
+import pygame
 
-# Get system resolution
-info = pygame.display.Info()
-SCREEN_WIDTH = info.current_w
-SCREEN_HEIGHT = info.current_h
 FPS = 60
 
-# Planet visual types
-PLANET_TYPES = [
-    {"name": "Rocky", "color": (139, 69, 19), "rings": False, "spots": True},
-    {"name": "Gas Giant", "color": (255, 140, 0), "rings": True, "spots": False},
-    {"name": "Ice World", "color": (173, 216, 230), "rings": False, "spots": False},
-    {"name": "Desert", "color": (238, 203, 173), "rings": False, "spots": True},
-    {"name": "Ocean", "color": (0, 105, 148), "rings": False, "spots": False},
-    {"name": "Volcanic", "color": (178, 34, 34), "rings": False, "spots": True},
-    {"name": "Forest", "color": (34, 139, 34), "rings": False, "spots": False},
-    {"name": "Crystal", "color": (147, 0, 211), "rings": True, "spots": False},
-]
+# System resolution, queried lazily so importing constants does not start SDL video
+_screen_size = None
+
+
+def get_screen_size():
+    """Return the desktop resolution, initialising the display module on first use"""
+    global _screen_size
+    if _screen_size is None:
+        if not pygame.display.get_init():
+            pygame.display.init()
+        info = pygame.display.Info()
+        _screen_size = (info.current_w, info.current_h)
+    return _screen_size
+
+
+def __getattr__(name):
+    # SCREEN_WIDTH / SCREEN_HEIGHT are resolved on first access
+    if name == "SCREEN_WIDTH":
+        return get_screen_size()[0]
+    if name == "SCREEN_HEIGHT":
+        return get_screen_size()[1]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Planet visual types, read by attribute on every planet draw
+PlanetType = namedtuple("PlanetType", "name color rings spots")
+PLANET_TYPES = (
+    PlanetType("Rocky", (139, 69, 19), False, True),
+    PlanetType("Gas Giant", (255, 140, 0), True, False),
+    PlanetType("Ice World", (173, 216, 230), False, False),
+    PlanetType("Desert", (238, 203, 173), False, True),
+    PlanetType("Ocean", (0, 105, 148), False, False),
+    PlanetType("Volcanic", (178, 34, 34), False, True),
+    PlanetType("Forest", (34, 139, 34), False, False),
+    PlanetType("Crystal", (147, 0, 211), True, False),
+)
 
 # Colors
 BLACK = (0, 0, 0)
@@ -50,6 +70,9 @@ PARTICLE_COLORS = [
     (255, 150, 100),  # Orange
     (150, 100, 255),  # Purple
 ]
+BOUNCING_PARTICLE_COLORS = [(255, 150, 255), (255, 255, 150), (150, 255, 255)]
+# Every colour a particle can have; particle stores keep an index into this
+PARTICLE_PALETTE = tuple(PARTICLE_COLORS + BOUNCING_PARTICLE_COLORS)
 
 # Game costs and settings
 PLANET_BASE_COST = 40
@@ -63,3 +86,6 @@ DEFAULT_SFX_VOLUME = 0.5
 DEFAULT_MUSIC_VOLUME = 1.0
 DEFAULT_GRAVITY_DISTANCE = 1000.0
 DEFAULT_AIR_RESISTANCE = 0.1
+
+# Number of pre-generated spawn sound pitches
+SPAWN_SOUND_VARIANTS = 8
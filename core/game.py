@@ -5,13 +5,20 @@ import pygame
 import random
 import math
 import os
+import numpy as np
+from collections import OrderedDict
 from typing import List
 
 # Import from our modular structure
-from entities.particle import Particle
+from entities.particle import Particle, ParticleStore
 from entities.planet import Planet, DwarfPlanet
 from systems.camera import Camera
 from systems.audio import generate_tick_sound, generate_spawn_sound
+from systems.physics import planet_arrays, find_planet_at, PlanetGrid
+from systems.physics_kernel import wall_arrays
+from graphics.particles import draw_particles, trails_visible
+from graphics.planets import draw_planets
+from graphics.stars import star_frame
 from ui.components import Slider, MusicSelector
 from ui.effects import MoneyPopup, LightRay
 from config.constants import *
@@ -23,15 +30,29 @@ class Wall:
         self.y1 = y1
         self.x2 = x2
         self.y2 = y2
-        self.length = math.sqrt((x2-x1)**2 + (y2-y1)**2)
+        # Segment direction, length and 1/length^2 for the projection in check_collision
+        self.dx = x2 - x1
+        self.dy = y2 - y1
+        self.length = math.hypot(self.dx, self.dy)
+        self.length_sq = self.dx * self.dx + self.dy * self.dy  # For sqrt-free comparisons
+        self.inv_length_sq = 1.0 / self.length_sq if self.length_sq > 0 else 0.0
+        # Unit normal and offset of the wall's line: nx * x + ny * y + c is the signed distance
+        # (all zero for a degenerate wall, which then falls through to the point check)
+        self.nx = self.dy / self.length if self.length > 0 else 0.0
+        self.ny = -self.dx / self.length if self.length > 0 else 0.0
+        self.c = -(self.nx * x1 + self.ny * y1)
         
     def check_collision(self, px: float, py: float, radius: float) -> bool:
-        # Simple point-to-line distance check
-        A = py - self.y1
-        B = self.x1 - px
-        C = px * self.y1 - self.x1 * py
-        distance = abs(A * self.x2 + B * self.y2 + C) / math.sqrt(A*A + B*B) if A*A + B*B > 0 else float('inf')
-        return distance < radius
+        # Points further than radius from the infinite line can't touch the segment
+        d = self.nx * px + self.ny * py + self.c
+        if d * d >= radius * radius:
+            return False
+        # Distance from the point to the closest point on the segment, compared squared
+        t = ((px - self.x1) * self.dx + (py - self.y1) * self.dy) * self.inv_length_sq
+        t = max(0.0, min(1.0, t))
+        cx = px - (self.x1 + t * self.dx)
+        cy = py - (self.y1 + t * self.dy)
+        return cx * cx + cy * cy < radius * radius
         
     def draw(self, screen, camera, gravity_distance: float = None, air_resistance_intensity: float = None):
         sx1, sy1 = camera.world_to_screen(self.x1, self.y1)
@@ -40,52 +61,59 @@ class Wall:
 
 
 class ParticleEmitter:
-    def __init__(self, world_width=80000, world_height=80000):
+    def __init__(self, world_width=80000, world_height=80000, spawn_sounds=()):
         self.world_width = world_width
         self.world_height = world_height
         self.spawn_rate = 90  # particles per second
         self.spawn_timer = 0
-        self.particles: List[Particle] = []
+        # Particle state lives in SoA columns; self.particles holds the row views
+        self.store = ParticleStore()
+        self.particles: List[Particle] = self.store.particles
+        self.collection_queue = []  # (x, y, value) of every catch, drained by Game.update
         self.sound_timer = 0  # To limit sound frequency
+        self.spawn_sounds = list(spawn_sounds)  # Pre-generated spawn sounds, one picked at random per spawn
         
-    def update(self, dt: float, planets: List[Planet], sfx_volume: float = 0.5, camera=None, gravity_distance: float = 500.0, air_resistance_intensity: float = 0.5, walls: List[Wall] = None):
+    def update(self, dt: float, planets: List[Planet], sfx_volume: float = 0.5, camera=None, gravity_distance: float = 500.0, air_resistance_intensity: float = 0.5, walls: List[Wall] = None,
+               planet_data=None, wall_data=None, gravity_grid: PlanetGrid = None):
         self.spawn_timer += dt
         self.sound_timer += dt
         spawn_interval = 1.0 / self.spawn_rate
-        particles_spawned = 0
-        while self.spawn_timer >= spawn_interval:
-            self.spawn_timer -= spawn_interval
-            px = random.uniform(-self.world_width//2, self.world_width//2)
-            py = random.uniform(-self.world_height//2, self.world_height//2)
-            pz = random.uniform(0.3, 1.0)
-            self.particles.append(Particle(px, py, pz, from_spawner=False))  # Main emitter particles fade in
-            particles_spawned += 1
+        # Spawn everything due this frame as one batch
+        particles_spawned = int(self.spawn_timer // spawn_interval)
+        if particles_spawned > 0:
+            self.spawn_timer -= particles_spawned * spawn_interval
+            xs = np.random.uniform(-self.world_width//2, self.world_width//2, particles_spawned)
+            ys = np.random.uniform(-self.world_height//2, self.world_height//2, particles_spawned)
+            zs = np.random.uniform(0.3, 1.0, particles_spawned)
+            self.store.spawn(xs, ys, zs, from_spawner=False)  # Main emitter particles fade in
         # Play spawn sound for the first spawned particle (if any)
-        if particles_spawned > 0 and self.sound_timer >= 0.05:
+        if particles_spawned > 0 and self.sound_timer >= 0.05 and self.spawn_sounds:
             try:
                 p = self.particles[-1]
-                spawn_sound = generate_spawn_sound()
+                spawn_sound = random.choice(self.spawn_sounds)
                 if camera:
                     dx = p.x - camera.x
                     dy = p.y - camera.y
-                    distance = math.sqrt(dx*dx + dy*dy)
+                    distance = math.hypot(dx, dy)
                     if distance < 5000:  # Only play if reasonably close
                         volume = max(0.05, min(sfx_volume, sfx_volume * (5000 - distance) / 5000))
                         spawn_sound.set_volume(volume)
                         spawn_sound.play()
                 self.sound_timer = 0
-            except:
+            except pygame.error:
                 pass  # Ignore sound errors
         
-        # Update all particles
-        for particle in self.particles[:]:  # Use slice copy for safe removal
-            particle.update(dt, planets, gravity_distance, air_resistance_intensity, camera, sfx_volume, walls)
-            if not particle.alive:
-                self.particles.remove(particle)
-    
+        # Update lifetimes and physics on the particle arrays, then drop dead rows
+        self.store.update(dt, planet_data or planet_arrays(planets), wall_data or wall_arrays(walls or []),
+                          gravity_distance, air_resistance_intensity, gravity_grid, trails_visible(camera))
+        self.store.compact()
+
+    def collect(self, planet_data, grid: PlanetGrid = None):
+        """Catch particles touching a planet. Returns the number of catches per planet."""
+        return self.store.collect(self.collection_queue, planet_data, grid)
+
     def draw(self, screen, camera, planets=None):
-        for particle in self.particles:
-            particle.draw(screen, camera, planets)
+        draw_particles(screen, camera, self.store, planets)
 
 
 class ParticleSpawner:
@@ -94,37 +122,70 @@ class ParticleSpawner:
         self.y = y
         self.spawn_rate = 5  # particles per second
         self.spawn_timer = 0
-        self.particles: List[Particle] = []
+        # Particle state lives in SoA columns; self.particles holds the row views
+        self.store = ParticleStore()
+        self.particles: List[Particle] = self.store.particles
+        self.collection_queue = []  # (x, y, value) of every catch, drained by Game.update
         
-    def update(self, dt: float, planets: List[Planet], sfx_volume: float = 0.5, camera=None, gravity_distance: float = 500.0, air_resistance_intensity: float = 0.5, walls: List[Wall] = None):
+    def update(self, dt: float, planets: List[Planet], sfx_volume: float = 0.5, camera=None, gravity_distance: float = 500.0, air_resistance_intensity: float = 0.5, walls: List[Wall] = None,
+               planet_data=None, wall_data=None, gravity_grid: PlanetGrid = None):
         self.spawn_timer += dt
         spawn_interval = 1.0 / self.spawn_rate
-        while self.spawn_timer >= spawn_interval:
-            self.spawn_timer -= spawn_interval
-            # Spawn near the spawner
-            px = self.x + random.uniform(-50, 50)
-            py = self.y + random.uniform(-50, 50)
-            pz = random.uniform(0.3, 1.0)
-            self.particles.append(Particle(px, py, pz, from_spawner=True))  # Spawner particles don't fade in
-        
-        # Update all particles
-        for particle in self.particles[:]:  # Use slice copy for safe removal
-            particle.update(dt, planets, gravity_distance, air_resistance_intensity, camera, sfx_volume, walls)
-            if not particle.alive:
-                self.particles.remove(particle)
-    
+        # Spawn everything due this frame near the spawner as one batch
+        count = int(self.spawn_timer // spawn_interval)
+        if count > 0:
+            self.spawn_timer -= count * spawn_interval
+            xs = self.x + np.random.uniform(-50, 50, count)
+            ys = self.y + np.random.uniform(-50, 50, count)
+            zs = np.random.uniform(0.3, 1.0, count)
+            self.store.spawn(xs, ys, zs, from_spawner=True)  # Spawner particles don't fade in
+        
+        # Update lifetimes and physics on the particle arrays, then drop dead rows
+        self.store.update(dt, planet_data or planet_arrays(planets), wall_data or wall_arrays(walls or []),
+                          gravity_distance, air_resistance_intensity, gravity_grid, trails_visible(camera))
+        self.store.compact()
+
+    def collect(self, planet_data, grid: PlanetGrid = None):
+        """Catch particles touching a planet. Returns the number of catches per planet."""
+        return self.store.collect(self.collection_queue, planet_data, grid)
+
     def draw(self, screen, camera, planets=None):
         # Draw the spawner itself
-        screen_x, screen_y = camera.world_to_screen(self.x, self.y)
-        pygame.draw.circle(screen, (255, 255, 0), (int(screen_x), int(screen_y)), max(3, int(8 * camera.zoom)))
-        pygame.draw.circle(screen, (255, 255, 255), (int(screen_x), int(screen_y)), max(3, int(8 * camera.zoom)), 2)
+        center = camera.world_to_screen(self.x, self.y)
+        radius = max(3, int(8 * camera.zoom))
+        pygame.draw.circle(screen, (255, 255, 0), center, radius)
+        pygame.draw.circle(screen, (255, 255, 255), center, radius, 2)
         
         # Draw particles
-        for particle in self.particles:
-            particle.draw(screen, camera, planets)
+        draw_particles(screen, camera, self.store, planets)
+
+
+# Directions of the light rays burst out of every catch
+_RAY_ANGLES = tuple((i / 8) * 2 * math.pi for i in range(8))
+
+
+def _update_effects(effects, spare, dt):
+    """Update effects, moving the ones still running into spare; returns (running, spare for next frame)"""
+    spare.clear()
+    for effect in effects:
+        if effect.update(dt):
+            spare.append(effect)
+    return spare, effects
+
+
+# Rendered text surfaces kept by Game.render_text
+TEXT_CACHE_SIZE = 256
+
+# How often (per second) the cached starfield is redrawn just to animate the twinkle
+TWINKLE_REFRESH_RATE = 15
+# Star sprites are pre-rendered for this many twinkle levels and brightness steps of this size
+TWINKLE_LEVELS = 8
+STAR_BRIGHTNESS_STEP = 8
 
 
 class StarField:
+    STAR_COLORS = [(255, 255, 255), (255, 255, 200), (200, 200, 255), (255, 200, 200)]
+
     def __init__(self, num_stars=300, width=80000, height=80000, min_depth=0.3, max_depth=1.0):
         self.stars = []
         for _ in range(num_stars):
@@ -133,38 +194,92 @@ class StarField:
                 'y': random.uniform(-height//2, height//2),
                 'size': random.uniform(0.5, 2.0),
                 'depth': random.uniform(min_depth, max_depth),
-                'color': random.choice([(255, 255, 255), (255, 255, 200), (200, 200, 255), (255, 200, 200)]),
+                'color': random.randrange(len(self.STAR_COLORS)),
                 'base_brightness': random.randint(100, 255),
                 'twinkle_speed': random.uniform(0.5, 2.0),
                 'twinkle_phase': random.uniform(0, 2 * math.pi)
             })
+        # Star attributes as arrays so screen positions and twinkle are computed in bulk
+        for name in ('x', 'y', 'size', 'depth', 'color', 'base_brightness', 'twinkle_speed', 'twinkle_phase'):
+            setattr(self, name, np.array([star[name] for star in self.stars]))
+        # Per-frame star_frame output, allocated once
+        self._px = np.empty(num_stars)
+        self._py = np.empty(num_stars)
+        self._sizes = np.empty(num_stars, np.int64)
+        self._twinkle = np.empty(num_stars)
+        self._visible = np.empty(num_stars, bool)
+        self._sprites = {}  # (color, brightness bucket, size, twinkle level) -> (Surface, offset)
+        # Last rendered frame, reused while the camera is idle
+        self._cache = None
+        self._cache_key = None
 
     def draw(self, screen, camera):
-        t = pygame.time.get_ticks() / 1000.0
-        for star in self.stars:
-            px = (star['x'] - camera.x * star['depth']) * camera.zoom + camera.screen_width // 2
-            py = (star['y'] - camera.y * star['depth']) * camera.zoom + camera.screen_height // 2
-            size = max(1, int(star['size'] * camera.zoom * (1.2 - star['depth'])))
-            
-            # Enhanced twinkle
-            twinkle = 0.5 + 0.5 * math.sin(t * star['twinkle_speed'] + star['twinkle_phase'])
-            brightness = int(star['base_brightness'] * (0.7 + 0.3 * twinkle))
-            color = tuple(min(255, int(c * (0.7 + 0.3 * twinkle))) for c in star['color'])
-            
-            # Enhanced star rendering with lens flares
-            if 0 <= px < camera.screen_width and 0 <= py < camera.screen_height:
-                # Multiple glow layers for depth
-                if size > 1:
-                    for layer in range(3):
-                        layer_size = size + layer * 2
-                        layer_alpha = max(20, brightness // (layer + 1))
-                        glow_surf = pygame.Surface((layer_size * 2, layer_size * 2), pygame.SRCALPHA)
-                        glow_color = (*color, layer_alpha)
-                        pygame.draw.circle(glow_surf, glow_color, (layer_size, layer_size), layer_size)
-                        screen.blit(glow_surf, (px - layer_size, py - layer_size))
-                
-                # Main star
-                pygame.draw.circle(screen, color, (int(px), int(py)), size)
+        """Clear the screen to the background and draw the stars.
+
+        The frame is rendered to an off-screen surface and reused until the
+        camera moves or zooms; while idle the twinkle is refreshed at
+        TWINKLE_REFRESH_RATE instead of every frame.
+        """
+        tick = pygame.time.get_ticks() * TWINKLE_REFRESH_RATE // 1000
+        key = (camera.x, camera.y, camera.zoom, camera.screen_width, camera.screen_height, tick)
+        if key != self._cache_key:
+            size = (camera.screen_width, camera.screen_height)
+            if self._cache is None or self._cache.get_size() != size:
+                self._cache = pygame.Surface(size).convert()
+            self._cache.fill(BLACK)
+            self._render(self._cache, camera, tick / TWINKLE_REFRESH_RATE)
+            self._cache_key = key
+        screen.blit(self._cache, (0, 0))
+
+    def _sprite(self, color_index, brightness_bucket, size, level):
+        """Star with its glow layers pre-rendered, built the first time a combination is seen"""
+        key = (color_index, brightness_bucket, size, level)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            twinkle = level / (TWINKLE_LEVELS - 1)
+            brightness = brightness_bucket * STAR_BRIGHTNESS_STEP
+            color = tuple(min(255, int(c * (0.7 + 0.3 * twinkle))) for c in self.STAR_COLORS[color_index])
+            offset = size + 4 if size > 1 else size  # Outermost glow layer is size + 4
+            surface = pygame.Surface((offset * 2 + 1, offset * 2 + 1), pygame.SRCALPHA)
+            # Multiple glow layers for depth
+            if size > 1:
+                for layer in range(3):
+                    layer_size = size + layer * 2
+                    layer_alpha = max(20, brightness // (layer + 1))
+                    glow_surf = pygame.Surface((layer_size * 2, layer_size * 2), pygame.SRCALPHA)
+                    pygame.draw.circle(glow_surf, (*color, layer_alpha), (layer_size, layer_size), layer_size)
+                    surface.blit(glow_surf, (offset - layer_size, offset - layer_size))
+            # Main star
+            pygame.draw.circle(surface, color, (offset, offset), size)
+            # Match the display's pixel format so every blit of the sprite skips the conversion
+            sprite = (surface.convert_alpha(), offset)
+            self._sprites[key] = sprite
+        return sprite
+
+    def _render(self, screen, camera, t):
+        px, py = self._px, self._py
+        # Positions and culling for every star, sizes and twinkle for the visible ones
+        star_frame(self.x, self.y, self.depth, self.size, self.twinkle_speed, self.twinkle_phase,
+                   camera.x, camera.y, camera.zoom, camera.screen_width // 2, camera.screen_height // 2,
+                   camera.screen_width, camera.screen_height, t, px, py, self._sizes, self._twinkle, self._visible)
+        visible = np.flatnonzero(self._visible)
+        if len(visible) == 0:
+            return
+        sizes = self._sizes[visible]
+        
+        # Enhanced twinkle, quantised to a few pre-rendered levels
+        levels = np.rint(self._twinkle[visible] * (TWINKLE_LEVELS - 1)).astype(np.int64)
+        brightness = (self.base_brightness[visible] * (0.7 + 0.3 * levels / (TWINKLE_LEVELS - 1))).astype(np.int64)
+        
+        sprites = []
+        for color, bucket, size, level, x, y in zip(self.color[visible].tolist(),
+                                                    (brightness // STAR_BRIGHTNESS_STEP).tolist(),
+                                                    sizes.tolist(), levels.tolist(),
+                                                    px[visible].astype(np.int64).tolist(),
+                                                    py[visible].astype(np.int64).tolist()):
+            surface, offset = self._sprite(color, bucket, size, level)
+            sprites.append((surface, (x - offset, y - offset)))
+        screen.blits(sprites, doreturn=False)
 
 
 # Background functionality removed as requested
@@ -173,12 +288,14 @@ class StarField:
 class Game:
     def __init__(self):
         self.fullscreen = False
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.screen = pygame.display.set_mode(get_screen_size())
+        # Cached display size, only refreshed when the display mode changes
+        self.screen_width, self.screen_height = self.screen.get_size()
         pygame.display.set_caption("Particle Tycoon - Left Click & Drag to Move, Scroll to Zoom")
         self.clock = pygame.time.Clock()
         
         # Camera system
-        self.camera = Camera(SCREEN_WIDTH, SCREEN_HEIGHT)
+        self.camera = Camera(self.screen_width, self.screen_height)
         
         # Star field
         self.starfield = StarField()
@@ -187,7 +304,14 @@ class Game:
         self.money = 100
         self.planets: List[Planet] = []
         self.walls: List[Wall] = []
-        self.emitter = ParticleEmitter()  # No longer at (0,0)
+        # Synthesise sound effects once and reuse them for every event
+        try:
+            self._tick_sound = generate_tick_sound()
+            spawn_sounds = [generate_spawn_sound() for _ in range(SPAWN_SOUND_VARIANTS)]
+        except pygame.error:
+            self._tick_sound = None  # Sound system not available
+            spawn_sounds = []
+        self.emitter = ParticleEmitter(spawn_sounds=spawn_sounds)  # No longer at (0,0)
         
         # UI state
         self.placing_planet = False
@@ -196,18 +320,24 @@ class Game:
         self.placing_dwarf_planet = False
         self.wall_start_pos = None
         self.spawners = []  # List of additional particle spawners
+        self._particle_sources = [self.emitter]  # Emitter + spawners, rebuilt when spawners change
+        self._particle_count = 0  # Live particles across all sources, refreshed in update()
         self.spawner_cost = SPAWNER_COST
         self.dwarf_planet_cost = DWARF_PLANET_COST
         self.selected_planet = None
         self.hovered_planet = None  # Track which planet is being hovered
+        self._mouse_screen = pygame.mouse.get_pos()  # Last mouse position seen in handle_events
+        self._hover_key = None  # (mouse, camera view) the hover state was computed for
         self.planet_cost = PLANET_BASE_COST
         self.wall_cost_per_unit = WALL_COST_PER_UNIT
         self.spawn_rate_cost = SPAWN_RATE_COST
         self.font = pygame.font.Font(None, 36)
         self.small_font = pygame.font.Font(None, 24)
+        self._text_cache = OrderedDict()  # (font, text, color) -> rendered Surface
         
         # Settings menu
         self.show_settings = False
+        self._settings_chrome = None  # Built on first open
         self.sfx_volume = DEFAULT_SFX_VOLUME
         self.music_volume = DEFAULT_MUSIC_VOLUME
         self.sfx_slider = Slider(250, 180, 150, 20, 0.0, 1.0, self.sfx_volume)
@@ -225,9 +355,28 @@ class Game:
         self.music_selector = MusicSelector(250, 280, 200, 50)
         self.current_music = None
         
+        # Spatial index over planets, rebuilt when planets change
+        self._planet_grid = PlanetGrid()
+        self._planet_arrays = planet_arrays(self.planets)
+        self._planet_hit_radius_sq = np.empty(0)  # Squared hover/click reach per planet
+        self._planets_dirty = True
+        # Coarser grid for gravity lookups, rebuilt when planets or the gravity range change
+        self._gravity_grid = PlanetGrid()
+        self._gravity_grid_range = None
+        self._max_air_radius = 0
+        self._wall_arrays = wall_arrays(self.walls)
+        
+        # Buy buttons, shared by draw_ui and handle_ui_click (same order as in draw_ui)
+        self._button_rects = [pygame.Rect(50, 250 + i * 50, 200, 40) for i in range(5)]
+        self._button_actions = [self._buy_planet, self._buy_dwarf_planet, self._buy_spawner,
+                                self._buy_wall, self._upgrade_spawn_rate]
+        
         # UI Effects
         self.money_popups: List[MoneyPopup] = []
         self.light_rays: List[LightRay] = []
+        # Spare lists the effects are swapped into each frame (see update)
+        self._popup_spare: List[MoneyPopup] = []
+        self._ray_spare: List[LightRay] = []
         
         # Load and play music
         self.load_music()
@@ -250,6 +399,9 @@ class Game:
             if event.type == pygame.QUIT:
                 return False
             
+            if event.type == pygame.MOUSEMOTION:
+                self._mouse_screen = event.pos
+            
             # Handle settings menu first
             if self.show_settings:
                 self.sfx_slider.handle_event(event)
@@ -297,6 +449,8 @@ class Game:
                     self.show_settings = not self.show_settings
                 elif event.key == pygame.K_F11:
                     self.toggle_fullscreen()
+                elif event.key == pygame.K_F3:
+                    self.camera.show_debug = not self.camera.show_debug
             
             # Mouse events
             if event.type == pygame.MOUSEBUTTONDOWN:
@@ -311,210 +465,212 @@ class Game:
                     # Handle placement modes
                     if self.placing_planet and self.money >= self.planet_cost:
                         self.planets.append(Planet(world_x, world_y))
+                        self._on_planets_changed()
                         self.money -= self.planet_cost
                         self.placing_planet = False
                         
-                        # Play purchase sound
-                        try:
-                            tick_sound = generate_tick_sound()
-                            tick_sound.set_volume(self.sfx_volume)
-                            tick_sound.play()
-                        except:
-                            pass
+                        self.play_tick_sound()  # Purchase sound
                     
                     elif self.placing_dwarf_planet and self.money >= self.dwarf_planet_cost:
                         self.planets.append(DwarfPlanet(world_x, world_y))
+                        self._on_planets_changed()
                         self.money -= self.dwarf_planet_cost
                         self.placing_dwarf_planet = False
                         
-                        # Play purchase sound
-                        try:
-                            tick_sound = generate_tick_sound()
-                            tick_sound.set_volume(self.sfx_volume)
-                            tick_sound.play()
-                        except:
-                            pass
+                        self.play_tick_sound()  # Purchase sound
                     
                     elif self.placing_spawner and self.money >= self.spawner_cost:
                         self.spawners.append(ParticleSpawner(world_x, world_y))
+                        self._on_spawners_changed()
                         self.money -= self.spawner_cost
                         self.placing_spawner = False
                         
-                        # Play purchase sound
-                        try:
-                            tick_sound = generate_tick_sound()
-                            tick_sound.set_volume(self.sfx_volume)
-                            tick_sound.play()
-                        except:
-                            pass
+                        self.play_tick_sound()  # Purchase sound
                     
                     elif self.placing_wall:
                         if self.wall_start_pos is None:
                             self.wall_start_pos = (world_x, world_y)
                         else:
-                            wall_length = math.sqrt((world_x - self.wall_start_pos[0])**2 + (world_y - self.wall_start_pos[1])**2)
+                            wall_length = math.hypot(world_x - self.wall_start_pos[0], world_y - self.wall_start_pos[1])
                             wall_cost = wall_length * self.wall_cost_per_unit
                             if self.money >= wall_cost:
                                 self.walls.append(Wall(self.wall_start_pos[0], self.wall_start_pos[1], world_x, world_y))
+                                self._on_walls_changed()
                                 self.money -= wall_cost
                                 self.placing_wall = False
                                 self.wall_start_pos = None
                                 
-                                # Play purchase sound
-                                try:
-                                    tick_sound = generate_tick_sound()
-                                    tick_sound.set_volume(self.sfx_volume)
-                                    tick_sound.play()
-                                except:
-                                    pass
+                                self.play_tick_sound()  # Purchase sound
                     
                     else:
                         # Select planet
-                        self.selected_planet = None
-                        for planet in self.planets:
-                            dx = planet.x - world_x
-                            dy = planet.y - world_y
-                            distance = math.sqrt(dx*dx + dy*dy)
-                            if distance < planet.radius + 10:  # 10 pixel tolerance
-                                self.selected_planet = planet
-                                break
+                        self.selected_planet = self._planet_at(world_x, world_y)
         
         return True
 
+    def _on_planets_changed(self):
+        """Mark the planet grid and packed planet arrays as stale"""
+        self._planets_dirty = True
+        self._hover_key = None
+
+    def _on_walls_changed(self):
+        """Repack wall end points for the physics kernel"""
+        self._wall_arrays = wall_arrays(self.walls)
+
+    def _on_spawners_changed(self):
+        """Refresh the list of particle sources after spawners are added or removed"""
+        self._particle_sources = [self.emitter, *self.spawners]
+
+    def _refresh_planet_index(self):
+        if self._planets_dirty:
+            self._planet_grid.build(self.planets)
+            self._planet_arrays = planet_arrays(self.planets)
+            self._planet_hit_radius_sq = np.fromiter((p._hit_radius_sq for p in self.planets), np.float64, len(self.planets))
+            self._max_air_radius = 3 * max((p.radius for p in self.planets), default=0)
+            self._gravity_grid_range = None
+            self._planets_dirty = False
+        # Gravity grid cells must cover both the gravity range and every atmosphere (3 radii)
+        gravity_range = max(self.gravity_distance, self._max_air_radius)
+        if gravity_range != self._gravity_grid_range:
+            self._gravity_grid.build(self.planets, gravity_range)
+            self._gravity_grid_range = gravity_range
+
+    def _planet_at(self, world_x: float, world_y: float):
+        """First planet (in list order) whose hover/click reach contains a world position"""
+        self._refresh_planet_index()
+        planet_x, planet_y, _, _ = self._planet_arrays
+        index = find_planet_at(world_x, world_y, planet_x, planet_y, self._planet_hit_radius_sq)
+        return self.planets[index] if index >= 0 else None
+
+    def play_tick_sound(self):
+        """Play the purchase tick, if the sound system came up"""
+        if self._tick_sound is None:
+            return
+        try:
+            self._tick_sound.set_volume(self.sfx_volume)
+            self._tick_sound.play()
+        except pygame.error:
+            pass
+
     def handle_ui_click(self, mouse_x: int, mouse_y: int) -> bool:
         """Handle UI button clicks. Returns True if a UI element was clicked."""
-        # Buy Planet button
-        if 50 <= mouse_x <= 200 and 50 <= mouse_y <= 90:
-            if self.money >= self.planet_cost:
-                self.placing_planet = True
-                self.placing_dwarf_planet = False
-                self.placing_spawner = False
-                self.placing_wall = False
-            return True
-        
-        # Buy Dwarf Planet button
-        if 50 <= mouse_x <= 200 and 100 <= mouse_y <= 140:
-            if self.money >= self.dwarf_planet_cost:
-                self.placing_dwarf_planet = True
-                self.placing_planet = False
-                self.placing_spawner = False
-                self.placing_wall = False
-            return True
-        
-        # Buy Spawner button
-        if 50 <= mouse_x <= 200 and 150 <= mouse_y <= 190:
-            if self.money >= self.spawner_cost:
-                self.placing_spawner = True
-                self.placing_planet = False
-                self.placing_dwarf_planet = False
-                self.placing_wall = False
-            return True
-        
-        # Buy Wall button
-        if 50 <= mouse_x <= 200 and 200 <= mouse_y <= 240:
-            self.placing_wall = True
-            self.placing_planet = False
+        for rect, action in zip(self._button_rects, self._button_actions):
+            if rect.collidepoint(mouse_x, mouse_y):
+                action()
+                return True
+        return False
+
+    def _buy_planet(self):
+        if self.money >= self.planet_cost:
+            self.placing_planet = True
             self.placing_dwarf_planet = False
             self.placing_spawner = False
-            self.wall_start_pos = None
-            return True
-        
-        # Increase spawn rate button
-        if 50 <= mouse_x <= 200 and 250 <= mouse_y <= 290:
-            if self.money >= self.spawn_rate_cost:
-                self.emitter.spawn_rate += 10
-                self.money -= self.spawn_rate_cost
-                self.spawn_rate_cost = int(self.spawn_rate_cost * 1.5)  # Increase cost
-                
-                # Play purchase sound
-                try:
-                    tick_sound = generate_tick_sound()
-                    tick_sound.set_volume(self.sfx_volume)
-                    tick_sound.play()
-                except:
-                    pass
-            return True
-        
-        return False
+            self.placing_wall = False
+
+    def _buy_dwarf_planet(self):
+        if self.money >= self.dwarf_planet_cost:
+            self.placing_dwarf_planet = True
+            self.placing_planet = False
+            self.placing_spawner = False
+            self.placing_wall = False
 
+    def _buy_spawner(self):
+        if self.money >= self.spawner_cost:
+            self.placing_spawner = True
+            self.placing_planet = False
+            self.placing_dwarf_planet = False
+            self.placing_wall = False
+
+    def _buy_wall(self):
+        self.placing_wall = True
+        self.placing_planet = False
+        self.placing_dwarf_planet = False
+        self.placing_spawner = False
+        self.wall_start_pos = None
+
+    def _upgrade_spawn_rate(self):
+        if self.money >= self.spawn_rate_cost:
+            self.emitter.spawn_rate += 10
+            self.money -= self.spawn_rate_cost
+            self.spawn_rate_cost = int(self.spawn_rate_cost * 1.5)  # Increase cost
+            
+            self.play_tick_sound()  # Purchase sound
+        
     def update(self, dt):
+        self._refresh_planet_index()
+        
         # Update particle emitter
-        self.emitter.update(dt, self.planets, self.sfx_volume, self.camera, self.gravity_distance, self.air_resistance_intensity, self.walls)
+        self.emitter.update(dt, self.planets, self.sfx_volume, self.camera, self.gravity_distance, self.air_resistance_intensity, self.walls,
+                            self._planet_arrays, self._wall_arrays, self._gravity_grid)
         
         # Update spawners
         for spawner in self.spawners:
-            spawner.update(dt, self.planets, self.sfx_volume, self.camera, self.gravity_distance, self.air_resistance_intensity, self.walls)
-        
-        # Update planets and check for hover
-        mouse_pos = pygame.mouse.get_pos()
-        world_mouse_x, world_mouse_y = self.camera.screen_to_world(mouse_pos[0], mouse_pos[1])
-        self.hovered_planet = None
-        
+            spawner.update(dt, self.planets, self.sfx_volume, self.camera, self.gravity_distance, self.air_resistance_intensity, self.walls,
+                           self._planet_arrays, self._wall_arrays, self._gravity_grid)
+        
+        # Vectorized planet collection across all particle sources
+        if self.planets:
+            caught = np.zeros(len(self.planets), np.int64)
+            for source in self._particle_sources:
+                caught += source.collect(self._planet_arrays, self._planet_grid)
+            for planet, count in zip(self.planets, caught.tolist()):
+                if count:
+                    planet.particles_collected += count
+                    planet.money_generated += count
+        
+        # Check for hover - only when the mouse or the camera view (position, zoom or screen size) changed
+        camera = self.camera
+        hover_key = (self._mouse_screen, camera.x, camera.y, camera.zoom, camera.screen_width, camera.screen_height)
+        if hover_key != self._hover_key:
+            self._hover_key = hover_key
+            world_mouse_x, world_mouse_y = self.camera.screen_to_world(*self._mouse_screen)
+            self.hovered_planet = self._planet_at(world_mouse_x, world_mouse_y)
+        
+        # Update planets (no distance math here, hover was resolved above)
+        hovered_planet = self.hovered_planet
         for planet in self.planets:
-            # Check if mouse is hovering over this planet
-            dx = planet.x - world_mouse_x
-            dy = planet.y - world_mouse_y
-            distance = math.sqrt(dx*dx + dy*dy)
-            is_hovered = distance < planet.radius + 10
-            
-            if is_hovered:
-                self.hovered_planet = planet
-            
-            planet.update(dt, is_hovered)
+            planet.update(dt, planet is hovered_planet)
         
-        # Collect money from particles that were collected
+        # Collect money from the particles caught this frame
         money_earned = 0
-        for particle in self.emitter.particles:
-            if hasattr(particle, '_pending_clones') and particle._pending_clones:
-                for clone_data in particle._pending_clones:
-                    money_earned += clone_data['value']
-                    # Create money popup and light rays
-                    self.money_popups.append(MoneyPopup(clone_data['position'][0], clone_data['position'][1], clone_data['value']))
-                    # Create light rays in multiple directions
-                    for i in range(8):
-                        angle = (i / 8) * 2 * math.pi
-                        self.light_rays.append(LightRay(clone_data['position'][0], clone_data['position'][1], angle))
-                particle._pending_clones.clear()
-        
-        # Check spawner particles too
-        for spawner in self.spawners:
-            for particle in spawner.particles:
-                if hasattr(particle, '_pending_clones') and particle._pending_clones:
-                    for clone_data in particle._pending_clones:
-                        money_earned += clone_data['value']
-                        # Create money popup and light rays
-                        self.money_popups.append(MoneyPopup(clone_data['position'][0], clone_data['position'][1], clone_data['value']))
-                        # Create light rays in multiple directions
-                        for i in range(8):
-                            angle = (i / 8) * 2 * math.pi
-                            self.light_rays.append(LightRay(clone_data['position'][0], clone_data['position'][1], angle))
-                    particle._pending_clones.clear()
+        particle_count = 0
+        for source in self._particle_sources:
+            particle_count += source.store.live
+            queue = source.collection_queue
+            for x, y, value in queue:
+                money_earned += value
+                # Create money popup and light rays
+                self.money_popups.append(MoneyPopup(x, y, value))
+                # Create light rays in multiple directions
+                for angle in _RAY_ANGLES:
+                    self.light_rays.append(LightRay(x, y, angle))
+            queue.clear()
         
         if money_earned > 0:
             self.money += money_earned
+        self._particle_count = particle_count  # Read by draw_ui instead of re-counting
         
-        # Update UI effects
-        self.money_popups = [popup for popup in self.money_popups if popup.update(dt)]
-        self.light_rays = [ray for ray in self.light_rays if ray.update(dt)]
+        # Update UI effects, ping-ponging between two lists instead of building new ones
+        self.money_popups, self._popup_spare = _update_effects(self.money_popups, self._popup_spare, dt)
+        self.light_rays, self._ray_spare = _update_effects(self.light_rays, self._ray_spare, dt)
 
     def toggle_fullscreen(self):
         self.fullscreen = not self.fullscreen
         if self.fullscreen:
-            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.FULLSCREEN)
+            self.screen = pygame.display.set_mode(get_screen_size(), pygame.FULLSCREEN)
         else:
             # Use windowed mode with reasonable size
-            windowed_width = min(1600, SCREEN_WIDTH - 200)
-            windowed_height = min(1000, SCREEN_HEIGHT - 300)
+            desktop_width, desktop_height = get_screen_size()
+            windowed_width = min(1600, desktop_width - 200)
+            windowed_height = min(1000, desktop_height - 300)
             self.screen = pygame.display.set_mode((windowed_width, windowed_height))
-            # Update camera screen dimensions for windowed mode
-            self.camera.screen_width = windowed_width
-            self.camera.screen_height = windowed_height
+        # Refresh the cached display size and keep the camera in sync
+        self.screen_width, self.screen_height = self.screen.get_size()
+        self.camera.screen_width = self.screen_width
+        self.camera.screen_height = self.screen_height
 
     def draw(self):
-        # Clear screen
-        self.screen.fill(BLACK)
-        
-        # Draw starfield
+        # Clear screen and draw starfield (cached while the camera is idle)
         self.starfield.draw(self.screen, self.camera)
         
         # Draw particle emitter
@@ -529,8 +685,8 @@ class Game:
             wall.draw(self.screen, self.camera, self.gravity_distance, self.air_resistance_intensity)
         
         # Draw planets
-        for planet in self.planets:
-            planet.draw(self.screen, self.camera, self.gravity_distance, self.air_resistance_intensity)
+        self._refresh_planet_index()
+        draw_planets(self.screen, self.camera, self.planets, self._planet_arrays)
         
         # Draw UI effects
         for popup in self.money_popups:
@@ -548,20 +704,30 @@ class Game:
         
         pygame.display.flip()
 
+    def render_text(self, font, text, color):
+        """Render text through a small LRU cache so unchanged labels are not re-rasterised every frame"""
+        key = (font, text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            surface = font.render(text, True, color)
+            self._text_cache[key] = surface
+            if len(self._text_cache) > TEXT_CACHE_SIZE:
+                self._text_cache.popitem(last=False)
+        else:
+            self._text_cache.move_to_end(key)
+        return surface
+
     def draw_ui(self):
         # Money display
-        money_text = self.font.render(f"Money: ${self.money:.0f}", True, WHITE)
+        money_text = self.render_text(self.font, f"Money: ${self.money:.0f}", WHITE)
         self.screen.blit(money_text, (10, 10))
         
         # Particle count
-        total_particles = len(self.emitter.particles)
-        for spawner in self.spawners:
-            total_particles += len(spawner.particles)
-        particle_text = self.small_font.render(f"Particles: {total_particles}", True, WHITE)
+        particle_text = self.render_text(self.small_font, f"Particles: {self._particle_count}", WHITE)
         self.screen.blit(particle_text, (10, 50))
         
         # Spawn rate
-        spawn_text = self.small_font.render(f"Spawn Rate: {self.emitter.spawn_rate}/s", True, WHITE)
+        spawn_text = self.render_text(self.small_font, f"Spawn Rate: {self.emitter.spawn_rate}/s", WHITE)
         self.screen.blit(spawn_text, (10, 70))
         
         # Controls
@@ -570,10 +736,11 @@ class Game:
             "Scroll: Zoom",
             "S: Settings",
             "F11: Fullscreen",
+            "F3: Range rings",
             "ESC: Cancel"
         ]
         for i, control in enumerate(controls):
-            control_text = self.small_font.render(control, True, LIGHT_GRAY)
+            control_text = self.render_text(self.small_font, control, LIGHT_GRAY)
             self.screen.blit(control_text, (10, 100 + i * 20))
         
         # Buy buttons
@@ -585,52 +752,53 @@ class Game:
             (f"Upgrade Spawn Rate (${self.spawn_rate_cost})", self.money >= self.spawn_rate_cost, False)
         ]
         
-        for i, (text, affordable, active) in enumerate(buttons):
-            y = 250 + i * 50
+        for button_rect, (text, affordable, active) in zip(self._button_rects, buttons):
             color = GREEN if affordable else RED
             if active:
                 color = YELLOW
             
-            button_rect = pygame.Rect(50, y, 200, 40)
             pygame.draw.rect(self.screen, color, button_rect)
             pygame.draw.rect(self.screen, WHITE, button_rect, 2)
             
-            button_text = self.small_font.render(text, True, BLACK)
+            button_text = self.render_text(self.small_font, text, BLACK)
             text_rect = button_text.get_rect(center=button_rect.center)
             self.screen.blit(button_text, text_rect)
 
+    def _build_settings_chrome(self):
+        """Pre-render the static parts of the settings panel (background, border, fixed labels)"""
+        chrome = pygame.Surface((400, 380))
+        chrome.fill(DARK_GRAY)
+        pygame.draw.rect(chrome, WHITE, chrome.get_rect(), 2)
+        chrome.blit(self.font.render("Settings (ESC to close)", True, WHITE), (20, 20))
+        chrome.blit(self.small_font.render("Music Track:", True, WHITE), (20, 160))
+        return chrome
+
     def draw_settings(self):
-        # Settings background
-        settings_rect = pygame.Rect(200, 100, 400, 380)
-        pygame.draw.rect(self.screen, DARK_GRAY, settings_rect)
-        pygame.draw.rect(self.screen, WHITE, settings_rect, 2)
-        
-        # Settings title
-        title_text = self.font.render("Settings (ESC to close)", True, WHITE)
-        self.screen.blit(title_text, (220, 120))
+        # Settings background and title, rendered once on first open
+        if self._settings_chrome is None:
+            self._settings_chrome = self._build_settings_chrome()
+        self.screen.blit(self._settings_chrome, (200, 100))
         
         # SFX Volume
-        sfx_text = self.small_font.render(f"SFX Volume: {self.sfx_volume:.2f}", True, WHITE)
+        sfx_text = self.render_text(self.small_font, f"SFX Volume: {self.sfx_volume:.2f}", WHITE)
         self.screen.blit(sfx_text, (220, 160))
         self.sfx_slider.draw(self.screen)
         
         # Music Volume
-        music_text = self.small_font.render(f"Music Volume: {self.music_volume:.2f}", True, WHITE)
+        music_text = self.render_text(self.small_font, f"Music Volume: {self.music_volume:.2f}", WHITE)
         self.screen.blit(music_text, (220, 210))
         self.music_slider.draw(self.screen)
         
-        # Music Selection
-        music_label = self.small_font.render("Music Track:", True, WHITE)
-        self.screen.blit(music_label, (220, 260))
+        # Music Selection (label is part of the chrome)
         self.music_selector.draw(self.screen)
         
         # Gravity Distance
-        gravity_text = self.small_font.render(f"Gravity Range: {self.gravity_distance:.0f}", True, WHITE)
+        gravity_text = self.render_text(self.small_font, f"Gravity Range: {self.gravity_distance:.0f}", WHITE)
         self.screen.blit(gravity_text, (220, 360))
         self.gravity_slider.draw(self.screen)
         
         # Air Resistance
-        air_text = self.small_font.render(f"Air Resistance: {self.air_resistance_intensity:.2f}", True, WHITE)
+        air_text = self.render_text(self.small_font, f"Air Resistance: {self.air_resistance_intensity:.2f}", WHITE)
         self.screen.blit(air_text, (220, 410))
         self.air_resistance_slider.draw(self.screen)
 
@@ -640,7 +808,9 @@ class Game:
             dt = self.clock.tick(FPS) / 1000.0  # Delta time in seconds
             
             running = self.handle_events()
-            self.update(dt)
+            # The world is paused while the settings panel is open
+            if not self.show_settings:
+                self.update(dt)
             self.draw()
         
         pygame.quit()
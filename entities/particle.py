@@ -4,16 +4,15 @@ Particle class - handles particle physics, rendering, and behavior
 import pygame
 import random
 import math
-from typing import List, TYPE_CHECKING
-from collections import deque
+from typing import List
+import numpy as np
 
 # Import constants
-from config.constants import PARTICLE_COLORS, WORLD_LIMIT
-
-# Avoid circular imports
-if TYPE_CHECKING:
-    from entities.planet import Planet
-    from entities.wall import Wall
+from config.constants import PARTICLE_COLORS, BOUNCING_PARTICLE_COLORS, PARTICLE_PALETTE, WORLD_LIMIT
+from systems.physics import find_planet_hits
+from systems.physics_kernel import PHYSICS_DTYPE, step_particles
+from systems.physics_gpu import use_gpu, planet_forces_gpu
+from graphics.particles import glow_sprite, body_sprite, disc_sprite
 
 # Try to import gfxdraw for better performance
 try:
@@ -23,150 +22,369 @@ except ImportError:
     HAS_GFXDRAW = False
 
 
+# Spawn defaults shared by Particle() and ParticleStore.spawn()
+PARTICLE_RADIUS = 5  # Bigger particles
+PARTICLE_MASS = 1
+PARTICLE_LIFETIME = 20.0  # seconds
+PARTICLE_SPEED_RANGE = (0.8, 2.2)  # Slower average speed
+GLOW_RADIUS = 12
+
+# Number of recent positions kept for a particle's trail
+TRAIL_LENGTH = 8  # Shorter, cleaner trails
+# Sparks thrown out when a planet catches a particle
+SPARK_COUNT = 8
+
+# Compact a store once this many rows are dead, or once they make up 1/COMPACT_DEAD_FRACTION of it
+COMPACT_MIN_DEAD = 64
+COMPACT_DEAD_FRACTION = 8
+
+
+class ParticleStore:
+    """Structure-of-arrays storage for a group of particles.
+
+    The per-frame state (position, velocity, lifetime flags) lives in parallel
+    NumPy columns so lifetimes, physics and collection run as array operations.
+    Trails are per-row ring buffers and catch explosions per-row spark arrays,
+    so recording and animating them is array work too, and colours are
+    indices into PARTICLE_PALETTE so drawing can batch on them. Particle
+    objects are thin views onto one row; spawning a batch only points
+    recycled or new views at their rows.
+    """
+    FLOAT_FIELDS = ('x', 'y', 'z', 'vx', 'vy', 'radius', 'mass', 'age', 'lifetime', 'fade_timer', 'explosion_timer')
+    BOOL_FIELDS = ('alive', 'exploding', 'fading', 'from_spawner')
+    TRAIL_FIELDS = ('trail_x', 'trail_y')  # (capacity, TRAIL_LENGTH) ring buffers
+    SPARK_FIELDS = ('spark_x', 'spark_y', 'spark_vx', 'spark_vy', 'spark_radius')  # (capacity, SPARK_COUNT)
+    # Next ring slot to write, points recorded so far, PARTICLE_PALETTE index
+    INT_FIELDS = ('trail_head', 'trail_len', 'color_index')
+    FIELDS = FLOAT_FIELDS + BOOL_FIELDS + TRAIL_FIELDS + SPARK_FIELDS + INT_FIELDS
+
+    def __init__(self, capacity: int = 256):
+        self.capacity = capacity
+        self.count = 0  # Rows in use, including dead rows awaiting compaction
+        self.live = 0  # Running count of live particles
+        for name in self.FLOAT_FIELDS:
+            setattr(self, name, np.zeros(capacity, PHYSICS_DTYPE))
+        for name in self.BOOL_FIELDS:
+            setattr(self, name, np.zeros(capacity, np.bool_))
+        for name in self.TRAIL_FIELDS:
+            setattr(self, name, np.zeros((capacity, TRAIL_LENGTH), PHYSICS_DTYPE))
+        for name in self.SPARK_FIELDS:
+            setattr(self, name, np.zeros((capacity, SPARK_COUNT), PHYSICS_DTYPE))
+        for name in self.INT_FIELDS:
+            setattr(self, name, np.zeros(capacity, np.intp))
+        self.particles: List["Particle"] = []  # Row i is viewed by particles[i]
+        self._spare: List["Particle"] = []  # Views of compacted-away rows, reused by spawn()
+        self._trails_stale = False  # Set while trail recording is paused
+
+    def __len__(self):
+        return self.count
+
+    def add(self, particle: "Particle") -> int:
+        """Reserve a row for a new particle and return its index"""
+        if self.count == self.capacity:
+            self._grow()
+        index = self.count
+        self.count += 1
+        self.live += 1
+        self.particles.append(particle)
+        return index
+
+    def spawn(self, xs, ys, zs, from_spawner: bool = False):
+        """Append a batch of new particles at the given positions and depths in one go"""
+        k = len(xs)
+        if k == 0:
+            return
+        start = self.count
+        while start + k > self.capacity:
+            self._grow()
+        rows = slice(start, start + k)
+        # Random initial velocity
+        angle = np.random.uniform(0, 2 * math.pi, k)
+        speed = np.random.uniform(*PARTICLE_SPEED_RANGE, k)
+        self.x[rows] = xs
+        self.y[rows] = ys
+        self.z[rows] = zs
+        self.vx[rows] = np.cos(angle) * speed
+        self.vy[rows] = np.sin(angle) * speed
+        self.radius[rows] = PARTICLE_RADIUS
+        self.mass[rows] = PARTICLE_MASS
+        self.age[rows] = 0.0
+        self.lifetime[rows] = PARTICLE_LIFETIME
+        self.fade_timer[rows] = 0.0
+        self.explosion_timer[rows] = 0.0
+        self.alive[rows] = True
+        self.exploding[rows] = False
+        self.fading[rows] = False
+        self.from_spawner[rows] = from_spawner
+        self.trail_x[rows, 0] = xs  # Trail starts at the spawn point
+        self.trail_y[rows, 0] = ys
+        self.trail_head[rows] = 1
+        self.trail_len[rows] = 1
+        self.color_index[rows] = np.random.randint(len(PARTICLE_COLORS), size=k)
+        self.count += k
+        self.live += k
+
+        # Recycle views of dead particles before allocating new ones
+        spare = self._spare
+        reused = min(k, len(spare))
+        if reused:
+            views = spare[-reused:]
+            del spare[-reused:]
+            self.particles.extend(view._reset(index) for view, index in zip(views, range(start, start + reused)))
+        self.particles.extend(Particle.view(self, index) for index in range(start + reused, start + k))
+
+    def _grow(self):
+        self.capacity *= 2
+        for name in self.FIELDS:
+            old = getattr(self, name)
+            column = np.zeros((self.capacity,) + old.shape[1:], old.dtype)
+            column[:self.count] = old[:self.count]
+            setattr(self, name, column)
+
+    def update(self, dt: float, planet_data, wall_data, gravity_distance: float, air_resistance: float, grid=None,
+               record_trails: bool = True):
+        """Advance lifetimes, explosions and physics for every particle in the store.
+
+        planet_data is the tuple from systems.physics.planet_arrays() and
+        wall_data the tuple from systems.physics_kernel.wall_arrays(); grid is
+        an optional gravity-range PlanetGrid (see step_particles). With
+        record_trails off (trails are not drawn) the ring buffers are left
+        alone and restart from the current position once recording resumes.
+        """
+        n = self.count
+        if n == 0:
+            return
+        alive = self.alive[:n]
+        exploding = self.exploding[:n]
+        fading = self.fading[:n]
+
+        # Exploding particles only animate their sparks and die after a second
+        boom = alive & exploding
+        if boom.any():
+            explosion_timer = self.explosion_timer[:n]
+            explosion_timer[boom] += dt
+            rows = np.flatnonzero(boom)
+            step = dt * 60
+            self.spark_x[rows] += self.spark_vx[rows] * step
+            self.spark_y[rows] += self.spark_vy[rows] * step
+            self.spark_radius[rows] = np.maximum(0.5, self.spark_radius[rows] - dt * 8)
+            ended = boom & (explosion_timer > 1.0)
+            alive[ended] = False
+            self.live -= int(np.count_nonzero(ended))
+
+        # Fading particles keep drifting until the fade completes
+        flying = alive & ~exploding
+        fade_timer = self.fade_timer[:n]
+        fade = flying & fading
+        fade_timer[fade] += dt
+        faded = fade & (fade_timer >= 1.0)
+        alive[faded] = False
+        self.live -= int(np.count_nonzero(faded))
+        flying &= ~faded
+
+        age = self.age[:n]
+        age[flying] += dt
+        expired = flying & ~fading & (age > self.lifetime[:n])
+        fading[expired] = True
+        fade_timer[expired] = 0.0
+
+        # Move the free-flying particles in one kernel call (gravity on the GPU for very large systems)
+        moving = np.flatnonzero(flying)
+        forces = planet_forces_gpu if use_gpu(len(moving), len(planet_data[0])) else None
+        if len(moving) == n:
+            step_particles(self.x[:n], self.y[:n], self.vx[:n], self.vy[:n], self.radius[:n], self.mass[:n],
+                           *planet_data, *wall_data, gravity_distance, air_resistance, dt, grid, forces)
+        elif len(moving):
+            px, py = self.x[moving], self.y[moving]
+            vx, vy = self.vx[moving], self.vy[moving]
+            step_particles(px, py, vx, vy, self.radius[moving], self.mass[moving],
+                           *planet_data, *wall_data, gravity_distance, air_resistance, dt, grid, forces)
+            self.x[moving], self.y[moving] = px, py
+            self.vx[moving], self.vy[moving] = vx, vy
+
+        # Record the new positions in the trail ring buffers
+        if record_trails:
+            if self._trails_stale:
+                self.trail_len[:n] = 0  # Drop points from before the pause
+                self._trails_stale = False
+            head = self.trail_head[moving]
+            self.trail_x[moving, head] = self.x[moving]
+            self.trail_y[moving, head] = self.y[moving]
+            self.trail_head[moving] = (head + 1) % TRAIL_LENGTH
+            self.trail_len[moving] = np.minimum(self.trail_len[moving] + 1, TRAIL_LENGTH)
+        else:
+            self._trails_stale = True
+
+        # Boundary check - despawn if too far out
+        x = self.x[:n]
+        y = self.y[:n]
+        escaped = flying & ((np.abs(x) > WORLD_LIMIT) | (np.abs(y) > WORLD_LIMIT))
+        alive[escaped] = False
+        self.live -= int(np.count_nonzero(escaped))
+
+    def compact(self, force: bool = False):
+        """Drop dead rows, keeping the particle list and views in step with the columns.
+
+        Dead rows are harmless (every pass masks on the alive column), so the
+        sweep is batched until enough of them pile up unless force is set.
+        """
+        n = self.count
+        alive = self.alive[:n]
+        dead = n - np.count_nonzero(alive)
+        if dead == 0 or (not force and dead < COMPACT_MIN_DEAD and dead * COMPACT_DEAD_FRACTION < n):
+            return
+        keep = np.flatnonzero(alive)
+        first_dead = int(np.argmin(alive))
+        particles = self.particles
+        # Views of the dead rows go to the spare list for spawn() to recycle
+        self._spare.extend(particles[row] for row in (np.flatnonzero(~alive[first_dead:]) + first_dead).tolist())
+        for name in self.FIELDS:
+            column = getattr(self, name)
+            column[:len(keep)] = column[keep]
+        # Shift the surviving views down in place so the list keeps its capacity
+        for index, row in enumerate(keep[first_dead:].tolist(), first_dead):
+            particle = particles[row]
+            particle._index = index
+            particles[index] = particle
+        del particles[len(keep):]
+        self.count = len(keep)
+
+    def explode(self, rows):
+        """Start the catch explosion for the given rows, throwing SPARK_COUNT sparks from each"""
+        k = len(rows)
+        if k == 0:
+            return
+        self.exploding[rows] = True
+        self.explosion_timer[rows] = 0.0
+        angle = np.random.uniform(0, 2 * math.pi, (k, SPARK_COUNT))
+        speed = np.random.uniform(50, 120, (k, SPARK_COUNT))
+        self.spark_x[rows] = self.x[rows, None]
+        self.spark_y[rows] = self.y[rows, None]
+        self.spark_vx[rows] = np.cos(angle) * speed
+        self.spark_vy[rows] = np.sin(angle) * speed
+        self.spark_radius[rows] = np.random.uniform(2, 4, (k, SPARK_COUNT))
+
+    def collect(self, queue, planet_data, grid=None):
+        """Catch the particles touching a planet: queue each catch as (x, y, 1) and start its explosion.
+
+        planet_data is the tuple from systems.physics.planet_arrays() and grid
+        an optional PlanetGrid. Returns the number of catches per planet.
+        """
+        n = self.count
+        planet_x, planet_y, planet_r, _ = planet_data
+        hit_idx, planet_idx = find_planet_hits(self.x[:n], self.y[:n], self.radius[:n], self.catchable(),
+                                               planet_x, planet_y, planet_r, grid)
+        # Queue every catch at its position with the base value of 1
+        queue.extend((x, y, 1) for x, y in zip(self.x[hit_idx].tolist(), self.y[hit_idx].tolist()))
+        self.explode(hit_idx)
+        return np.bincount(planet_idx, minlength=len(planet_x))
+
+    def catchable(self):
+        """Mask of the particles that can still be caught by a planet"""
+        n = self.count
+        return self.alive[:n] & ~self.exploding[:n] & ~self.fading[:n]
+
+
+def _column(name: str, doc: str):
+    """Property reading and writing one ParticleStore column at the particle's row"""
+    def getter(self):
+        return getattr(self._store, name).item(self._index)
+
+    def setter(self, value):
+        getattr(self._store, name)[self._index] = value
+
+    return property(getter, setter, doc=doc)
+
+
 class Particle:
-    def __init__(self, x: float, y: float, z: float = None, bouncing: bool = False, from_spawner: bool = False):
+    x = _column('x', "World x position")
+    y = _column('y', "World y position")
+    vx = _column('vx', "Horizontal velocity")
+    vy = _column('vy', "Vertical velocity")
+    radius = _column('radius', "Collision radius")
+    mass = _column('mass', "Mass used for gravity")
+    age = _column('age', "Seconds since spawn")
+    lifetime = _column('lifetime', "Seconds before the particle starts fading")
+    fade_timer = _column('fade_timer', "Progress of the fade-out (0-1)")
+    explosion_timer = _column('explosion_timer', "Seconds since the particle was caught")
+    z = _column('z', "Depth for parallax")
+    alive = _column('alive', "False once the particle should be removed")
+    exploding = _column('exploding', "True while the catch explosion plays")
+    fading = _column('fading', "True while the particle fades out")
+    from_spawner = _column('from_spawner', "True if spawned from a user-placed spawner (no fade-in)")
+
+    @property
+    def trail(self):
+        """Recent (x, y, z) positions, oldest first"""
+        store = self._store
+        index = self._index
+        head = store.trail_head.item(index)
+        slots = np.arange(head - store.trail_len.item(index), head) % TRAIL_LENGTH
+        z = store.z.item(index)
+        return [(x, y, z) for x, y in zip(store.trail_x[index, slots].tolist(), store.trail_y[index, slots].tolist())]
+
+    @property
+    def color(self):
+        """RGB colour, stored as a PARTICLE_PALETTE index"""
+        return PARTICLE_PALETTE[self._store.color_index.item(self._index)]
+
+    @color.setter
+    def color(self, value):
+        self._store.color_index[self._index] = PARTICLE_PALETTE.index(tuple(value))
+
+    @classmethod
+    def view(cls, store: ParticleStore, index: int):
+        """Wrap a row that ParticleStore.spawn() has already filled in"""
+        particle = cls.__new__(cls)
+        particle._store = store
+        particle.bouncing = False
+        particle.glow_radius = GLOW_RADIUS
+        return particle._reset(index)
+
+    def _reset(self, index: int):
+        """Point this view (new or recycled from a dead row) at a freshly spawned row"""
+        self._index = index
+        return self
+
+    def __init__(self, x: float, y: float, z: float = None, bouncing: bool = False, from_spawner: bool = False,
+                 store: ParticleStore = None):
+        # Standalone particles get a private single-row store
+        self._store = store if store is not None else ParticleStore(1)
+        self._index = self._store.add(self)
         self.x = x
         self.y = y
         self.z = z if z is not None else random.uniform(0.3, 1.0)  # Depth for parallax
         # Random initial velocity
         angle = random.uniform(0, 2 * math.pi)
-        speed = random.uniform(0.8, 2.2)  # Slower average speed
+        speed = random.uniform(*PARTICLE_SPEED_RANGE)
         self.vx = math.cos(angle) * speed
         self.vy = math.sin(angle) * speed
-        self.radius = 5  # Bigger particles
-        self.mass = 1
+        self.radius = PARTICLE_RADIUS
+        self.mass = PARTICLE_MASS
         self.alive = True
         self.bouncing = bouncing
         self.from_spawner = from_spawner  # Track if spawned from user-placed spawner
         
         # Visual properties
         if bouncing:
-            self.color = random.choice([(255, 150, 255), (255, 255, 150), (150, 255, 255)])
+            self.color = random.choice(BOUNCING_PARTICLE_COLORS)
         else:
             self.color = random.choice(PARTICLE_COLORS)
-        self.trail = deque(maxlen=8)  # Shorter, cleaner trails
-        self.trail.append((x, y, self.z))
+        self._store.trail_x[self._index, 0] = x  # Trail starts at the spawn point
+        self._store.trail_y[self._index, 0] = y
+        self._store.trail_head[self._index] = 1
+        self._store.trail_len[self._index] = 1
         
         # Enhanced glow effect
-        self.glow_radius = 12
+        self.glow_radius = GLOW_RADIUS
         
         # Lifetime
-        self.lifetime = 20.0  # seconds
+        self.lifetime = PARTICLE_LIFETIME
         self.age = 0.0
         self.exploding = False
         self.explosion_timer = 0.0
-        self.explosion_particles = []  # For animated explosion
         self.fading = False
         self.fade_timer = 0.0
-        
-        # Pending clones for collection tracking
-        self._pending_clones = []
-
-    def update(self, dt: float, planets: List['Planet'], gravity_distance: float = 500.0, 
-               air_resistance_intensity: float = 0.5, camera=None, sfx_volume: float = 0.5, 
-               walls: List['Wall'] = None):
-        """Update particle physics and behavior"""
-        if not self.alive:
-            return
-
-        # Handle explosion state
-        if self.exploding:
-            self.explosion_timer += dt
-            for p in self.explosion_particles:
-                p['x'] += p['vx'] * dt * 60
-                p['y'] += p['vy'] * dt * 60
-                p['alpha'] -= dt * 300
-                p['radius'] = max(0.5, p['radius'] - dt * 8)
-                if p['alpha'] <= 0:
-                    p['alpha'] = 0
-            
-            if self.explosion_timer > 1.0:
-                self.alive = False
-            return
-
-        # Handle fading state
-        if self.fading:
-            self.fade_timer += dt
-            if self.fade_timer >= 1.0:
-                self.alive = False
-                return
-
-        # Age the particle
-        self.age += dt
-        if self.age > self.lifetime:
-            self._start_fading()
-            return
-
-        # Apply gravity from planets
-        total_fx = 0
-        total_fy = 0
-        
-        for planet in planets:
-            dx = planet.x - self.x
-            dy = planet.y - self.y
-            distance = math.sqrt(dx*dx + dy*dy)
-            
-            # Only apply gravity within the specified distance
-            if distance < gravity_distance and distance > planet.radius + self.radius:
-                # Gravity force calculation
-                force = (planet.mass * self.mass) / (distance * distance) * 0.1
-                
-                # Normalize direction
-                if distance > 0:
-                    fx = (dx / distance) * force
-                    fy = (dy / distance) * force
-                    total_fx += fx
-                    total_fy += fy
-
-        # Apply forces to velocity
-        self.vx += total_fx * dt
-        self.vy += total_fy * dt
-
-        # Apply air resistance in planet atmosphere zones
-        for planet in planets:
-            dx = planet.x - self.x
-            dy = planet.y - self.y
-            distance = math.sqrt(dx*dx + dy*dy)
-            
-            # Air resistance within 3x planet radius
-            if distance < planet.radius * 3:
-                air_factor = 1.0 - (distance / (planet.radius * 3))
-                resistance = air_resistance_intensity * air_factor
-                self.vx *= (1.0 - resistance * dt)
-                self.vy *= (1.0 - resistance * dt)
-
-        # Update position
-        self.x += self.vx * dt * 60
-        self.y += self.vy * dt * 60
-
-        # Add to trail
-        self.trail.append((self.x, self.y, self.z))
-
-        # Wall collisions
-        if walls:
-            for wall in walls:
-                if wall.check_collision(self.x, self.y, self.radius):
-                    # Simple bounce
-                    self.vx *= -0.8
-                    self.vy *= -0.8
-                    # Move particle out of wall
-                    self.x += self.vx * dt * 10
-                    self.y += self.vy * dt * 10
-
-        # Check for planet collection
-        for planet in planets:
-            dx = planet.x - self.x
-            dy = planet.y - self.y
-            distance = math.sqrt(dx*dx + dy*dy)
-            
-            if distance < planet.radius + self.radius:
-                self._clone_particle(planet)
-                self._start_explosion(sfx_volume)
-                return
-
-        # Boundary check - despawn if too far out
-        if (abs(self.x) > WORLD_LIMIT or abs(self.y) > WORLD_LIMIT):
-            self.alive = False
 
     def _start_fading(self):
         """Start the fading animation"""
@@ -175,31 +393,7 @@ class Particle:
 
     def _start_explosion(self, sfx_volume: float = 0.5):
         """Start explosion animation when collected"""
-        self.exploding = True
-        self.explosion_timer = 0.0
-        
-        # Create explosion particles
-        for _ in range(8):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(50, 120)
-            self.explosion_particles.append({
-                'x': self.x,
-                'y': self.y,
-                'vx': math.cos(angle) * speed,
-                'vy': math.sin(angle) * speed,
-                'color': self.color,
-                'alpha': 255,
-                'radius': random.uniform(2, 4)
-            })
-
-    def _clone_particle(self, planet):
-        """Create a clone for money generation tracking"""
-        clone_data = {
-            'planet': planet,
-            'value': 1,  # Base value
-            'position': (self.x, self.y)
-        }
-        self._pending_clones.append(clone_data)
+        self._store.explode([self._index])
 
     def get_alpha(self, camera=None):
         """Get particle alpha based on state and camera"""
@@ -209,13 +403,85 @@ class Particle:
         
         # Fading particles
         if self.fading:
-            return int(255 * (self.fade_timer / 1.0))
+            return int(255 * (1.0 - self.fade_timer / 1.0))
         
         # Fade in for first 0.3s
         if self.age < 0.3:
             return max(50, int(255 * (self.age / 0.3)))
         return 255
 
+    def scaled_radius(self, zoom):
+        """On-screen radius - ensure particles are visible when zoomed out"""
+        raw_scaled_radius = self.radius * zoom
+        if raw_scaled_radius < 0.5:
+            return 3  # Minimum 3 pixels when extremely zoomed out
+        elif raw_scaled_radius < 1.5:
+            return 3  # Still 3 pixels for small sizes
+        return max(2, int(raw_scaled_radius))
+
+    def aura_sprites(self, zoom, scaled_radius, alpha):
+        """(sprite, radius) for each aura layer drawn around the particle"""
+        layers = []
+        # Enhanced multi-layer aura effect with distance falloff
+        if zoom > 0.3 and scaled_radius > 2:
+            for layer in range(2):
+                aura_size = int(self.glow_radius * zoom * (1.5 - layer * 0.3))
+                if aura_size > scaled_radius + 2:
+                    aura_alpha = max(5, int(alpha * (0.15 - layer * 0.08)))
+                    layers.append((glow_sprite(self.color, aura_size, max(8, int(aura_alpha))), aura_size))
+        return layers
+
+    def trail_sprites(self, camera, scaled_radius, alpha, screen_points=None):
+        """(sprite, position) blits for the trail - FULL QUALITY, with fade effects
+
+        screen_points is the trail already projected to screen coordinates
+        (oldest first); batched renderers pass it in to skip the projection.
+        """
+        if screen_points is None:
+            screen_points = [camera.world_to_screen(tx, ty) for tx, ty, _ in self.trail] if camera.zoom > 0.4 else ()
+        trail_points = screen_points  # Use all trail points for full quality
+        if len(trail_points) <= 2:  # Show trails at all zoom levels
+            return []
+        # Fade-in effect for newly spawned particles (except from spawners)
+        fade_in_factor = self.age / 0.5 if not self.from_spawner and self.age < 0.5 else None  # Over 0.5 seconds
+        # Fade-out effect when particle is dying
+        fade_out_factor = 1.0 - (self.fade_timer / 1.0) if self.fading else None
+        color = self.color
+        glow = camera.zoom > 1.0
+        min_x, max_x = -20, camera.screen_width + 20
+        min_y, max_y = -20, camera.screen_height + 20
+        sprites = []
+        for i in range(len(trail_points) - 1):
+            trail_screen_x, trail_screen_y = trail_points[i]
+            
+            # Check if trail point is on screen
+            if min_x <= trail_screen_x <= max_x and min_y <= trail_screen_y <= max_y:
+                # Enhanced fade effects based on particle state
+                base_trail_alpha = alpha * (i + 1) / len(trail_points) * 0.8  # Stronger trails
+                if fade_in_factor is not None:
+                    base_trail_alpha *= fade_in_factor
+                if fade_out_factor is not None:
+                    base_trail_alpha *= fade_out_factor
+                
+                trail_alpha = int(base_trail_alpha)
+                if trail_alpha > 8:
+                    trail_size = max(1, int(scaled_radius * 0.8 * (i + 1) / len(trail_points)))
+                    
+                    # Add glow to trail points for extra visual appeal
+                    if trail_size > 1 and glow:
+                        glow_size = trail_size + 2
+                        glow_alpha = max(3, trail_alpha // 3)
+                        sprites.append((glow_sprite(color, glow_size, glow_alpha),
+                                        (trail_screen_x - glow_size, trail_screen_y - glow_size)))
+                    
+                    sprites.append((disc_sprite(color, trail_size),
+                                    (trail_screen_x - trail_size, trail_screen_y - trail_size)))
+        return sprites
+
+    def draw_trail(self, screen, camera, scaled_radius, alpha, screen_points=None):
+        """Enhanced trail rendering with fade effects - FULL QUALITY"""
+        screen.blits(self.trail_sprites(camera, scaled_radius, alpha, screen_points), doreturn=False)
+
     def draw(self, screen, camera, planets=None):
         """Render the particle"""
         if not self.alive:
@@ -228,92 +494,26 @@ class Particle:
             screen_y < -margin or screen_y > camera.screen_height + margin):
             return
         
-        # Better scaling - ensure particles are visible when zoomed out
-        raw_scaled_radius = self.radius * camera.zoom
-        if raw_scaled_radius < 0.5:
-            scaled_radius = 3  # Minimum 3 pixels when extremely zoomed out
-        elif raw_scaled_radius < 1.5:
-            scaled_radius = 3  # Still 3 pixels for small sizes
-        else:
-            scaled_radius = max(2, int(raw_scaled_radius))
-        
+        scaled_radius = self.scaled_radius(camera.zoom)
         alpha = self.get_alpha(camera)
         if alpha == 0:  # Skip drawing completely if invisible
             return
         
         # Explosion effect - simplified for performance
         if self.exploding:
-            for p in self.explosion_particles:
-                px, py = camera.world_to_screen(p['x'], p['y'])
+            store = self._store
+            index = self._index
+            for x, y, radius in zip(store.spark_x[index].tolist(), store.spark_y[index].tolist(),
+                                    store.spark_radius[index].tolist()):
+                px, py = camera.world_to_screen(x, y)
                 if 0 <= px < camera.screen_width and 0 <= py < camera.screen_height:
-                    color = (*p['color'][:3], min(255, int(p['alpha'])))
-                    pygame.draw.circle(screen, color[:3], (int(px), int(py)), max(1, p['radius']))
+                    pygame.draw.circle(screen, self.color, (px, py), max(1, radius))
             return
         
-        # Enhanced multi-layer aura effect with distance falloff
-        if camera.zoom > 0.3 and scaled_radius > 2:
-            for layer in range(2):
-                aura_size = int(self.glow_radius * camera.zoom * (1.5 - layer * 0.3))
-                if aura_size > scaled_radius + 2:
-                    aura_alpha = max(5, int(alpha * (0.15 - layer * 0.08)))
-                    glow_surf = pygame.Surface((aura_size * 2, aura_size * 2), pygame.SRCALPHA)
-                    glow_color = (*self.color, max(8, int(aura_alpha)))
-                    pygame.draw.circle(glow_surf, glow_color, (aura_size, aura_size), aura_size)
-                    screen.blit(glow_surf, (int(screen_x - aura_size), int(screen_y - aura_size)))
-        
-        # Enhanced trail rendering with fade effects - FULL QUALITY
-        if len(self.trail) > 2 and camera.zoom > 0.4:  # Show trails at all zoom levels
-            trail_points = list(self.trail)  # Use all trail points for full quality
-            
-            for i in range(len(trail_points) - 1):
-                tx, ty, tz = trail_points[i]
-                trail_screen_x, trail_screen_y = camera.world_to_screen(tx, ty)
-                
-                # Check if trail point is on screen
-                if (-20 <= trail_screen_x <= camera.screen_width + 20 and 
-                    -20 <= trail_screen_y <= camera.screen_height + 20):
-                    
-                    # Enhanced fade effects based on particle state
-                    base_trail_alpha = alpha * (i + 1) / len(trail_points) * 0.8  # Stronger trails
-                    
-                    # Fade-in effect for newly spawned particles (except from spawners)
-                    if not self.from_spawner and self.age < 0.5:
-                        fade_in_factor = self.age / 0.5  # Fade in over 0.5 seconds
-                        base_trail_alpha *= fade_in_factor
-                    
-                    # Fade-out effect when particle is dying
-                    if self.fading:
-                        fade_out_factor = 1.0 - (self.fade_timer / 1.0)
-                        base_trail_alpha *= fade_out_factor
-                    
-                    trail_alpha = int(base_trail_alpha)
-                    if trail_alpha > 8:
-                        trail_size = max(1, int(scaled_radius * 0.8 * (i + 1) / len(trail_points)))
-                        trail_color = (*self.color, trail_alpha)
-                        
-                        # Add glow to trail points for extra visual appeal
-                        if trail_size > 1 and camera.zoom > 1.0:
-                            glow_size = trail_size + 2
-                            glow_alpha = max(3, trail_alpha // 3)
-                            glow_surf = pygame.Surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA)
-                            pygame.draw.circle(glow_surf, (*self.color, glow_alpha), (glow_size, glow_size), glow_size)
-                            screen.blit(glow_surf, (int(trail_screen_x - glow_size), int(trail_screen_y - glow_size)))
-                        
-                        pygame.draw.circle(screen, trail_color[:3], (int(trail_screen_x), int(trail_screen_y)), trail_size)
+        for sprite, aura_size in self.aura_sprites(camera.zoom, scaled_radius, alpha):
+            screen.blit(sprite, (screen_x - aura_size, screen_y - aura_size))
         
-        # Draw main particle with enhanced appearance
-        main_color = (*self.color, alpha)
-        pygame.draw.circle(screen, main_color[:3], (int(screen_x), int(screen_y)), scaled_radius)
+        self.draw_trail(screen, camera, scaled_radius, alpha)
         
-        # Add bright center with gradient effect
-        if scaled_radius > 1:
-            # Bright inner core
-            center_color = tuple(min(255, c + 80) for c in self.color)
-            center_radius = max(1, int(scaled_radius * 0.6))
-            pygame.draw.circle(screen, center_color, (int(screen_x), int(screen_y)), center_radius)
-            
-            # Very bright center point
-            if scaled_radius > 2:
-                core_color = tuple(min(255, c + 120) for c in self.color)
-                core_radius = max(1, int(scaled_radius * 0.3))
-                pygame.draw.circle(screen, core_color, (int(screen_x), int(screen_y)), core_radius)
+        # Draw main particle with its bright centre and core
+        screen.blit(body_sprite(self.color, scaled_radius), (screen_x - scaled_radius, screen_y - scaled_radius))
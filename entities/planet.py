@@ -4,7 +4,9 @@ Planet and DwarfPlanet classes - handles planet physics, rendering, and behavior
 import pygame
 import random
 import math
+from collections import OrderedDict
 from typing import TYPE_CHECKING
+import numpy as np
 
 # Import constants
 from config.constants import PLANET_TYPES
@@ -20,6 +22,89 @@ except ImportError:
 if TYPE_CHECKING:
     pass
 
+# Extra pixels around a planet that still count as hovering/clicking it
+HOVER_TOLERANCE = 10
+# Pre-rendered sprites kept per planet (one per on-screen radius, least recently used dropped first)
+PLANET_SPRITE_CACHE_SIZE = 16
+
+
+def _cached_sprite(cache, scaled_radius, render):
+    """Fetch a planet's sprite for an on-screen radius from its LRU cache, rendering it on a miss"""
+    sprite = cache.get(scaled_radius)
+    if sprite is None:
+        sprite = render(scaled_radius)
+        cache[scaled_radius] = sprite
+        if len(cache) > PLANET_SPRITE_CACHE_SIZE:
+            cache.popitem(last=False)
+    else:
+        cache.move_to_end(scaled_radius)
+    return sprite
+
+
+_scratch = [None]  # Shared SRCALPHA surface for the gfxdraw-less fallback; grows to the largest size asked for
+
+
+def _scratch_surface(size):
+    """Reusable SRCALPHA surface of at least size x size - callers clear the area they use"""
+    surface = _scratch[0]
+    if surface is None or surface.get_width() < size:
+        surface = pygame.Surface((size, size), pygame.SRCALPHA)
+        _scratch[0] = surface
+    return surface
+
+
+def _draw_alpha_circle(screen, x, y, radius, color, width=0):
+    """Translucent circle (filled when width is 0) blended onto the screen without allocating a surface"""
+    if HAS_GFXDRAW:
+        if width == 0:
+            pygame.gfxdraw.filled_circle(screen, x, y, radius, color)
+        else:
+            for ring_radius in range(radius, max(0, radius - width), -1):
+                pygame.gfxdraw.circle(screen, x, y, ring_radius, color)
+        return
+    # Fallback: draw into the scratch surface and blit only the area used
+    size = radius * 2 + 4
+    area = pygame.Rect(0, 0, size, size)
+    scratch = _scratch_surface(size)
+    scratch.fill((0, 0, 0, 0), area)
+    pygame.draw.circle(scratch, color, (radius + 2, radius + 2), radius, width)
+    screen.blit(scratch, (x - radius - 2, y - radius - 2), area)
+
+
+# Atmosphere: concentric translucent discs, outermost first, each a quarter of the radius smaller
+ATMOSPHERE_COLOR = (100, 150, 255)
+ATMOSPHERE_ALPHAS = (15, 10, 5)
+_atmosphere_cache = OrderedDict()  # air radius -> Surface, shared by all planets
+
+
+def _render_atmosphere(air_radius):
+    """Pre-composite the atmosphere discs into one SRCALPHA sprite (blit at centre - air_radius)"""
+    size = air_radius * 2 + 1
+    # Count the discs covering each pixel, rasterised the same way _draw_alpha_circle would
+    layers = np.zeros((size, size), np.intp)
+    disc = pygame.Surface((size, size), pygame.SRCALPHA)
+    for i in range(len(ATMOSPHERE_ALPHAS)):
+        disc_radius = air_radius - (i * air_radius // 4)
+        if disc_radius <= 2:
+            continue
+        disc.fill((0, 0, 0, 0))
+        if HAS_GFXDRAW:
+            pygame.gfxdraw.filled_circle(disc, air_radius, air_radius, disc_radius, (255, 255, 255, 255))
+        else:
+            pygame.draw.circle(disc, (255, 255, 255, 255), (air_radius, air_radius), disc_radius)
+        layers += pygame.surfarray.array_alpha(disc) > 0
+    # Alpha of k discs blended over each other, indexed by k
+    transmitted = np.cumprod([1.0] + [1.0 - alpha / 255 for alpha in ATMOSPHERE_ALPHAS])
+    alpha_of_layers = np.round(255 * (1.0 - transmitted)).astype(np.uint8)
+    sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+    sprite.fill((*ATMOSPHERE_COLOR, 0))
+    alpha = pygame.surfarray.pixels_alpha(sprite)
+    try:
+        alpha[...] = alpha_of_layers[layers]
+    finally:
+        del alpha
+    return sprite
+
 
 class DwarfPlanet:
     """A smaller, cheaper version of Planet with reduced capabilities"""
@@ -27,12 +112,18 @@ class DwarfPlanet:
         self.x = x
         self.y = y
         self.radius = radius
+        self._hit_radius_sq = (radius + HOVER_TOLERANCE) ** 2  # Recompute if radius changes
         self.mass = radius * 0.8  # Lighter than regular planets
         self.gravity_distance = 300  # Shorter gravity reach
         
         # Visual properties - simpler than regular planets
         self.planet_type = random.choice(PLANET_TYPES)
-        self.color = self.planet_type["color"]
+        self.color = self.planet_type.color
+        self.spot_color = tuple(max(0, c - 30) for c in self.color)
+        self.outline_color = tuple(max(0, c - 50) for c in self.color)
+        # Fewer spots than regular planets, placed once so they hold still
+        self.spots = [(random.uniform(0, 2 * math.pi), random.uniform(0.2, 0.6)) for _ in range(2)]
+        self._sprite_cache = OrderedDict()  # scaled radius -> Surface; clear if radius or colour change
         
         # Hover effect
         self.wobble_timer = 0
@@ -53,40 +144,52 @@ class DwarfPlanet:
 
     def draw(self, screen, camera, gravity_distance: float = None, air_resistance_intensity: float = None):
         """Draw the dwarf planet (simplified)"""
+        body = self.draw_backdrop(screen, camera)
+        if body is not None:
+            screen.blit(*body)
+
+    def draw_backdrop(self, screen, camera):
+        """Dwarf planets have no atmosphere or range rings; returns the (sprite, position) body blit, or None"""
         # Convert world position to screen position with wobble
-        wobble_x = math.sin(self.wobble_timer) * 1.5 if self.wobble_timer > 0 else 0
-        wobble_y = math.cos(self.wobble_timer * 1.2) * 1.5 if self.wobble_timer > 0 else 0
         screen_x, screen_y = camera.world_to_screen(self.x, self.y)
-        screen_x += wobble_x
-        screen_y += wobble_y
+        hovered = self.wobble_timer > 0
+        if hovered:
+            screen_x += math.sin(self.wobble_timer) * 1.5
+            screen_y += math.cos(self.wobble_timer * 1.2) * 1.5
         
         # Scale with zoom and hover effect
-        hover_scale = 1.1 if self.wobble_timer > 0 else 1.0
+        hover_scale = 1.1 if hovered else 1.0
         scaled_radius = max(2, int(self.radius * camera.zoom * hover_scale))
         
         # Only draw if visible
         margin = scaled_radius + 20
         if (screen_x < -margin or screen_x > camera.screen_width + margin or 
             screen_y < -margin or screen_y > camera.screen_height + margin):
-            return
+            return None
         
-        # Draw simple planet (no atmosphere for dwarf planets)
-        pygame.draw.circle(screen, self.color, (int(screen_x), int(screen_y)), scaled_radius)
+        # Simple planet body (no atmosphere for dwarf planets) from its cached sprite
+        sprite = _cached_sprite(self._sprite_cache, scaled_radius, self._render_sprite)
+        half = sprite.get_width() // 2
+        return sprite, (int(screen_x) - half, int(screen_y) - half)
+
+    def _render_sprite(self, scaled_radius):
+        """Body, spots and outline at one on-screen radius, centred on a transparent Surface"""
+        half = scaled_radius + 2
+        sprite = pygame.Surface((half * 2 + 1, half * 2 + 1), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, self.color, (half, half), scaled_radius)
         
         # Add simple spots if the type has them
-        if self.planet_type["spots"] and scaled_radius > 4:
-            spot_color = tuple(max(0, c - 30) for c in self.color)
-            for _ in range(2):  # Fewer spots than regular planets
-                spot_angle = random.uniform(0, 2 * math.pi)
-                spot_distance = random.uniform(0.2, 0.6) * scaled_radius
-                spot_x = int(screen_x + math.cos(spot_angle) * spot_distance)
-                spot_y = int(screen_y + math.sin(spot_angle) * spot_distance)
-                spot_radius = max(1, scaled_radius // 6)
-                pygame.draw.circle(screen, spot_color, (spot_x, spot_y), spot_radius)
+        if self.planet_type.spots and scaled_radius > 4:
+            spot_radius = max(1, scaled_radius // 6)
+            for spot_angle, distance in self.spots:
+                spot_distance = distance * scaled_radius
+                spot_x = int(half + math.cos(spot_angle) * spot_distance)
+                spot_y = int(half + math.sin(spot_angle) * spot_distance)
+                pygame.draw.circle(sprite, self.spot_color, (spot_x, spot_y), spot_radius)
         
         # Simple outline
-        outline_color = tuple(max(0, c - 50) for c in self.color)
-        pygame.draw.circle(screen, outline_color, (int(screen_x), int(screen_y)), scaled_radius, 2)
+        pygame.draw.circle(sprite, self.outline_color, (half, half), scaled_radius, 2)
+        return sprite
 
     def draw_preview(self, screen, x, y, size=16):
         """Draw a small preview of the dwarf planet for the UI"""
@@ -94,8 +197,7 @@ class DwarfPlanet:
         pygame.draw.circle(screen, self.color, (x, y), size)
         
         # Simple outline
-        outline_color = tuple(max(0, c - 50) for c in self.color)
-        pygame.draw.circle(screen, outline_color, (x, y), size, 1)
+        pygame.draw.circle(screen, self.outline_color, (x, y), size, 1)
 
 
 class Planet:
@@ -103,14 +205,17 @@ class Planet:
         self.x = x
         self.y = y
         self.radius = radius
+        self._hit_radius_sq = (radius + HOVER_TOLERANCE) ** 2  # Recompute if radius changes
         self.mass = radius * 2.0  # Mass affects gravity
         self.gravity_distance = 500  # How far gravity reaches
         
         # Visual properties
         self.planet_type = random.choice(PLANET_TYPES)
-        self.color = self.planet_type["color"]
-        self.has_rings = self.planet_type["rings"]
-        self.has_spots = self.planet_type["spots"]
+        self.color = self.planet_type.color
+        self.has_rings = self.planet_type.rings
+        self.has_spots = self.planet_type.spots
+        self.spot_color = tuple(max(0, c - 30) for c in self.color)
+        self.outline_color = tuple(max(0, c - 50) for c in self.color)
         
         # Generate consistent spots for this planet
         self.spots = []
@@ -135,9 +240,8 @@ class Planet:
         self.particles_collected = 0
         self.money_generated = 0.0
         
-        # Performance optimization
-        self._cached_spots = None
-        self._cached_radius = None
+        # Pre-rendered rings, body, spots and outline
+        self._sprite_cache = OrderedDict()  # scaled radius -> Surface; clear if radius, colour or spots change
 
     def update(self, dt, is_hovered=False):
         """Update planet state"""
@@ -151,15 +255,22 @@ class Planet:
 
     def draw(self, screen, camera, gravity_distance: float = None, air_resistance_intensity: float = None):
         """Render the planet with optimized performance"""
+        body = self.draw_backdrop(screen, camera)
+        if body is not None:
+            screen.blit(*body)
+
+    def draw_backdrop(self, screen, camera):
+        """Draw the atmosphere and range rings; returns the (sprite, position) body blit, or None when off screen"""
+        zoom = camera.zoom
         # Convert world position to screen position with wobble effect
-        wobble_x = math.sin(self.wobble_timer) * 2 if self.wobble_timer > 0 else 0
-        wobble_y = math.cos(self.wobble_timer * 1.3) * 2 if self.wobble_timer > 0 else 0
         screen_x, screen_y = camera.world_to_screen(self.x, self.y)
-        screen_x += wobble_x
-        screen_y += wobble_y
+        hovered = self.wobble_timer > 0
+        if hovered:
+            screen_x += math.sin(self.wobble_timer) * 2
+            screen_y += math.cos(self.wobble_timer * 1.3) * 2
         
         # Scale radius with zoom and hover effect
-        hover_scale = 1.15 if self.wobble_timer > 0 else 1.0
+        hover_scale = 1.15 if hovered else 1.0
         
         if camera.is_map_mode():
             # In map mode, planets are 0.5x size
@@ -168,87 +279,82 @@ class Planet:
             air_radius = max(6, int(self.radius * 3 * map_mode_scale * hover_scale))
         else:
             # Normal mode - scale with camera zoom
-            scaled_radius = max(2, int(self.radius * camera.zoom * hover_scale))
-            air_radius = max(4, int(self.radius * 3 * camera.zoom * hover_scale))
+            scaled_radius = max(2, int(self.radius * zoom * hover_scale))
+            air_radius = max(4, int(self.radius * 3 * zoom * hover_scale))
         
         # Only draw if planet is visible on screen
         margin = air_radius + 50
         if (screen_x < -margin or screen_x > camera.screen_width + margin or 
             screen_y < -margin or screen_y > camera.screen_height + margin):
-            return
+            return None
+        center_x, center_y = int(screen_x), int(screen_y)
         
         # Draw atmospheric area - OPTIMIZED FOR PERFORMANCE
-        if camera.zoom > 0.4 and camera.zoom < 3.0 and air_radius > 4 and air_radius < 200:
-            # Use direct drawing instead of creating surfaces for better performance
-            for i in range(3):
-                atmo_radius = air_radius - (i * air_radius // 4)
-                if atmo_radius > 2:
-                    alpha = max(5, 15 - (i * 5))  # Decreasing alpha: 15, 10, 5
-                    # Use pygame.gfxdraw for better alpha blending performance
-                    if HAS_GFXDRAW:
-                        pygame.gfxdraw.filled_circle(screen, int(screen_x), int(screen_y), atmo_radius, (100, 150, 255, alpha))
-                    else:
-                        # Fallback to regular circle if gfxdraw not available
-                        atmo_surf = pygame.Surface((atmo_radius * 2, atmo_radius * 2), pygame.SRCALPHA)
-                        pygame.draw.circle(atmo_surf, (100, 150, 255, alpha), (atmo_radius, atmo_radius), atmo_radius)
-                        screen.blit(atmo_surf, (screen_x - atmo_radius, screen_y - atmo_radius))
+        if zoom > 0.4 and zoom < 3.0 and air_radius > 4 and air_radius < 200:
+            # One blit of the discs pre-composited into a sprite shared by every planet of this size
+            sprite = _cached_sprite(_atmosphere_cache, air_radius, _render_atmosphere)
+            screen.blit(sprite, (center_x - air_radius, center_y - air_radius))
 
         # Debug rings for gravity and air resistance ranges - disable when heavily zoomed in
-        if camera.zoom > 0.15 and camera.zoom < 4.0:
+        if camera.show_debug and 0.15 < zoom < 4.0:
             # Gravity max distance ring
-            grav_r = max(1, int(self.gravity_distance * camera.zoom))
+            grav_r = max(1, int(self.gravity_distance * zoom))
             if grav_r > 3:  # Only draw if large enough to be visible
-                grav_surf = pygame.Surface((grav_r * 2 + 4, grav_r * 2 + 4), pygame.SRCALPHA)
-                pygame.draw.circle(grav_surf, (0, 255, 0, 80), (grav_r + 2, grav_r + 2), grav_r, 2)
-                screen.blit(grav_surf, (screen_x - grav_r - 2, screen_y - grav_r - 2))
+                _draw_alpha_circle(screen, center_x, center_y, grav_r, (0, 255, 0, 80), 2)
                 
                 # Gravity fade zone outer ring (+200)
-                outer_r = max(grav_r + int(200 * camera.zoom), grav_r + 1)
+                outer_r = max(grav_r + int(200 * zoom), grav_r + 1)
                 if outer_r > grav_r + 2:  # Only draw if significantly larger
-                    outer_surf = pygame.Surface((outer_r * 2 + 4, outer_r * 2 + 4), pygame.SRCALPHA)
-                    pygame.draw.circle(outer_surf, (0, 255, 0, 40), (outer_r + 2, outer_r + 2), outer_r, 1)
-                    screen.blit(outer_surf, (screen_x - outer_r - 2, screen_y - outer_r - 2))
+                    _draw_alpha_circle(screen, center_x, center_y, outer_r, (0, 255, 0, 40), 1)
             
             # Air resistance ring (same radius as gravity range in this model)
-            air_r = max(1, int(self.gravity_distance * camera.zoom))
+            air_r = max(1, int(self.gravity_distance * zoom))
             if air_r > 3:
-                air_surf = pygame.Surface((air_r * 2 + 4, air_r * 2 + 4), pygame.SRCALPHA)
-                pygame.draw.circle(air_surf, (255, 100, 100, 60), (air_r + 2, air_r + 2), air_r, 1)
-                screen.blit(air_surf, (screen_x - air_r - 2, screen_y - air_r - 2))
+                _draw_alpha_circle(screen, center_x, center_y, air_r, (255, 100, 100, 60), 1)
+
+        # Rings, planet body, spots and outline come from one cached sprite
+        sprite = _cached_sprite(self._sprite_cache, scaled_radius, self._render_sprite)
+        half = sprite.get_width() // 2
+        return sprite, (center_x - half, center_y - half)
 
-        # Draw rings behind planet if it has them
-        if self.has_rings and scaled_radius > 6:
+    def _render_sprite(self, scaled_radius):
+        """Rings, body, spots and outline at one on-screen radius, centred on a transparent Surface"""
+        has_rings = self.has_rings and scaled_radius > 6
+        if has_rings:
             ring_inner = int(scaled_radius * self.ring_inner_radius)
             ring_outer = int(scaled_radius * self.ring_outer_radius)
-            ring_surf = pygame.Surface((ring_outer * 2, ring_outer * 2), pygame.SRCALPHA)
-            pygame.draw.circle(ring_surf, (*self.ring_color, 120), (ring_outer, ring_outer), ring_outer)
-            pygame.draw.circle(ring_surf, (0, 0, 0, 0), (ring_outer, ring_outer), ring_inner)
-            screen.blit(ring_surf, (screen_x - ring_outer, screen_y - ring_outer))
+        half = (ring_outer if has_rings else scaled_radius) + 2
+        sprite = pygame.Surface((half * 2 + 1, half * 2 + 1), pygame.SRCALPHA)
+        centre = (half, half)
+
+        # Draw rings behind planet if it has them (translucent band, clipped like the old 2r-wide ring surface)
+        if has_rings:
+            sprite.set_clip(pygame.Rect(half - ring_outer, half - ring_outer, ring_outer * 2, ring_outer * 2))
+            pygame.draw.circle(sprite, (*self.ring_color, 120), centre, ring_outer)
+            pygame.draw.circle(sprite, (0, 0, 0, 0), centre, ring_inner)
+            sprite.set_clip(None)
 
         # Draw planet base
-        pygame.draw.circle(screen, self.color, (int(screen_x), int(screen_y)), scaled_radius)
+        pygame.draw.circle(sprite, self.color, centre, scaled_radius)
         
         # Draw spots if planet has them
         if self.has_spots and scaled_radius > 4:
-            spot_color = tuple(max(0, c - 30) for c in self.color)
             for angle, distance, size in self.spots:
                 spot_distance = distance * scaled_radius
-                spot_x = int(screen_x + math.cos(angle) * spot_distance)
-                spot_y = int(screen_y + math.sin(angle) * spot_distance)
+                spot_x = int(half + math.cos(angle) * spot_distance)
+                spot_y = int(half + math.sin(angle) * spot_distance)
                 spot_radius = max(1, int(size * scaled_radius))
-                pygame.draw.circle(screen, spot_color, (spot_x, spot_y), spot_radius)
+                pygame.draw.circle(sprite, self.spot_color, (spot_x, spot_y), spot_radius)
         
         # Draw rings in front of planet if it has them
-        if self.has_rings and scaled_radius > 6:
-            ring_inner = int(scaled_radius * self.ring_inner_radius)
-            ring_outer = int(scaled_radius * self.ring_outer_radius)
+        if has_rings:
             # Draw thin ring outline
-            pygame.draw.circle(screen, self.ring_color, (int(screen_x), int(screen_y)), ring_outer, 2)
-            pygame.draw.circle(screen, self.ring_color, (int(screen_x), int(screen_y)), ring_inner, 1)
+            pygame.draw.circle(sprite, self.ring_color, centre, ring_outer, 2)
+            pygame.draw.circle(sprite, self.ring_color, centre, ring_inner, 1)
         
         # Draw planet outline
-        outline_color = tuple(max(0, c - 50) for c in self.color)
-        pygame.draw.circle(screen, outline_color, (int(screen_x), int(screen_y)), scaled_radius, 2)
+        pygame.draw.circle(sprite, self.outline_color, centre, scaled_radius, 2)
+        return sprite
 
     def draw_preview(self, screen, x, y, size=20):
         """Draw a small preview of the planet for the UI"""
@@ -257,21 +363,19 @@ class Planet:
         
         # Draw rings if planet has them
         if self.has_rings:
-            ring_inner = int(size * 1.3)
-            ring_outer = int(size * 1.8)
+            ring_inner = int(size * self.ring_inner_radius)
+            ring_outer = int(size * self.ring_outer_radius)
             pygame.draw.circle(screen, self.ring_color, (x, y), ring_outer, 1)
             pygame.draw.circle(screen, self.ring_color, (x, y), ring_inner, 1)
         
         # Draw spots if planet has them
         if self.has_spots:
-            spot_color = tuple(max(0, c - 30) for c in self.color)
             for angle, distance, spot_size in self.spots[:3]:  # Only first 3 spots in preview
                 spot_distance = distance * size * 0.8
                 spot_x = int(x + math.cos(angle) * spot_distance)
                 spot_y = int(y + math.sin(angle) * spot_distance)
                 spot_radius = max(1, int(spot_size * size * 0.5))
-                pygame.draw.circle(screen, spot_color, (spot_x, spot_y), spot_radius)
+                pygame.draw.circle(screen, self.spot_color, (spot_x, spot_y), spot_radius)
         
         # Draw outline
-        outline_color = tuple(max(0, c - 50) for c in self.color)
-        pygame.draw.circle(screen, outline_color, (x, y), size, 1)
+        pygame.draw.circle(screen, self.outline_color, (x, y), size, 1)
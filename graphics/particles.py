@@ -0,0 +1,274 @@
+"""
+Batched particle rendering - paints zoomed-out particles straight into the
+screen's pixel array instead of issuing one pygame.draw call per particle
+"""
+import pygame
+import numpy as np
+
+from config.constants import PARTICLE_PALETTE
+
+# Above this zoom particles get auras/trails and are drawn one by one
+DOT_ZOOM_LIMIT = 0.4
+# Screen-space margin Particle.draw uses before culling a particle
+CULL_MARGIN = 50
+
+_stamp_cache = {}  # radius -> (dx, dy) pixel offsets covered by draw.circle
+_colour_cache = {}  # (surface format, rgb) -> mapped pixel values
+_palette_cache = {}  # surface format -> (len(PARTICLE_PALETTE), 3) array of mapped pixel values
+_glow_cache = {}  # (rgb, radius, alpha) -> translucent circle Surface
+_body_cache = {}  # (rgb, radius) -> particle body Surface
+_disc_cache = {}  # (rgb, radius) -> plain solid disc Surface
+SPRITE_CACHE_LIMIT = 4096
+GLOW_ALPHA_STEP = 16  # Glow alphas are snapped to the middle of 16-wide bands to keep the cache small
+
+
+def _circle_stamp(radius):
+    """Offsets of the pixels pygame.draw.circle fills for a given radius"""
+    stamp = _stamp_cache.get(radius)
+    if stamp is None:
+        size = radius * 2 + 3
+        surface = pygame.Surface((size, size))
+        pygame.draw.circle(surface, (255, 255, 255), (size // 2, size // 2), radius)
+        xs, ys = np.nonzero(pygame.surfarray.array2d(surface))
+        stamp = (xs - size // 2, ys - size // 2)
+        _stamp_cache[radius] = stamp
+    return stamp
+
+
+def _mapped_colours(screen, rgb):
+    """Mapped pixel values for a particle colour: (body, centre, core)"""
+    key = (screen.get_bitsize(), screen.get_masks(), rgb)
+    values = _colour_cache.get(key)
+    if values is None:
+        values = (screen.map_rgb(rgb),
+                  screen.map_rgb(tuple(min(255, c + 80) for c in rgb)),
+                  screen.map_rgb(tuple(min(255, c + 120) for c in rgb)))
+        _colour_cache[key] = values
+    return values
+
+
+def _mapped_palette(screen):
+    """_mapped_colours for every PARTICLE_PALETTE entry, as an array indexed by colour index"""
+    key = (screen.get_bitsize(), screen.get_masks())
+    palette = _palette_cache.get(key)
+    if palette is None:
+        palette = np.array([_mapped_colours(screen, rgb) for rgb in PARTICLE_PALETTE], np.int64)
+        _palette_cache[key] = palette
+    return palette
+
+
+def glow_sprite(rgb, radius, alpha):
+    """Translucent filled circle (blit at centre - radius), cached per colour, radius and alpha band"""
+    alpha = min(255, alpha - alpha % GLOW_ALPHA_STEP + GLOW_ALPHA_STEP // 2)
+    key = (rgb, radius, alpha)
+    sprite = _glow_cache.get(key)
+    if sprite is None:
+        if len(_glow_cache) >= SPRITE_CACHE_LIMIT:
+            _glow_cache.clear()  # Zooming creates new radii; drop stale ones
+        sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, (*rgb, alpha), (radius, radius), radius)
+        _glow_cache[key] = sprite
+    return sprite
+
+
+def body_sprite(rgb, radius):
+    """Particle disc with its bright centre and core (blit at centre - radius)"""
+    key = (rgb, radius)
+    sprite = _body_cache.get(key)
+    if sprite is None:
+        if len(_body_cache) >= SPRITE_CACHE_LIMIT:
+            _body_cache.clear()
+        sprite = pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA)
+        centre = (radius, radius)
+        pygame.draw.circle(sprite, rgb, centre, radius)
+        if radius > 1:
+            # Bright inner core
+            pygame.draw.circle(sprite, tuple(min(255, c + 80) for c in rgb), centre, max(1, int(radius * 0.6)))
+            # Very bright center point
+            if radius > 2:
+                pygame.draw.circle(sprite, tuple(min(255, c + 120) for c in rgb), centre, max(1, int(radius * 0.3)))
+        _body_cache[key] = sprite
+    return sprite
+
+
+def disc_sprite(rgb, radius):
+    """Solid circle, identical to pygame.draw.circle (blit at centre - radius)"""
+    key = (rgb, radius)
+    sprite = _disc_cache.get(key)
+    if sprite is None:
+        if len(_disc_cache) >= SPRITE_CACHE_LIMIT:
+            _disc_cache.clear()
+        sprite = pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, rgb, (radius, radius), radius)
+        _disc_cache[key] = sprite
+    return sprite
+
+
+def trails_visible(camera):
+    """True if particles are drawn with trails at this camera (always, without one)"""
+    return camera is None or camera.zoom > DOT_ZOOM_LIMIT
+
+
+def dot_radius(zoom):
+    """On-screen radius of a particle at low zoom (matches Particle.draw)"""
+    raw_scaled_radius = 5 * zoom
+    if raw_scaled_radius < 1.5:
+        return 3
+    return max(2, int(raw_scaled_radius))
+
+
+def draw_particle_dots(screen, camera, store, mask):
+    """Paint the masked free-flying particles of a ParticleStore as solid dots in one pass over the pixel array.
+
+    Only valid while camera.zoom <= DOT_ZOOM_LIMIT, where Particle.draw renders
+    a plain disc with a bright centre and no aura or trail. Surfaces that
+    pixels2d cannot reference (anything but 16 or 32 bits per pixel) get the
+    same dots as body sprite blits instead.
+    """
+    rows = np.flatnonzero(mask)
+    if len(rows) == 0:
+        return
+    half_w = camera.screen_width // 2
+    half_h = camera.screen_height // 2
+    sx = ((store.x[rows] - camera.x) * camera.zoom + half_w).astype(np.int64)
+    sy = ((store.y[rows] - camera.y) * camera.zoom + half_h).astype(np.int64)
+
+    radius = dot_radius(camera.zoom)
+    width, height = screen.get_size()
+    # Dots overlapping the edge are kept; their stamp pixels are clipped to the surface below
+    visible = np.logical_and(np.logical_and(sx >= -radius, sx < width + radius),
+                             np.logical_and(sy >= -radius, sy < height + radius))
+    if not visible.any():
+        return
+    index = np.flatnonzero(visible)
+    sx = sx[index]
+    sy = sy[index]
+
+    if screen.get_bytesize() not in (2, 4):
+        screen.blits([(body_sprite(PARTICLE_PALETTE[colour], radius), (x - radius, y - radius))
+                      for colour, x, y in zip(store.color_index[rows[index]].tolist(), sx.tolist(), sy.tolist())],
+                     doreturn=False)
+        return
+
+    colours = _mapped_palette(screen)[store.color_index[rows[index]]]
+    body = colours[:, 0]
+    # Radius 3 dots finish with the "core" colour on top, radius 2 dots with the "center" colour
+    centre = colours[:, 2] if radius > 2 else colours[:, 1]
+
+    pixels = pygame.surfarray.pixels2d(screen)
+    try:
+        for stamp, colour in ((_circle_stamp(radius), body), (_circle_stamp(1), centre)):
+            for ox, oy in zip(*stamp):
+                x = sx + ox
+                y = sy + oy
+                inside = (x >= 0) & (x < width) & (y >= 0) & (y < height)
+                pixels[x[inside], y[inside]] = colour[inside]
+    finally:
+        del pixels
+
+
+def on_screen_mask(camera, store):
+    """Live particles whose centre is within Particle.draw's culling margin of the screen"""
+    n = store.count
+    sx = ((store.x[:n] - camera.x) * camera.zoom + camera.screen_width // 2).astype(np.int64)
+    sy = ((store.y[:n] - camera.y) * camera.zoom + camera.screen_height // 2).astype(np.int64)
+    return (store.alive[:n]
+            & (sx >= -CULL_MARGIN) & (sx <= camera.screen_width + CULL_MARGIN)
+            & (sy >= -CULL_MARGIN) & (sy <= camera.screen_height + CULL_MARGIN))
+
+
+def _alpha_column(store, rows):
+    """Vectorized Particle.get_alpha for the given rows"""
+    fade_out = (255 * (1.0 - store.fade_timer[rows])).astype(np.int64)
+    fade_in = np.maximum(50, (255 * (store.age[rows] / 0.3)).astype(np.int64))
+    return np.where(store.fading[rows], fade_out, np.where(store.age[rows] < 0.3, fade_in, 255))
+
+
+def _scaled_radius_column(store, rows, zoom):
+    """Vectorized Particle.scaled_radius for the given rows"""
+    raw_scaled_radius = store.radius[rows] * zoom
+    return np.where(raw_scaled_radius < 1.5, 3, np.maximum(2, raw_scaled_radius.astype(np.int64)))
+
+
+def _trail_screen_points(camera, store, rows):
+    """Each row's trail projected to integer screen coordinates, oldest point first"""
+    trail_length = store.trail_x.shape[1]
+    head = store.trail_head[rows]
+    length = store.trail_len[rows]
+    slots = (head[:, None] - length[:, None] + np.arange(trail_length)) % trail_length
+    sx = ((store.trail_x[rows[:, None], slots] - camera.x) * camera.zoom + camera.screen_width // 2).astype(np.int64)
+    sy = ((store.trail_y[rows[:, None], slots] - camera.y) * camera.zoom + camera.screen_height // 2).astype(np.int64)
+    return [list(zip(xs[:k], ys[:k])) for xs, ys, k in zip(sx.tolist(), sy.tolist(), length.tolist())]
+
+
+def draw_particle_sprites(screen, camera, store, rows):
+    """Draw free-flying particles with auras and trails, batching the sprite blits.
+
+    Auras, trails (projected to the screen in one array pass) and particle
+    bodies are layered in that order, each going out in a single blits() call.
+    """
+    alpha = _alpha_column(store, rows)
+    shown = alpha > 0  # Skip drawing completely if invisible
+    rows = rows[shown]
+    alpha = alpha[shown]
+    if len(rows) == 0:
+        return
+    zoom = camera.zoom
+    scaled_radius = _scaled_radius_column(store, rows, zoom)
+    sx = ((store.x[rows] - camera.x) * zoom + camera.screen_width // 2).astype(np.int64)
+    sy = ((store.y[rows] - camera.y) * zoom + camera.screen_height // 2).astype(np.int64)
+
+    particles = store.particles
+    visible = [(particles[i], x, y, r, a) for i, x, y, r, a in
+               zip(rows.tolist(), sx.tolist(), sy.tolist(), scaled_radius.tolist(), alpha.tolist())]
+    auras = []
+    bodies = []
+    for (particle, x, y, r, a), colour in zip(visible, store.color_index[rows].tolist()):
+        for sprite, aura_size in particle.aura_sprites(zoom, r, a):
+            auras.append((sprite, (x - aura_size, y - aura_size)))
+        bodies.append((body_sprite(PARTICLE_PALETTE[colour], r), (x - r, y - r)))
+    screen.blits(auras, doreturn=False)
+    trails = []
+    for (particle, x, y, r, a), points in zip(visible, _trail_screen_points(camera, store, rows)):
+        trails.extend(particle.trail_sprites(camera, r, a, points))
+    screen.blits(trails, doreturn=False)
+    screen.blits(bodies, doreturn=False)
+
+
+def draw_explosions(screen, camera, store, rows):
+    """Draw the sparks of the given exploding rows, projecting them all in one pass"""
+    rows = rows[_alpha_column(store, rows) > 0]
+    if len(rows) == 0:
+        return
+    sx = ((store.spark_x[rows] - camera.x) * camera.zoom + camera.screen_width // 2).astype(np.int64)
+    sy = ((store.spark_y[rows] - camera.y) * camera.zoom + camera.screen_height // 2).astype(np.int64)
+    shown = (sx >= 0) & (sx < camera.screen_width) & (sy >= 0) & (sy < camera.screen_height)
+    row_of, spark = np.nonzero(shown)
+    colours = store.color_index[rows][row_of].tolist()
+    radii = np.maximum(1, store.spark_radius[rows][row_of, spark]).tolist()
+    # Sparks are individual draw calls (not blits), so the screen is locked once for all of them
+    screen.lock()
+    try:
+        for colour, x, y, radius in zip(colours, sx[row_of, spark].tolist(), sy[row_of, spark].tolist(), radii):
+            pygame.draw.circle(screen, PARTICLE_PALETTE[colour], (x, y), radius)
+    finally:
+        screen.unlock()
+
+
+def draw_particles(screen, camera, store, planets=None):
+    """Draw the particles of a ParticleStore.
+
+    Off-screen particles are culled on the position columns. Zoomed in, the
+    visible ones are drawn as cached sprites in batched blits; zoomed out they
+    are painted as plain dots straight into the pixel array.
+    """
+    if camera.is_map_mode():
+        return  # Particles are invisible in map mode
+    n = store.count
+    visible = on_screen_mask(camera, store)
+    exploding = store.exploding[:n]
+    draw_explosions(screen, camera, store, np.flatnonzero(visible & exploding))
+    if camera.zoom > DOT_ZOOM_LIMIT:
+        draw_particle_sprites(screen, camera, store, np.flatnonzero(visible & ~exploding))
+    else:
+        draw_particle_dots(screen, camera, store, store.alive[:n] & ~exploding)
@@ -0,0 +1,40 @@
+"""
+Batched planet rendering - culls off-screen planets in one array pass, draws
+every remaining planet's atmosphere and range rings, then blits all the
+cached planet body sprites in a single call
+"""
+from systems.physics import planet_arrays
+
+# Largest hover growth of a planet (Planet uses 15%, DwarfPlanet 10%)
+HOVER_SCALE_LIMIT = 1.15
+# Screen-space slack on top of the atmosphere radius: draw_backdrop's 50px margin,
+# the minimum map-mode atmosphere, the hover wobble and integer rounding
+PLANET_CULL_MARGIN = 60
+
+
+def visible_planets(camera, planets, planet_data=None):
+    """Planets whose atmosphere may reach the screen.
+
+    A conservative superset of the planets draw_backdrop draws: its own
+    margin test still runs, this only skips the work for the clear misses.
+    """
+    if not planets:
+        return []
+    planet_x, planet_y, planet_r, _ = planet_data or planet_arrays(planets)
+    scale = 0.5 if camera.is_map_mode() else camera.zoom  # Map mode draws planets at half size
+    reach = planet_r * (3 * HOVER_SCALE_LIMIT * scale) + PLANET_CULL_MARGIN
+    sx = (planet_x - camera.x) * camera.zoom + camera.screen_width // 2
+    sy = (planet_y - camera.y) * camera.zoom + camera.screen_height // 2
+    shown = ((sx >= -reach) & (sx <= camera.screen_width + reach)
+             & (sy >= -reach) & (sy <= camera.screen_height + reach))
+    return [planet for planet, keep in zip(planets, shown.tolist()) if keep]
+
+
+def draw_planets(screen, camera, planets, planet_data=None):
+    """Draw planets in two layers: backdrops one by one, then every body in one blits() call.
+
+    planet_data is the planet_arrays() packing of planets, if the caller keeps one.
+    """
+    planets = visible_planets(camera, planets, planet_data)
+    bodies = [body for body in (planet.draw_backdrop(screen, camera) for planet in planets) if body is not None]
+    screen.blits(bodies, doreturn=False)
@@ -0,0 +1,66 @@
+"""
+Starfield frame kernel - parallax screen positions, culling, drawn sizes and
+twinkle for every star in one pass over StarField's arrays. Compiled with
+Numba when it is installed, otherwise NumPy with the same results.
+"""
+import math
+import numpy as np
+
+# Try to import numba for a compiled kernel
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+# Sine lookup table for the twinkle: phase * TWINKLE_TABLE_SCALE, wrapped to the table, indexes it
+TWINKLE_TABLE_SIZE = 1024  # Power of two, so wrapping is a bit mask
+TWINKLE_TABLE_SCALE = TWINKLE_TABLE_SIZE / (2 * math.pi)
+_twinkle_sin = np.sin(np.arange(TWINKLE_TABLE_SIZE) / TWINKLE_TABLE_SCALE)
+
+if HAS_NUMBA:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _star_frame_numba(x, y, depth, size, twinkle_speed, twinkle_phase, cam_x, cam_y, zoom, half_w, half_h,
+                          screen_w, screen_h, t, sin_table, out_px, out_py, out_size, out_twinkle, out_visible):
+        mask = sin_table.shape[0] - 1
+        for i in prange(x.shape[0]):
+            sx = (x[i] - cam_x * depth[i]) * zoom + half_w
+            sy = (y[i] - cam_y * depth[i]) * zoom + half_h
+            out_px[i] = sx
+            out_py[i] = sy
+            visible = sx >= 0.0 and sx < screen_w and sy >= 0.0 and sy < screen_h
+            out_visible[i] = visible
+            if visible:
+                out_size[i] = max(1, int(size[i] * zoom * (1.2 - depth[i])))
+                index = np.int64((t * twinkle_speed[i] + twinkle_phase[i]) * TWINKLE_TABLE_SCALE) & mask
+                out_twinkle[i] = 0.5 + 0.5 * sin_table[index]
+
+
+def star_frame(x, y, depth, size, twinkle_speed, twinkle_phase, cam_x, cam_y, zoom, half_w, half_h, screen_w, screen_h, t,
+               out_px, out_py, out_size, out_twinkle, out_visible):
+    """Screen position of every star and whether it is on screen, written into the out_ arrays.
+
+    Drawn size and twinkle (0-1) are only worked out for the on-screen stars;
+    the other entries of out_size and out_twinkle are left as they were.
+    """
+    if HAS_NUMBA:
+        _star_frame_numba(x, y, depth, size, twinkle_speed, twinkle_phase, float(cam_x), float(cam_y), float(zoom),
+                          float(half_w), float(half_h), float(screen_w), float(screen_h), float(t), _twinkle_sin,
+                          out_px, out_py, out_size, out_twinkle, out_visible)
+        return
+    # Positions in place on the output buffers
+    np.multiply(depth, cam_x, out=out_px)
+    np.subtract(x, out_px, out=out_px)
+    out_px *= zoom
+    out_px += half_w
+    np.multiply(depth, cam_y, out=out_py)
+    np.subtract(y, out_py, out=out_py)
+    out_py *= zoom
+    out_py += half_h
+    np.logical_and((out_px >= 0) & (out_px < screen_w), (out_py >= 0) & (out_py < screen_h), out=out_visible)
+    # Most of the field is usually off screen, so size and twinkle skip those stars
+    shown = np.flatnonzero(out_visible)
+    out_size[shown] = np.maximum(1, (size[shown] * zoom * (1.2 - depth[shown])).astype(np.int64))
+    index = ((t * twinkle_speed[shown] + twinkle_phase[shown]) * TWINKLE_TABLE_SCALE).astype(np.int64)
+    index &= TWINKLE_TABLE_SIZE - 1
+    out_twinkle[shown] = 0.5 + 0.5 * _twinkle_sin[index]
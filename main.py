@@ -14,7 +14,9 @@ Controls:
     - ESC: Cancel placement or deselect
 """
 
-if __name__ == "__main__":
+
+def main():
+    """Initialise pygame and run the game until the window is closed"""
     # Use the complete modular Game class
     try:
         print("Starting Particle Tycoon (Complete Modular Version)...")
@@ -39,3 +41,7 @@ if __name__ == "__main__":
         import traceback
         traceback.print_exc()
         input("Press Enter to close...")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,7 @@ import numpy as np
 import os
 import time
 from typing import List, Tuple
-from collections import deque
+from collections import deque, OrderedDict, namedtuple
 import pygame.sndarray
 import itertools
 
@@ -16,6 +16,13 @@ try:
 except ImportError:
     HAS_GFXDRAW = False
 
+# Try to import numba for the compiled starfield kernel, NumPy is used otherwise
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
 # Initialize Pygame
 pygame.init()
 pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
@@ -26,17 +33,18 @@ SCREEN_WIDTH = info.current_w
 SCREEN_HEIGHT = info.current_h
 FPS = 60
 
-# Planet visual types
-PLANET_TYPES = [
-    {"name": "Rocky", "color": (139, 69, 19), "rings": False, "spots": True},
-    {"name": "Gas Giant", "color": (255, 140, 0), "rings": True, "spots": False},
-    {"name": "Ice World", "color": (173, 216, 230), "rings": False, "spots": False},
-    {"name": "Desert", "color": (238, 203, 173), "rings": False, "spots": True},
-    {"name": "Ocean", "color": (0, 105, 148), "rings": False, "spots": False},
-    {"name": "Volcanic", "color": (178, 34, 34), "rings": False, "spots": True},
-    {"name": "Forest", "color": (34, 139, 34), "rings": False, "spots": False},
-    {"name": "Crystal", "color": (147, 0, 211), "rings": True, "spots": False},
-]
+# Planet visual types, read by attribute on every planet draw
+PlanetType = namedtuple("PlanetType", "name color rings spots")
+PLANET_TYPES = (
+    PlanetType("Rocky", (139, 69, 19), False, True),
+    PlanetType("Gas Giant", (255, 140, 0), True, False),
+    PlanetType("Ice World", (173, 216, 230), False, False),
+    PlanetType("Desert", (238, 203, 173), False, True),
+    PlanetType("Ocean", (0, 105, 148), False, False),
+    PlanetType("Volcanic", (178, 34, 34), False, True),
+    PlanetType("Forest", (34, 139, 34), False, False),
+    PlanetType("Crystal", (147, 0, 211), True, False),
+)
 
 # Colors
 BLACK = (0, 0, 0)
@@ -55,6 +63,12 @@ WORLD_LIMIT = 100000  # Very large world boundary to avoid premature despawn
 # Map boundary for visual border - match particle spawn area
 MAP_BOUNDARY = 40000  # Visible red border boundary (matches particle spawn area)
 
+# Trail points kept per particle (fixed-size ring buffer)
+TRAIL_LENGTH = 8
+
+# Radius of every particle; planets cache their reach for it
+PARTICLE_RADIUS = 5
+
 # Particle colors
 PARTICLE_COLORS = [
     (255, 100, 100),  # Light red
@@ -90,6 +104,15 @@ def generate_tick_sound():
     sound = pygame.sndarray.make_sound(arr)
     return sound
 
+_tick_sound = None
+
+def get_tick_sound():
+    """Return the money tick, synthesised once and reused afterwards"""
+    global _tick_sound
+    if _tick_sound is None:
+        _tick_sound = generate_tick_sound()
+    return _tick_sound
+
 def generate_spawn_sound():
     """Generate a simple spawn sound with random pitch"""
     frequency = random.randint(200, 800)  # Random frequency
@@ -110,19 +133,63 @@ def generate_spawn_sound():
     sound = pygame.sndarray.make_sound(sound_array)
     return sound
 
-def generate_catch_sound():
+# Random-pitch spawn sounds synthesised up front and picked from at random
+SPAWN_SOUND_VARIANTS = 8
+_spawn_sounds = []
+
+def get_spawn_sound():
+    """Return one of the spawn sounds, synthesised once and reused afterwards"""
+    if not _spawn_sounds:
+        _spawn_sounds.extend(generate_spawn_sound() for _ in range(SPAWN_SOUND_VARIANTS))
+    return random.choice(_spawn_sounds)
+
+CATCH_CHIME_FREQUENCIES = [880, 1046, 1318]
+_catch_sounds = []
+
+def generate_catch_sound(freq=None):
     # Simple chime
     sample_rate = 22050
     duration = 0.12
     frames = int(duration * sample_rate)
     arr = np.zeros((frames, 2))
-    freq = random.choice([880, 1046, 1318])
+    if freq is None:
+        freq = random.choice(CATCH_CHIME_FREQUENCIES)
     for i in range(frames):
         wave = np.sin(2 * np.pi * freq * i / sample_rate)
         arr[i] = [wave * 0.2, wave * 0.2]
     sound_array = (arr * 32767).astype(np.int16)
     return pygame.sndarray.make_sound(sound_array)
 
+def get_catch_sound():
+    """Return one of the catch chimes, synthesised once and reused afterwards"""
+    if not _catch_sounds:
+        _catch_sounds.extend(generate_catch_sound(freq) for freq in CATCH_CHIME_FREQUENCIES)
+    return random.choice(_catch_sounds)
+
+# Catch chimes rotate through their own reserved channels (channel 1 is the music channel)
+CATCH_CHANNEL_FIRST = 2
+CATCH_CHANNEL_COUNT = 16
+_catch_channels = []
+_catch_channel_index = 0
+
+def get_catch_channels():
+    """Reserve the catch chime channels once so play() never has to search for a free one"""
+    if not _catch_channels:
+        reserved = CATCH_CHANNEL_FIRST + CATCH_CHANNEL_COUNT
+        pygame.mixer.set_num_channels(max(pygame.mixer.get_num_channels(), reserved + 16))
+        pygame.mixer.set_reserved(reserved)
+        _catch_channels.extend(pygame.mixer.Channel(CATCH_CHANNEL_FIRST + i) for i in range(CATCH_CHANNEL_COUNT))
+    return _catch_channels
+
+def play_catch_sound(volume):
+    """Play a catch chime on the next channel of the round-robin pool"""
+    global _catch_channel_index
+    channels = get_catch_channels()
+    channel = channels[_catch_channel_index]
+    _catch_channel_index = (_catch_channel_index + 1) % CATCH_CHANNEL_COUNT
+    channel.play(get_catch_sound())
+    channel.set_volume(volume)
+
 def generate_explosion_sound():
     # Simple noise burst
     sample_rate = 22050
@@ -132,16 +199,150 @@ def generate_explosion_sound():
     sound_array = (arr * 32767).astype(np.int16)
     return pygame.sndarray.make_sound(sound_array)
 
+# Noise bursts differ per call, so keep a few around instead of one
+EXPLOSION_SOUND_VARIANTS = 4
+_explosion_sounds = []
+
+def get_explosion_sound():
+    """Return one of the explosion bursts, synthesised once and reused afterwards"""
+    if not _explosion_sounds:
+        _explosion_sounds.extend(generate_explosion_sound() for _ in range(EXPLOSION_SOUND_VARIANTS))
+    return random.choice(_explosion_sounds)
+
+# Translucent circles used for particle auras, trail glows and star glows
+_glow_cache = {}  # (rgb, radius, alpha) -> Surface
+GLOW_CACHE_LIMIT = 4096
+GLOW_ALPHA_STEP = 16  # Glow alphas are snapped to the middle of 16-wide bands to keep the cache small
+
+def get_glow_sprite(rgb, radius, alpha):
+    """Translucent filled circle (blit at centre - radius), drawn once per colour, radius and alpha band"""
+    alpha = min(255, alpha - alpha % GLOW_ALPHA_STEP + GLOW_ALPHA_STEP // 2)
+    key = (rgb, radius, alpha)
+    sprite = _glow_cache.get(key)
+    if sprite is None:
+        if len(_glow_cache) >= GLOW_CACHE_LIMIT:
+            _glow_cache.clear()  # Zooming creates new radii; drop stale ones
+        sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, (*rgb, alpha), (radius, radius), radius)
+        sprite = sprite.convert_alpha()  # Display pixel format, so blits skip the conversion
+        _glow_cache[key] = sprite
+    return sprite
+
+# Planet atmospheres: concentric translucent discs (outermost first), pre-composited per radius
+ATMOSPHERE_COLOR = (100, 150, 255)
+ATMOSPHERE_ALPHAS = (15, 10, 5)
+ATMOSPHERE_CACHE_LIMIT = 32
+_atmosphere_cache = {}  # air radius -> Surface
+
+def get_atmosphere_sprite(air_radius):
+    """Every atmosphere disc in one SRCALPHA sprite (blit at centre - air_radius), shared by all planets"""
+    sprite = _atmosphere_cache.get(air_radius)
+    if sprite is not None:
+        return sprite
+    if len(_atmosphere_cache) >= ATMOSPHERE_CACHE_LIMIT:
+        _atmosphere_cache.clear()  # Zooming creates new radii; drop stale ones
+    size = air_radius * 2 + 1
+    # Count the discs covering each pixel, rasterised the way they used to be drawn on screen
+    layers = np.zeros((size, size), np.intp)
+    disc = pygame.Surface((size, size), pygame.SRCALPHA)
+    for i in range(len(ATMOSPHERE_ALPHAS)):
+        disc_radius = air_radius - (i * air_radius // 4)
+        if disc_radius <= 2:
+            continue
+        disc.fill((0, 0, 0, 0))
+        if HAS_GFXDRAW:
+            pygame.gfxdraw.filled_circle(disc, air_radius, air_radius, disc_radius, (255, 255, 255, 255))
+        else:
+            pygame.draw.circle(disc, (255, 255, 255, 255), (air_radius, air_radius), disc_radius)
+        layers += pygame.surfarray.array_alpha(disc) > 0
+    # Alpha of k discs blended over each other, indexed by k
+    transmitted = np.cumprod([1.0] + [1.0 - alpha / 255 for alpha in ATMOSPHERE_ALPHAS])
+    alpha_of_layers = np.round(255 * (1.0 - transmitted)).astype(np.uint8)
+    sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+    sprite.fill((*ATMOSPHERE_COLOR, 0))
+    alpha = pygame.surfarray.pixels_alpha(sprite)
+    try:
+        alpha[...] = alpha_of_layers[layers]
+    finally:
+        del alpha
+    sprite = sprite.convert_alpha()
+    _atmosphere_cache[air_radius] = sprite
+    return sprite
+
+# Star sprites: the glow (concentric translucent discs, outermost first, pre-composited) and the
+# core, drawn per star size and colour
+STAR_GLOW_LAYERS = ((8, 15), (6, 25), (4, 40))  # (radius in star sizes, alpha)
+STAR_COLOR_STEP = 4  # Twinkling star colours are snapped to the middle of 4-wide bands to keep the caches small
+STAR_CACHE_LIMIT = 512
+_star_glow_cache = {}  # (size, rgb) -> Surface
+_star_core_cache = {}  # (size, rgb) -> Surface
+
+def get_star_glow_sprite(size, rgb):
+    """Every glow layer of a star in one SRCALPHA sprite (blit at centre - 8 * size)"""
+    key = (size, rgb)
+    sprite = _star_glow_cache.get(key)
+    if sprite is not None:
+        return sprite
+    if len(_star_glow_cache) >= STAR_CACHE_LIMIT:
+        _star_glow_cache.clear()  # Zooming creates new sizes; drop stale ones
+    outer = size * STAR_GLOW_LAYERS[0][0]
+    # Count the discs covering each pixel, each rasterised on its own surface as they used to be
+    layers = np.zeros((outer * 2, outer * 2), np.intp)
+    for scale, _ in STAR_GLOW_LAYERS:
+        glow_size = size * scale
+        disc = pygame.Surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA)
+        pygame.draw.circle(disc, (255, 255, 255, 255), (glow_size, glow_size), glow_size)
+        offset = outer - glow_size
+        layers[offset:offset + glow_size * 2, offset:offset + glow_size * 2] += pygame.surfarray.array_alpha(disc) > 0
+    # Alpha of k discs blended over each other, indexed by k
+    transmitted = np.cumprod([1.0] + [1.0 - alpha / 255 for _, alpha in STAR_GLOW_LAYERS])
+    alpha_of_layers = np.round(255 * (1.0 - transmitted)).astype(np.uint8)
+    sprite = pygame.Surface((outer * 2, outer * 2), pygame.SRCALPHA)
+    sprite.fill((*rgb, 0))
+    alpha = pygame.surfarray.pixels_alpha(sprite)
+    try:
+        alpha[...] = alpha_of_layers[layers]
+    finally:
+        del alpha
+    sprite = sprite.convert_alpha()
+    _star_glow_cache[key] = sprite
+    return sprite
+
+def get_star_core_sprite(size, rgb):
+    """Main star with its bright center (blit at centre - size)"""
+    key = (size, rgb)
+    sprite = _star_core_cache.get(key)
+    if sprite is not None:
+        return sprite
+    if len(_star_core_cache) >= STAR_CACHE_LIMIT:
+        _star_core_cache.clear()
+    sprite = pygame.Surface((size * 2 + 1, size * 2 + 1), pygame.SRCALPHA)
+    pygame.draw.circle(sprite, rgb, (size, size), size)
+    if size > 1:
+        pygame.draw.circle(sprite, tuple(min(255, int(c * 1.3)) for c in rgb), (size, size), max(1, size // 2))
+    sprite = sprite.convert_alpha()
+    _star_core_cache[key] = sprite
+    return sprite
+
+# Fonts by point size; Font(None, size) parses the default TTF, so each size is loaded once
+_font_cache = {}  # size -> pygame.font.Font
+
+def get_font(size):
+    """Default font at the given size, created on first use"""
+    font = _font_cache.get(size)
+    if font is None:
+        font = pygame.font.Font(None, size)
+        _font_cache[size] = font
+    return font
+
 # Spacey planet names
-SPACEY_NAMES = [
+SPACEY_NAMES = (
     "Nebulon", "Quasar", "Andromeda", "Pulsara", "Galaxion", "Stellara", "Cosmica", "Astrolis", "Vortexia", "Nova Prime", "Celestia", "Orbitron", "Zenith", "Eclipse", "Cometia", "Lunaris", "Solara", "Meteorix", "Auroria", "Spectra"
-]
+)
 planet_name_counter = itertools.count(1)
 
 def generate_planet_name():
-    base = random.choice(SPACEY_NAMES)
-    num = next(planet_name_counter)
-    return f"{base} {num}"
+    return f"{random.choice(SPACEY_NAMES)} {next(planet_name_counter)}"
 
 class MoneyPopup:
     """Animated money increase popup with tilt and color effects"""
@@ -202,6 +403,9 @@ class LightRay:
         self.x = x
         self.y = y
         self.angle = angle
+        # Unit direction, fixed for the ray's lifetime
+        self.dir_x = math.cos(angle)
+        self.dir_y = math.sin(angle)
         self.length = 0
         self.max_length = 25  # Even smaller light rays - less tall
         self.timer = 0
@@ -230,8 +434,8 @@ class LightRay:
         screen_x, screen_y = camera.world_to_screen(self.x, self.y)
         
         # Calculate end point
-        end_x = self.x + math.cos(self.angle) * self.length
-        end_y = self.y + math.sin(self.angle) * self.length
+        end_x = self.x + self.dir_x * self.length
+        end_y = self.y + self.dir_y * self.length
         screen_end_x, screen_end_y = camera.world_to_screen(end_x, end_y)
         
         # Draw smaller, more subtle light rays
@@ -256,35 +460,79 @@ class Wall:
     def __init__(self, x1: float, y1: float, x2: float, y2: float):
         self.x1, self.y1 = x1, y1
         self.x2, self.y2 = x2, y2
-        self.length = math.sqrt((x2-x1)**2 + (y2-y1)**2)
+        self.wall_dx = x2 - x1
+        self.wall_dy = y2 - y1
+        self.length = math.hypot(self.wall_dx, self.wall_dy)
+        self.length_sq = self.wall_dx * self.wall_dx + self.wall_dy * self.wall_dy  # For sqrt-free comparisons
         # Normalize wall vector
         if self.length > 0:
-            self.nx = (y2-y1) / self.length  # Normal vector
-            self.ny = -(x2-x1) / self.length
+            self.nx = self.wall_dy / self.length  # Normal vector
+            self.ny = -self.wall_dx / self.length
+            self.inv_length_sq = 1.0 / self.length_sq
+            # Line offset: nx * x + ny * y + c is the signed distance to the wall's line
+            self.c = -(self.nx * x1 + self.ny * y1)
         else:
             self.nx = self.ny = 0
+            self.inv_length_sq = 0.0
+            self.c = math.inf  # A zero-length wall never collides
     
     def check_collision(self, px, py, radius):
-        # Check if particle collides with wall segment
-        dx = px - self.x1
-        dy = py - self.y1
-        wall_dx = self.x2 - self.x1
-        wall_dy = self.y2 - self.y1
-        if self.length == 0:
-            return False, 0, 0
-        t = max(0, min(1, (dx*wall_dx + dy*wall_dy) / (self.length**2)))
-        closest_x = self.x1 + t * wall_dx
-        closest_y = self.y1 + t * wall_dy
-        dist = math.sqrt((px - closest_x)**2 + (py - closest_y)**2)
-        if dist < radius:
+        # Check if particle collides with wall segment (all distances compared squared)
+        d = self.nx * px + self.ny * py + self.c
+        if d * d >= radius * radius:
+            return False, 0, 0  # Too far from the wall's line to touch the segment
+        t = max(0, min(1, ((px - self.x1) * self.wall_dx + (py - self.y1) * self.wall_dy) * self.inv_length_sq))
+        cx = px - (self.x1 + t * self.wall_dx)
+        cy = py - (self.y1 + t * self.wall_dy)
+        if cx * cx + cy * cy < radius * radius:
             return True, self.nx, self.ny
         return False, 0, 0
+
+    def check_collisions_batch(self, px, py, radii):
+        """check_collision for arrays of particle positions and radii at once; returns a bool mask"""
+        d = self.nx * px + self.ny * py + self.c
+        near = d * d < radii * radii  # Only these can touch the segment
+        t = np.clip(((px - self.x1) * self.wall_dx + (py - self.y1) * self.wall_dy) * self.inv_length_sq, 0, 1)
+        cx = px - (self.x1 + t * self.wall_dx)
+        cy = py - (self.y1 + t * self.wall_dy)
+        return near & (cx * cx + cy * cy < radii * radii)
     
     def draw(self, screen, camera, gravity_distance: float = None, air_resistance_intensity: float = None):
         sx1, sy1 = camera.world_to_screen(self.x1, self.y1)
         sx2, sy2 = camera.world_to_screen(self.x2, self.y2)
         pygame.draw.line(screen, (100, 100, 255), (sx1, sy1), (sx2, sy2), max(2, int(3 * camera.zoom)))
 
+def bounce_off_walls(particles, walls):
+    """Bounce moving particles off walls, testing every particle against one wall per array pass.
+
+    A particle bounces off at most one wall per frame (the first it touches).
+    """
+    if not walls:
+        return
+    movers = [particle for particle in particles if not particle.exploding]  # Callers drop dead particles first
+    if not movers:
+        return
+    count = len(movers)
+    px = np.fromiter((particle.x for particle in movers), float, count)
+    py = np.fromiter((particle.y for particle in movers), float, count)
+    radii = np.fromiter((particle.radius for particle in movers), float, count)
+    free = np.ones(count, bool)
+    for wall in walls:
+        hit = free & wall.check_collisions_batch(px, py, radii)
+        if not hit.any():
+            continue
+        free &= ~hit
+        nx, ny = wall.nx, wall.ny
+        for index in np.flatnonzero(hit).tolist():
+            particle = movers[index]
+            # Reflect velocity about the wall normal, with some energy loss
+            dot_product = particle.vx * nx + particle.vy * ny
+            particle.vx = (particle.vx - 2 * dot_product * nx) * 0.8
+            particle.vy = (particle.vy - 2 * dot_product * ny) * 0.8
+            # Move particle slightly away from wall to prevent sticking
+            particle.x += nx * (particle.radius + 1)
+            particle.y += ny * (particle.radius + 1)
+
 class Camera:
     def __init__(self, screen_width: int, screen_height: int):
         self.x = 0  # Camera offset X
@@ -294,6 +542,7 @@ class Camera:
         self.screen_height = screen_height
         self.dragging = False
         self.last_mouse_pos = (0, 0)
+        self.show_debug = True  # Draw the gravity/air range rings around planets (F3 toggles)
         
         # Zoom limits - allow much more zoom out for bigger map
         self.min_zoom = 0.05
@@ -537,7 +786,8 @@ class MusicSelector:
             screen.blit(name_text, name_rect)
 
 class Particle:
-    def __init__(self, x: float, y: float, z: float = None, bouncing: bool = False, from_spawner: bool = False):
+    def __init__(self, x: float, y: float, z: float = None, bouncing: bool = False, from_spawner: bool = False,
+                 color: Tuple[int, int, int] = None):
         self.x = x
         self.y = y
         self.z = z if z is not None else random.uniform(0.3, 1.0)  # Depth for parallax
@@ -546,19 +796,27 @@ class Particle:
         speed = random.uniform(0.8, 2.2)  # Slower average speed
         self.vx = math.cos(angle) * speed
         self.vy = math.sin(angle) * speed
-        self.radius = 5  # Bigger particles
+        self.radius = PARTICLE_RADIUS  # Bigger particles
         self.mass = 1
         self.alive = True
         self.bouncing = bouncing
         self.from_spawner = from_spawner  # Track if spawned from user-placed spawner
         
-        # Visual properties
-        if bouncing:
+        # Visual properties (batch spawners pick the colors up front)
+        if color is not None:
+            self.color = color
+        elif bouncing:
             self.color = random.choice([(255, 150, 255), (255, 255, 150), (150, 255, 255)])
         else:
             self.color = random.choice(PARTICLE_COLORS)
-        self.trail = deque(maxlen=8)  # Shorter, cleaner trails
-        self.trail.append((x, y, self.z))
+        # Highlight colors for the bright inner core and center point
+        self.center_color = tuple(min(255, c + 80) for c in self.color)
+        self.core_color = tuple(min(255, c + 120) for c in self.color)
+        # Trail ring buffer: slot trail_head is written next, trail_len slots are filled
+        self.trail = np.empty((TRAIL_LENGTH, 2))
+        self.trail[0] = x, y
+        self.trail_head = 1
+        self.trail_len = 1
         
         # Enhanced glow effect
         self.glow_radius = 12
@@ -572,7 +830,8 @@ class Particle:
         self.fading = False
         self.fade_timer = 0.0
     
-    def update(self, dt: float, planets: List['Planet'], gravity_distance: float = 500.0, air_resistance_intensity: float = 0.5, camera=None, sfx_volume: float = 0.5, walls: List['Wall'] = None):
+    def update(self, dt: float, planets: List['Planet'], gravity_distance: float = 500.0, air_resistance_intensity: float = 0.5, camera=None, sfx_volume: float = 0.5):
+        """Advance one frame; wall bounces are applied afterwards for all particles by bounce_off_walls()"""
         if not self.alive:
             return
         
@@ -586,10 +845,12 @@ class Particle:
         if self.exploding:
             self.explosion_timer -= dt
             # Animate explosion particles
+            spark_step = dt * 20
+            alpha_step = 600 * dt
             for p in self.explosion_particles:
-                p['x'] += p['vx'] * dt * 20
-                p['y'] += p['vy'] * dt * 20
-                p['alpha'] = max(0, p['alpha'] - 600 * dt)
+                p['x'] += p['vx'] * spark_step
+                p['y'] += p['vy'] * spark_step
+                p['alpha'] = max(0, p['alpha'] - alpha_step)
             if self.explosion_timer <= 0:
                 self.alive = False
             return
@@ -600,26 +861,42 @@ class Particle:
                 self.alive = False
             # Do NOT return; keep moving while fading
         
-        # Store current position in trail
-        self.trail.append((self.x, self.y, self.z))
+        # Store current position in trail, only while trails are drawn
+        if camera is None or camera.zoom > 0.4:
+            self.trail[self.trail_head] = self.x, self.y
+            self.trail_head = (self.trail_head + 1) % TRAIL_LENGTH
+            if self.trail_len < TRAIL_LENGTH:
+                self.trail_len += 1
+        else:
+            self.trail_len = 0  # Restart the trail when it comes back into view
         
-        # Apply forces from all planets
+        # Apply forces from all planets; position and velocity live in locals for the loop
+        hypot = math.hypot  # Local binding for the per-planet loop
+        x, y = self.x, self.y
+        vx, vy = self.vx, self.vy
+        radius = self.radius
         for planet in planets:
-            dx = planet.x - self.x
-            dy = planet.y - self.y
-            distance = math.sqrt(dx**2 + dy**2)
+            dx = planet.x - x
+            dy = planet.y - y
+            # Skip the square root for planets too far away to do anything
+            if dx * dx + dy * dy >= planet.reach_sq:
+                continue
+            distance = hypot(dx, dy)
             
             # Check collision with clone orbit zone (before planet collision)
             if (planet.has_clone_orbit and not hasattr(self, '_cloned_from_planet') and 
                 abs(distance - planet.clone_orbit_radius) <= 3):  # Small tolerance for crossing the orbit
-                # Clone this particle
+                # Clone this particle (it spreads this particle's velocity too)
+                self.vx, self.vy = vx, vy
                 self._clone_particle(planet)
+                vx, vy = self.vx, self.vy
                 # Mark this particle as cloned to prevent re-cloning
                 self._cloned_from_planet = planet
             
             # Check collision with planet (more robust detection)
-            collision_distance = planet.radius + self.radius + 2  # Add small buffer
+            collision_distance = planet.radius + radius + 2  # Add small buffer
             if distance < collision_distance:
+                self.vx, self.vy = vx, vy
                 if not self.fading:
                     # Only explode on planet collision, not during fade
                     self.exploding = True
@@ -645,7 +922,7 @@ class Particle:
                 # Mark dead regardless
                 self.alive = False
                 # Always ensure particle collection is triggered and get collision data
-                collision_data = planet.collect_particle(camera, sfx_volume, self.x, self.y)
+                collision_data = planet.collect_particle(camera, sfx_volume, x, y)
                 
                 # Create light ray effect if we have collision data and game reference
                 if collision_data and hasattr(camera, '_game_ref'):
@@ -679,11 +956,9 @@ class Particle:
                 force = base_force * distance_factor
                 
                 if force > 0:  # Only apply if there's any force left
-                    force_x = (dx / distance) * force
-                    force_y = (dy / distance) * force
-                    
-                    self.vx += force_x
-                    self.vy += force_y
+                    force_scale = force / distance  # One division normalises both components
+                    vx += dx * force_scale
+                    vy += dy * force_scale
                     
                     # Mark that this particle is being affected by gravity
                     affected_by_gravity = True
@@ -704,44 +979,20 @@ class Particle:
                     base_resistance = 0.015 * planet.air_resistance_intensity  # Use planet's individual air resistance
                     air_resistance = base_resistance * air_strength
                     
-                    # Apply resistance opposite to velocity
-                    speed = math.sqrt(self.vx**2 + self.vy**2)
-                    if speed > 0:
-                        resistance_x = -(self.vx / speed) * air_resistance * speed
-                        resistance_y = -(self.vy / speed) * air_resistance * speed
-                        
-                        self.vx += resistance_x
-                        self.vy += resistance_y
+                    # Apply resistance opposite to velocity (a drag proportional to speed)
+                    damping = 1.0 - air_resistance
+                    vx *= damping
+                    vy *= damping
+        
+        self.vx, self.vy = vx, vy
         
         # Age the particle only if it's NOT being affected by gravity
         if not affected_by_gravity:
             self.age += dt
         
         # Update position
-        self.x += self.vx
-        self.y += self.vy
-        
-        # Check collision with walls
-        if walls:
-            for wall in walls:
-                collision, nx, ny = wall.check_collision(self.x, self.y, self.radius)
-                if collision:
-                    # Bounce off wall
-                    # Calculate dot product of velocity with wall normal
-                    dot_product = self.vx * nx + self.vy * ny
-                    
-                    # Reflect velocity
-                    self.vx -= 2 * dot_product * nx
-                    self.vy -= 2 * dot_product * ny
-                    
-                    # Apply some energy loss
-                    self.vx *= 0.8
-                    self.vy *= 0.8
-                    
-                    # Move particle slightly away from wall to prevent sticking
-                    self.x += nx * (self.radius + 1)
-                    self.y += ny * (self.radius + 1)
-                    break
+        self.x = x + vx
+        self.y = y + vy
         
         # Remove particles that go extremely far away from the world center
         # Use a very large boundary so fading particles keep moving visibly
@@ -753,7 +1004,7 @@ class Particle:
     def _clone_particle(self, planet):
         """Clone this particle and add velocity spread"""
         # Calculate the orthogonal direction to current velocity
-        velocity_magnitude = math.sqrt(self.vx**2 + self.vy**2)
+        velocity_magnitude = math.hypot(self.vx, self.vy)
         if velocity_magnitude == 0:
             return  # Can't spread zero velocity
         
@@ -806,18 +1057,21 @@ class Particle:
         return 255
     
     def draw(self, screen, camera, planets=None):
+        zoom = camera.zoom
+        screen_width = camera.screen_width
+        screen_height = camera.screen_height
         if not self.alive:
             return
         
         # Simple world-to-screen conversion (no parallax)
         screen_x, screen_y = camera.world_to_screen(self.x, self.y)
         margin = 50
-        if (screen_x < -margin or screen_x > camera.screen_width + margin or 
-            screen_y < -margin or screen_y > camera.screen_height + margin):
+        if (screen_x < -margin or screen_x > screen_width + margin or 
+            screen_y < -margin or screen_y > screen_height + margin):
             return
         
         # Better scaling - ensure particles are visible when zoomed out
-        raw_scaled_radius = self.radius * camera.zoom
+        raw_scaled_radius = self.radius * zoom
         if raw_scaled_radius < 0.5:
             scaled_radius = 3  # Minimum 3 pixels when extremely zoomed out for better visibility
         elif raw_scaled_radius < 1.5:
@@ -833,13 +1087,13 @@ class Particle:
         if self.exploding:
             for p in self.explosion_particles:
                 px, py = camera.world_to_screen(p['x'], p['y'])
-                if 0 <= px < camera.screen_width and 0 <= py < camera.screen_height:
+                if 0 <= px < screen_width and 0 <= py < screen_height:
                     color = (*p['color'][:3], min(255, int(p['alpha'])))
                     pygame.draw.circle(screen, color[:3], (int(px), int(py)), max(1, p['radius']))
             return
         
         # Enhanced multi-layer aura effect - FULL QUALITY RESTORED
-        if camera.zoom > 0.2 and scaled_radius > 1:  # Show at all zoom levels
+        if zoom > 0.2 and scaled_radius > 1:  # Show at all zoom levels
             # Create multiple glow layers for satisfying aura
             aura_layers = [
                 (scaled_radius * 2.5, alpha * 0.2),  # Outer glow
@@ -850,22 +1104,22 @@ class Particle:
             for aura_radius, aura_alpha in aura_layers:
                 if aura_alpha > 3:
                     aura_size = max(2, int(aura_radius))
-                    glow_surf = pygame.Surface((aura_size * 2, aura_size * 2), pygame.SRCALPHA)
-                    glow_color = (*self.color, max(8, int(aura_alpha)))
-                    pygame.draw.circle(glow_surf, glow_color, (aura_size, aura_size), aura_size)
+                    glow_surf = get_glow_sprite(self.color, aura_size, max(8, int(aura_alpha)))
                     screen.blit(glow_surf, (int(screen_x - aura_size), int(screen_y - aura_size)))
         
         # Enhanced trail rendering with fade effects - FULL QUALITY
-        if len(self.trail) > 2 and camera.zoom > 0.4:  # Show trails at all zoom levels
-            trail_points = list(self.trail)  # Use all trail points for full quality
+        if self.trail_len > 2 and zoom > 0.4:  # Show trails at all zoom levels
+            # Oldest point first, projected to the screen in one array pass
+            trail_points = np.roll(self.trail, -self.trail_head, axis=0)[TRAIL_LENGTH - self.trail_len:]
+            trail_screen = ((trail_points - (camera.x, camera.y)) * zoom
+                            + (screen_width // 2, screen_height // 2)).astype(np.int64).tolist()
             
             for i in range(len(trail_points) - 1):
-                tx, ty, tz = trail_points[i]
-                trail_screen_x, trail_screen_y = camera.world_to_screen(tx, ty)
+                trail_screen_x, trail_screen_y = trail_screen[i]
                 
                 # Check if trail point is on screen
-                if (-20 <= trail_screen_x <= camera.screen_width + 20 and 
-                    -20 <= trail_screen_y <= camera.screen_height + 20):
+                if (-20 <= trail_screen_x <= screen_width + 20 and 
+                    -20 <= trail_screen_y <= screen_height + 20):
                     
                     # Enhanced fade effects based on particle state
                     base_trail_alpha = alpha * (i + 1) / len(trail_points) * 0.8  # Stronger trails
@@ -883,37 +1137,38 @@ class Particle:
                     trail_alpha = int(base_trail_alpha)
                     if trail_alpha > 8:
                         trail_size = max(1, int(scaled_radius * 0.8 * (i + 1) / len(trail_points)))
-                        trail_color = (*self.color, trail_alpha)
                         
                         # Add glow to trail points for extra visual appeal
-                        if trail_size > 1 and camera.zoom > 1.0:
+                        if trail_size > 1 and zoom > 1.0:
                             glow_size = trail_size + 2
                             glow_alpha = max(3, trail_alpha // 3)
-                            glow_surf = pygame.Surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA)
-                            pygame.draw.circle(glow_surf, (*self.color, glow_alpha), (glow_size, glow_size), glow_size)
+                            glow_surf = get_glow_sprite(self.color, glow_size, glow_alpha)
                             screen.blit(glow_surf, (int(trail_screen_x - glow_size), int(trail_screen_y - glow_size)))
                         
-                        pygame.draw.circle(screen, trail_color[:3], (int(trail_screen_x), int(trail_screen_y)), trail_size)
+                        pygame.draw.circle(screen, self.color, (int(trail_screen_x), int(trail_screen_y)), trail_size)
         
         # Draw main particle with enhanced appearance
-        main_color = (*self.color, alpha)
-        pygame.draw.circle(screen, main_color[:3], (int(screen_x), int(screen_y)), scaled_radius)
+        center = (int(screen_x), int(screen_y))
+        pygame.draw.circle(screen, self.color, center, scaled_radius)
         
         # Add bright center with gradient effect
         if scaled_radius > 1:
             # Bright inner core
-            center_color = tuple(min(255, c + 80) for c in self.color)
             center_radius = max(1, int(scaled_radius * 0.6))
-            pygame.draw.circle(screen, center_color, (int(screen_x), int(screen_y)), center_radius)
+            pygame.draw.circle(screen, self.center_color, center, center_radius)
             
             # Very bright center point
             if scaled_radius > 2:
-                core_color = tuple(min(255, c + 120) for c in self.color)
                 core_radius = max(1, int(scaled_radius * 0.3))
-                pygame.draw.circle(screen, core_color, (int(screen_x), int(screen_y)), core_radius)
+                pygame.draw.circle(screen, self.core_color, center, core_radius)
 
 class DwarfPlanet:
     """A smaller, cheaper version of Planet with reduced capabilities"""
+    # Collection counter bounce: duration in seconds (and its inverse) and peak extra scale
+    COUNTER_BOUNCE_DURATION = 0.3
+    COUNTER_BOUNCE_RATE = 1.0 / COUNTER_BOUNCE_DURATION
+    COUNTER_BOUNCE_AMPLITUDE = 0.3
+    
     def __init__(self, x: float, y: float, radius: float = 18):  # Much smaller than regular planets (48)
         self.x = x
         self.y = y
@@ -934,10 +1189,11 @@ class DwarfPlanet:
         self.has_clone_orbit = False
         self.clone_orbit_radius = 0
         self.clone_orbit_cost = 999999  # Effectively disabled
+        self._refresh_reach()
         
         # Visual properties - smaller and more basic
-        self.planet_type = {"name": "Dwarf", "color": (139, 90, 43), "has_rings": False, "has_spots": False}  # Brown dwarf
-        self.color = self.planet_type["color"]
+        self.planet_type = PlanetType("Dwarf", (139, 90, 43), False, False)  # Brown dwarf
+        self.color = self.planet_type.color
         self.has_rings = False
         self.has_spots = False
         self.spots = []
@@ -958,12 +1214,13 @@ class DwarfPlanet:
         
         # Grow dwarf planet size
         self.radius *= growth_factor
+        self._refresh_reach()
         
         # Increase gravity properties
         self.mass *= gravity_factor
         
         # Smaller bounce effect
-        self.counter_bounce_timer = 0.3  # Shorter bounce
+        self.counter_bounce_timer = self.COUNTER_BOUNCE_DURATION  # Shorter bounce
         self.counter_bounce_scale = 1.0
         
         # Return collision data for light ray effect
@@ -972,7 +1229,7 @@ class DwarfPlanet:
             # Calculate collision point on planet surface
             dx = px - self.x
             dy = py - self.y
-            distance = math.sqrt(dx*dx + dy*dy)
+            distance = math.hypot(dx, dy)
             if distance > 0:
                 # Normalize and scale to planet surface
                 surface_x = self.x + (dx / distance) * self.radius
@@ -983,6 +1240,10 @@ class DwarfPlanet:
                 
         return collision_data
         
+    def _refresh_reach(self):
+        """Cache the squared planet_reach for particles; call after radius or gravity distance change"""
+        self.reach_sq = planet_reach(self, PARTICLE_RADIUS) ** 2
+        
     def upgrade_gravity(self):
         """Upgrade gravity (limited for dwarf planets)"""
         if self.gravity_level < 3:  # Max level 3 instead of 5
@@ -1006,11 +1267,9 @@ class DwarfPlanet:
         """Update dwarf planet animations (simplified)"""
         if self.counter_bounce_timer > 0:
             self.counter_bounce_timer -= dt
-            progress = 1.0 - (self.counter_bounce_timer / 0.3)  # Shorter duration
-            if progress < 0.5:
-                self.counter_bounce_scale = 1.0 + (progress * 2) * 0.3  # Smaller bounce
-            else:
-                self.counter_bounce_scale = 1.3 - ((progress - 0.5) * 2) * 0.3
+            progress = 1.0 - self.counter_bounce_timer * self.COUNTER_BOUNCE_RATE  # Shorter duration
+            # Triangle wave: up to the peak at half way, then back down (smaller bounce)
+            self.counter_bounce_scale = 1.0 + self.COUNTER_BOUNCE_AMPLITUDE * (1.0 - abs(2.0 * progress - 1.0))
             
             if self.counter_bounce_timer <= 0:
                 self.counter_bounce_scale = 1.0
@@ -1024,13 +1283,13 @@ class DwarfPlanet:
     def draw(self, screen, camera, gravity_distance: float = None, air_resistance_intensity: float = None):
         """Draw the dwarf planet (simplified)"""
         # Basic position with small wobble
-        wobble_x = math.sin(self.wobble_timer) * 1 if self.wobble_timer > 0 else 0
-        wobble_y = math.cos(self.wobble_timer * 1.3) * 1 if self.wobble_timer > 0 else 0
         screen_x, screen_y = camera.world_to_screen(self.x, self.y)
-        screen_x += wobble_x
-        screen_y += wobble_y
+        hovered = self.wobble_timer > 0
+        if hovered:
+            screen_x += math.sin(self.wobble_timer)
+            screen_y += math.cos(self.wobble_timer * 1.3)
         
-        hover_scale = 1.1 if self.wobble_timer > 0 else 1.0  # Smaller hover effect
+        hover_scale = 1.1 if hovered else 1.0  # Smaller hover effect
         
         if camera.is_map_mode():
             map_mode_scale = 0.5
@@ -1045,14 +1304,15 @@ class DwarfPlanet:
             return
         
         # Simple planet drawing - no fancy effects
-        pygame.draw.circle(screen, self.color, (int(screen_x), int(screen_y)), scaled_radius)
+        center = (int(screen_x), int(screen_y))
+        pygame.draw.circle(screen, self.color, center, scaled_radius)
         
         # Simple highlight if hovered
-        if self.wobble_timer > 0:
-            pygame.draw.circle(screen, (200, 200, 200), (int(screen_x), int(screen_y)), scaled_radius, 2)
+        if hovered:
+            pygame.draw.circle(screen, (200, 200, 200), center, scaled_radius, 2)
         
         # Simple outline
-        pygame.draw.circle(screen, WHITE, (int(screen_x), int(screen_y)), scaled_radius, 1)
+        pygame.draw.circle(screen, WHITE, center, scaled_radius, 1)
     
     def draw_preview(self, screen, x, y, size):
         """Draw a small preview of the dwarf planet for the UI"""
@@ -1063,6 +1323,14 @@ class DwarfPlanet:
         pygame.draw.circle(screen, WHITE, (x, y), size, 1)
 
 class Planet:
+    # Collection counter bounce: duration in seconds (and its inverse) and peak extra scale
+    COUNTER_BOUNCE_DURATION = 0.5
+    COUNTER_BOUNCE_RATE = 1.0 / COUNTER_BOUNCE_DURATION
+    COUNTER_BOUNCE_AMPLITUDE = 0.5
+    # Ring radii as multiples of the drawn planet radius
+    RING_INNER_RADIUS = 1.4
+    RING_OUTER_RADIUS = 1.6
+    
     def __init__(self, x: float, y: float, radius: float = 48):  # 4x bigger than original (12 * 4 = 48)
         self.x = x
         self.y = y
@@ -1084,14 +1352,18 @@ class Planet:
         self.has_clone_orbit = False
         self.clone_orbit_radius = self.radius * 4  # Default clone orbit distance
         self.clone_orbit_cost = 150  # Cost to add clone orbit
+        self._refresh_reach()
         
         # Visual properties
         self.planet_type = random.choice(PLANET_TYPES)
-        self.color = self.planet_type["color"]
-        self.has_rings = self.planet_type["rings"]
-        self.has_spots = self.planet_type["spots"]
+        self.color = self.planet_type.color
+        self.has_rings = self.planet_type.rings
+        self.has_spots = self.planet_type.spots
         if self.has_spots:
             self.spots = [(random.uniform(-0.8, 0.8), random.uniform(-0.8, 0.8)) for _ in range(random.randint(2, 5))]
+            # Spot offsets from the centre per pixel of radius, moved to screen space in one pass
+            self._spot_offsets = np.array(self.spots, np.float32) * np.float32(0.7)
+        self._refresh_colors()
         
         # Animation properties
         self.counter_bounce_timer = 0
@@ -1100,6 +1372,12 @@ class Planet:
         self.shimmer_intensity = 0
         self.wobble_timer = 0  # For hover wobble effect
         
+        # Rendered labels, re-rendered only when their (value, font size) key changes
+        self._count_text_key = None
+        self._count_text = None
+        self._level_text_key = None
+        self._level_text = None
+        
     def collect_particle(self, camera=None, sfx_volume=0.5, px=None, py=None):
         self.particles_collected += 1
         
@@ -1117,10 +1395,11 @@ class Planet:
         
         # Update clone orbit radius to match planet growth
         self.clone_orbit_radius = self.radius * 4
+        self._refresh_reach()
         
         # Trigger bounce animation
-        self.counter_bounce_timer = 0.5  # Animation duration
-        self.counter_bounce_scale = 1.5  # Scale up
+        self.counter_bounce_timer = self.COUNTER_BOUNCE_DURATION  # Animation duration
+        self.counter_bounce_scale = 1.0 + self.COUNTER_BOUNCE_AMPLITUDE  # Scale up
         # Trigger shimmer effect
         self.shimmer_timer = 0.3  # Shimmer duration
         self.shimmer_intensity = 1.0  # Full intensity
@@ -1131,7 +1410,7 @@ class Planet:
             # Calculate collision point on planet surface
             dx = px - self.x
             dy = py - self.y
-            distance = math.sqrt(dx*dx + dy*dy)
+            distance = math.hypot(dx, dy)
             if distance > 0:
                 # Normalize and scale to planet surface
                 surface_x = self.x + (dx / distance) * self.radius
@@ -1144,18 +1423,25 @@ class Planet:
         if camera and px is not None and py is not None:
             dx = px - camera.x
             dy = py - camera.y
-            distance = math.sqrt(dx*dx + dy*dy)
+            distance = math.hypot(dx, dy)
             base_volume = max(0.05, 1.0 / (distance / 400 + 1))
             final_volume = base_volume * sfx_volume
             try:
-                sound = generate_catch_sound()
-                sound.set_volume(min(0.5, final_volume))
-                sound.play()
+                play_catch_sound(min(0.5, final_volume))
             except pygame.error:
                 pass
                 
         return collision_data  # Sound system not available or failed
     
+    def _refresh_colors(self):
+        """Derive the spot and ring shades from self.color (call whenever the color changes)"""
+        self.spot_color = tuple(max(0, c - 40) for c in self.color)
+        self.ring_color = tuple(c // 2 for c in self.color)
+    
+    def _refresh_reach(self):
+        """Cache the squared planet_reach for particles; call after radius, gravity distance or clone orbit change"""
+        self.reach_sq = planet_reach(self, PARTICLE_RADIUS) ** 2
+    
     def upgrade_gravity(self):
         """Upgrade the planet's gravity strength, distance, and air resistance"""
         self.gravity_level += 1
@@ -1165,6 +1451,7 @@ class Planet:
         
         # Increase gravity distance
         self.gravity_distance = self.base_gravity_distance * (1 + (self.gravity_level - 1) * 0.3)  # 30% increase per level
+        self._refresh_reach()
         
         # Increase air resistance intensity
         self.air_resistance_intensity = self.base_air_resistance_intensity * (1 + (self.gravity_level - 1) * 0.4)  # 40% increase per level
@@ -1176,10 +1463,12 @@ class Planet:
             # Stronger planets get a different color
             intensity = min(255, 100 + (self.gravity_level - 1) * 20)
             self.color = (intensity, 149, 237)
+            self._refresh_colors()
     
     def upgrade_clone_orbit(self):
         """Add clone orbit zone to the planet"""
         self.has_clone_orbit = True
+        self._refresh_reach()
         # Increase cost for potential future upgrades
         self.clone_orbit_cost = int(self.clone_orbit_cost * 1.5)
     
@@ -1197,14 +1486,9 @@ class Planet:
         """Update planet animations"""
         if self.counter_bounce_timer > 0:
             self.counter_bounce_timer -= dt
-            # Bounce animation: scale up then down
-            progress = 1.0 - (self.counter_bounce_timer / 0.5)
-            if progress < 0.5:
-                # Scale up phase
-                self.counter_bounce_scale = 1.0 + (progress * 2) * 0.5
-            else:
-                # Scale down phase
-                self.counter_bounce_scale = 1.5 - ((progress - 0.5) * 2) * 0.5
+            # Bounce animation: scale up then down, a triangle wave peaking half way through
+            progress = 1.0 - self.counter_bounce_timer * self.COUNTER_BOUNCE_RATE
+            self.counter_bounce_scale = 1.0 + self.COUNTER_BOUNCE_AMPLITUDE * (1.0 - abs(2.0 * progress - 1.0))
             
             if self.counter_bounce_timer <= 0:
                 self.counter_bounce_scale = 1.0
@@ -1225,104 +1509,92 @@ class Planet:
             self.wobble_timer = 0
         
     def draw(self, screen, camera, gravity_distance: float = None, air_resistance_intensity: float = None):
+        map_mode = camera.is_map_mode()
+        zoom = camera.zoom
         # Convert world position to screen position with wobble effect
-        wobble_x = math.sin(self.wobble_timer) * 2 if self.wobble_timer > 0 else 0
-        wobble_y = math.cos(self.wobble_timer * 1.3) * 2 if self.wobble_timer > 0 else 0
         screen_x, screen_y = camera.world_to_screen(self.x, self.y)
-        screen_x += wobble_x
-        screen_y += wobble_y
+        hovered = self.wobble_timer > 0
+        if hovered:
+            screen_x += math.sin(self.wobble_timer) * 2
+            screen_y += math.cos(self.wobble_timer * 1.3) * 2
         
         # Scale radius with zoom and hover effect
-        hover_scale = 1.15 if self.wobble_timer > 0 else 1.0  # 15% bigger when hovered
+        hover_scale = 1.15 if hovered else 1.0  # 15% bigger when hovered
         
-        if camera.is_map_mode():
+        if map_mode:
             # In map mode, planets are 0.5x size (smaller for overview)
             map_mode_scale = 0.5  # Make planets half size in map mode
             scaled_radius = max(4, int(self.radius * map_mode_scale * hover_scale))
             air_radius = max(6, int(self.radius * 3 * map_mode_scale * hover_scale))
         else:
             # Normal mode - scale with camera zoom
-            scaled_radius = max(2, int(self.radius * camera.zoom * hover_scale))
-            air_radius = max(4, int(self.radius * 3 * camera.zoom * hover_scale))
+            scaled_radius = max(2, int(self.radius * zoom * hover_scale))
+            air_radius = max(4, int(self.radius * 3 * zoom * hover_scale))
         
         # Only draw if planet is visible on screen
         margin = air_radius + 50
         if (screen_x < -margin or screen_x > camera.screen_width + margin or 
             screen_y < -margin or screen_y > camera.screen_height + margin):
             return
+        center_x, center_y = int(screen_x), int(screen_y)
+        center = (center_x, center_y)
         
         # Draw atmospheric area (air resistance zone) - optimized for performance
         # Extend atmosphere visibility range and limit size to prevent lag
-        if camera.zoom > 0.4 and camera.zoom < 8.0 and air_radius > 4 and air_radius < 300:
-            # Use direct drawing instead of creating surfaces for better performance
-            # Draw multiple concentric circles with decreasing alpha for atmosphere effect
-            for i in range(3):
-                atmo_radius = air_radius - (i * air_radius // 4)
-                if atmo_radius > 2:
-                    alpha = max(5, 15 - (i * 5))  # Decreasing alpha: 15, 10, 5
-                    # Use pygame.gfxdraw for better alpha blending performance
-                    if HAS_GFXDRAW:
-                        pygame.gfxdraw.filled_circle(screen, int(screen_x), int(screen_y), atmo_radius, (100, 150, 255, alpha))
-                    else:
-                        # Fallback to regular circle if gfxdraw not available
-                        atmo_surf = pygame.Surface((atmo_radius * 2, atmo_radius * 2), pygame.SRCALPHA)
-                        pygame.draw.circle(atmo_surf, (100, 150, 255, alpha), (atmo_radius, atmo_radius), atmo_radius)
-                        screen.blit(atmo_surf, (screen_x - atmo_radius, screen_y - atmo_radius))
+        if zoom > 0.4 and zoom < 8.0 and air_radius > 4 and air_radius < 300:
+            # Concentric circles with decreasing alpha, pre-composited into one cached sprite
+            screen.blit(get_atmosphere_sprite(air_radius), (center_x - air_radius, center_y - air_radius))
 
         # Debug rings for gravity and air resistance ranges - disable when heavily zoomed in
-        if camera.zoom > 0.15 and camera.zoom < 4.0:
+        if camera.show_debug and 0.15 < zoom < 4.0:
             # Gravity max distance ring
-            grav_r = max(1, int(self.gravity_distance * camera.zoom))
+            grav_r = max(1, int(self.gravity_distance * zoom))
             if grav_r > 3:  # Only draw if large enough to be visible
                 grav_surf = pygame.Surface((grav_r * 2 + 4, grav_r * 2 + 4), pygame.SRCALPHA)
                 pygame.draw.circle(grav_surf, (0, 255, 0, 80), (grav_r + 2, grav_r + 2), grav_r, 2)
-                screen.blit(grav_surf, (screen_x - grav_r - 2, screen_y - grav_r - 2))
+                screen.blit(grav_surf, (center_x - grav_r - 2, center_y - grav_r - 2))
                 
                 # Gravity fade zone outer ring (+200)
-                outer_r = max(grav_r + int(200 * camera.zoom), grav_r + 1)
+                outer_r = max(grav_r + int(200 * zoom), grav_r + 1)
                 if outer_r > grav_r + 2:  # Only draw if significantly larger
                     outer_surf = pygame.Surface((outer_r * 2 + 4, outer_r * 2 + 4), pygame.SRCALPHA)
                     pygame.draw.circle(outer_surf, (0, 255, 0, 40), (outer_r + 2, outer_r + 2), outer_r, 1)
-                    screen.blit(outer_surf, (screen_x - outer_r - 2, screen_y - outer_r - 2))
+                    screen.blit(outer_surf, (center_x - outer_r - 2, center_y - outer_r - 2))
             
             # Air resistance ring (same radius as gravity range in this model)
-            air_r = max(1, int(self.gravity_distance * camera.zoom))
+            air_r = max(1, int(self.gravity_distance * zoom))
             if air_r > 3:  # Only draw if large enough to be visible
                 air_surf = pygame.Surface((air_r * 2 + 4, air_r * 2 + 4), pygame.SRCALPHA)
                 # Color intensity reflects planet's air resistance value
                 air_alpha = int(50 + 150 * min(1.0, max(0.0, self.air_resistance_intensity)))
                 pygame.draw.circle(air_surf, (100, 150, 255, air_alpha), (air_r + 2, air_r + 2), air_r, 1)
-                screen.blit(air_surf, (screen_x - air_r - 2, screen_y - air_r - 2))
+                screen.blit(air_surf, (center_x - air_r - 2, center_y - air_r - 2))
             
             # Clone orbit ring - bright purple/magenta ring
             if self.has_clone_orbit:
-                clone_r = max(1, int(self.clone_orbit_radius * camera.zoom))
+                clone_r = max(1, int(self.clone_orbit_radius * zoom))
                 if clone_r > 2:  # Only draw if large enough to be visible
                     clone_surf = pygame.Surface((clone_r * 2 + 4, clone_r * 2 + 4), pygame.SRCALPHA)
-                    pygame.draw.circle(clone_surf, (255, 0, 255, 180), (clone_r + 2, clone_r + 2), clone_r, max(1, int(2 * camera.zoom)))
-                    screen.blit(clone_surf, (screen_x - clone_r - 2, screen_y - clone_r - 2))
+                    pygame.draw.circle(clone_surf, (255, 0, 255, 180), (clone_r + 2, clone_r + 2), clone_r, max(1, int(2 * zoom)))
+                    screen.blit(clone_surf, (center_x - clone_r - 2, center_y - clone_r - 2))
 
         # DEBUG visualization rings: gravity and air resistance ranges are handled above
         
         # Draw planet base
-        pygame.draw.circle(screen, self.color, (screen_x, screen_y), scaled_radius)
+        pygame.draw.circle(screen, self.color, center, scaled_radius)
         
         # Draw spots if planet has them
-        if self.has_spots and camera.zoom > 0.3:
-            spot_color = tuple(max(0, c - 40) for c in self.color)
-            for spot_x, spot_y in self.spots:
-                spot_screen_x = screen_x + int(spot_x * scaled_radius * 0.7)
-                spot_screen_y = screen_y + int(spot_y * scaled_radius * 0.7)
-                spot_radius = max(1, int(scaled_radius * 0.15))
-                pygame.draw.circle(screen, spot_color, (spot_screen_x, spot_screen_y), spot_radius)
+        if self.has_spots and zoom > 0.3:
+            spot_radius = max(1, int(scaled_radius * 0.15))
+            for offset_x, offset_y in (self._spot_offsets * scaled_radius).astype(np.int32).tolist():
+                pygame.draw.circle(screen, self.spot_color, (center_x + offset_x, center_y + offset_y), spot_radius)
         
         # Draw rings if planet has them
-        if self.has_rings and camera.zoom > 0.2:
-            ring_radius1 = int(scaled_radius * 1.4)
-            ring_radius2 = int(scaled_radius * 1.6)
-            ring_color = tuple(c // 2 for c in self.color)
-            pygame.draw.circle(screen, ring_color, (screen_x, screen_y), ring_radius2, max(1, int(3 * camera.zoom)))
-            pygame.draw.circle(screen, ring_color, (screen_x, screen_y), ring_radius1, max(1, int(2 * camera.zoom)))
+        if self.has_rings and zoom > 0.2:
+            ring_radius1 = int(scaled_radius * self.RING_INNER_RADIUS)
+            ring_radius2 = int(scaled_radius * self.RING_OUTER_RADIUS)
+            pygame.draw.circle(screen, self.ring_color, center, ring_radius2, max(1, int(3 * zoom)))
+            pygame.draw.circle(screen, self.ring_color, center, ring_radius1, max(1, int(2 * zoom)))
         
         # Draw planet outline
         outline_color = WHITE
@@ -1330,39 +1602,41 @@ class Planet:
             # Add shimmer effect - bright white outline
             shimmer_alpha = int(255 * self.shimmer_intensity)
             outline_color = (255, 255, 255)
-            # Draw additional shimmer glow
-            shimmer_surf = pygame.Surface((scaled_radius*4, scaled_radius*4), pygame.SRCALPHA)
-            shimmer_color = (*outline_color, shimmer_alpha // 2)
-            pygame.draw.circle(shimmer_surf, shimmer_color, (scaled_radius*2, scaled_radius*2), scaled_radius*2)
-            screen.blit(shimmer_surf, (screen_x - scaled_radius*2, screen_y - scaled_radius*2))
+            # Draw additional shimmer glow (a cached glow sprite, not a new surface each frame)
+            shimmer_surf = get_glow_sprite(outline_color, scaled_radius*2, shimmer_alpha // 2)
+            screen.blit(shimmer_surf, (center_x - scaled_radius*2, center_y - scaled_radius*2))
         
-        pygame.draw.circle(screen, outline_color, (screen_x, screen_y), scaled_radius, max(1, int(2 * camera.zoom)))
+        pygame.draw.circle(screen, outline_color, center, scaled_radius, max(1, int(2 * zoom)))
         
         # Draw collection count and gravity level (always visible in map mode, otherwise when zoomed in enough)
-        if camera.is_map_mode() or camera.zoom > 0.2:
-            if camera.is_map_mode():
+        if map_mode or zoom > 0.2:
+            if map_mode:
                 # Fixed font sizes for map mode
                 font_size = 16
                 small_font_size = 12
             else:
                 # Zoom-based font sizes for normal mode
-                font_size = max(12, int(20 * camera.zoom))
-                small_font_size = max(10, int(16 * camera.zoom))
-            
-            font = pygame.font.Font(None, font_size)
-            small_font = pygame.font.Font(None, small_font_size)
+                font_size = max(12, int(20 * zoom))
+                small_font_size = max(10, int(16 * zoom))
             
             # Particles collected (with bounce animation)
             bounce_font_size = int(font_size * self.counter_bounce_scale)
-            bounce_font = pygame.font.Font(None, bounce_font_size)
-            text = bounce_font.render(str(self.particles_collected), True, WHITE)
-            text_rect = text.get_rect(center=(screen_x, screen_y - int(3 * camera.zoom)))
+            count_key = (self.particles_collected, bounce_font_size)
+            if count_key != self._count_text_key:
+                self._count_text = get_font(bounce_font_size).render(str(self.particles_collected), True, WHITE)
+                self._count_text_key = count_key
+            text = self._count_text
+            text_rect = text.get_rect(center=(center_x, center_y - int(3 * zoom)))
             screen.blit(text, text_rect)
             
             # Gravity level indicator
             if self.gravity_level > 1:
-                level_text = small_font.render(f"G{self.gravity_level}", True, YELLOW)
-                level_rect = level_text.get_rect(center=(screen_x, screen_y + int(8 * camera.zoom)))
+                level_key = (self.gravity_level, small_font_size)
+                if level_key != self._level_text_key:
+                    self._level_text = get_font(small_font_size).render(f"G{self.gravity_level}", True, YELLOW)
+                    self._level_text_key = level_key
+                level_text = self._level_text
+                level_rect = level_text.get_rect(center=(center_x, center_y + int(8 * zoom)))
                 screen.blit(level_text, level_rect)
     
     def draw_preview(self, screen, x, y, size):
@@ -1372,20 +1646,18 @@ class Planet:
         
         # Draw spots
         if self.has_spots:
-            spot_color = tuple(max(0, c - 40) for c in self.color)
             for spot_x, spot_y in self.spots[:3]:  # Only show first 3 spots
                 spot_screen_x = x + int(spot_x * size * 0.7)
                 spot_screen_y = y + int(spot_y * size * 0.7)
                 spot_radius = max(1, int(size * 0.15))
-                pygame.draw.circle(screen, spot_color, (spot_screen_x, spot_screen_y), spot_radius)
+                pygame.draw.circle(screen, self.spot_color, (spot_screen_x, spot_screen_y), spot_radius)
         
         # Draw rings
         if self.has_rings:
-            ring_radius1 = int(size * 1.4)
-            ring_radius2 = int(size * 1.6)
-            ring_color = tuple(c // 2 for c in self.color)
-            pygame.draw.circle(screen, ring_color, (x, y), ring_radius2, 2)
-            pygame.draw.circle(screen, ring_color, (x, y), ring_radius1, 1)
+            ring_radius1 = int(size * self.RING_INNER_RADIUS)
+            ring_radius2 = int(size * self.RING_OUTER_RADIUS)
+            pygame.draw.circle(screen, self.ring_color, (x, y), ring_radius2, 2)
+            pygame.draw.circle(screen, self.ring_color, (x, y), ring_radius1, 1)
         
         # Draw outline with shimmer
         outline_color = WHITE
@@ -1394,13 +1666,67 @@ class Planet:
             shimmer_alpha = int(255 * self.shimmer_intensity)
             outline_color = (255, 255, 255)
             # Draw shimmer glow around preview
-            shimmer_surf = pygame.Surface((size*4, size*4), pygame.SRCALPHA)
-            shimmer_color = (*outline_color, shimmer_alpha // 3)
-            pygame.draw.circle(shimmer_surf, shimmer_color, (size*2, size*2), size*2)
+            shimmer_surf = get_glow_sprite(outline_color, size*2, shimmer_alpha // 3)
             screen.blit(shimmer_surf, (x - size*2, y - size*2))
         
         pygame.draw.circle(screen, outline_color, (x, y), size, 1)
 
+def planet_reach(planet, particle_radius: float) -> float:
+    """Furthest distance at which a planet affects a particle: the end of the 200-unit
+    gravity and air fade zone, the collision distance or the clone orbit band"""
+    reach = max(planet.gravity_distance + 200, planet.radius + particle_radius + 2)
+    if planet.has_clone_orbit:
+        reach = max(reach, planet.clone_orbit_radius + 3)
+    return reach
+
+# Screen-space slack over a planet's atmosphere when culling: the 50px draw margin,
+# the minimum map-mode atmosphere, the hover wobble and integer rounding
+PLANET_CULL_MARGIN = 60
+
+def visible_planets(camera, planets) -> list:
+    """Planets whose atmosphere (grown by the 15% hover scale) may reach the screen,
+    tested in one array pass. A superset of what the draw methods' own margin checks keep."""
+    if not planets:
+        return []
+    count = len(planets)
+    planet_x = np.fromiter((p.x for p in planets), np.float64, count)
+    planet_y = np.fromiter((p.y for p in planets), np.float64, count)
+    planet_r = np.fromiter((p.radius for p in planets), np.float64, count)
+    scale = 0.5 if camera.is_map_mode() else camera.zoom  # Map mode draws planets at half size
+    reach = planet_r * (3 * 1.15 * scale) + PLANET_CULL_MARGIN
+    sx = (planet_x - camera.x) * camera.zoom + camera.screen_width // 2
+    sy = (planet_y - camera.y) * camera.zoom + camera.screen_height // 2
+    shown = ((sx >= -reach) & (sx <= camera.screen_width + reach)
+             & (sy >= -reach) & (sy <= camera.screen_height + reach))
+    return [planet for planet, keep in zip(planets, shown.tolist()) if keep]
+
+class PlanetGrid:
+    """Uniform grid over the planets, rebuilt every frame. Cells are as wide as the
+    furthest planet reach, so every planet that can affect a particle is in the 3x3
+    cells around it."""
+    def __init__(self, planets: List['Planet'], particle_radius: float = PARTICLE_RADIUS):
+        self.cell_size = max((planet_reach(planet, particle_radius) for planet in planets), default=1.0)
+        self.cells = {}
+        for index, planet in enumerate(planets):
+            cell = (int(planet.x // self.cell_size), int(planet.y // self.cell_size))
+            self.cells.setdefault(cell, []).append((index, planet))
+        self._nearby = {}  # cell -> planets around it, filled on first use
+
+    def nearby(self, x: float, y: float) -> List['Planet']:
+        """Planets in the 3x3 cells around a world position, in planet list order"""
+        cell = (int(x // self.cell_size), int(y // self.cell_size))
+        planets = self._nearby.get(cell)
+        if planets is None:
+            cx, cy = cell
+            found = []
+            for ox in (-1, 0, 1):
+                for oy in (-1, 0, 1):
+                    found.extend(self.cells.get((cx + ox, cy + oy), ()))
+            found.sort(key=lambda entry: entry[0])  # First planet hit wins, so keep list order
+            planets = [planet for _, planet in found]
+            self._nearby[cell] = planets
+        return planets
+
 class ParticleEmitter:
     def __init__(self, world_width=80000, world_height=80000):
         self.world_width = world_width
@@ -1410,27 +1736,29 @@ class ParticleEmitter:
         self.particles: List[Particle] = []
         self.sound_timer = 0  # To limit sound frequency
         
-    def update(self, dt: float, planets: List[Planet], sfx_volume: float = 0.5, camera=None, gravity_distance: float = 500.0, air_resistance_intensity: float = 0.5, walls: List[Wall] = None):
+    def update(self, dt: float, planets: List[Planet], sfx_volume: float = 0.5, camera=None, gravity_distance: float = 500.0, air_resistance_intensity: float = 0.5, walls: List[Wall] = None, planet_grid: PlanetGrid = None):
         self.spawn_timer += dt
         self.sound_timer += dt
         spawn_interval = 1.0 / self.spawn_rate
-        particles_spawned = 0
-        while self.spawn_timer >= spawn_interval:
-            self.spawn_timer -= spawn_interval
-            px = random.uniform(-self.world_width//2, self.world_width//2)
-            py = random.uniform(-self.world_height//2, self.world_height//2)
-            pz = random.uniform(0.3, 1.0)
-            self.particles.append(Particle(px, py, pz, from_spawner=False))  # Main emitter particles fade in
-            particles_spawned += 1
+        # Draw the positions for every particle due this frame in one batch
+        particles_spawned = int(self.spawn_timer // spawn_interval)
+        if particles_spawned > 0:
+            self.spawn_timer -= particles_spawned * spawn_interval
+            xs = np.random.uniform(-self.world_width//2, self.world_width//2, particles_spawned).tolist()
+            ys = np.random.uniform(-self.world_height//2, self.world_height//2, particles_spawned).tolist()
+            zs = np.random.uniform(0.3, 1.0, particles_spawned).tolist()
+            colors = random.choices(PARTICLE_COLORS, k=particles_spawned)
+            self.particles.extend(Particle(px, py, pz, from_spawner=False, color=color)  # Main emitter particles fade in
+                                  for px, py, pz, color in zip(xs, ys, zs, colors))
         # Play spawn sound for the first spawned particle (if any)
         if particles_spawned > 0 and self.sound_timer >= 0.05:
             try:
                 p = self.particles[-1]
-                spawn_sound = generate_spawn_sound()
+                spawn_sound = get_spawn_sound()
                 if camera:
                     dx = p.x - camera.x
                     dy = p.y - camera.y
-                    distance = math.sqrt(dx*dx + dy*dy)
+                    distance = math.hypot(dx, dy)
                     base_volume = max(0.05, 1.0 / (distance / 400 + 1))
                 else:
                     base_volume = 0.1
@@ -1440,7 +1768,9 @@ class ParticleEmitter:
                 self.sound_timer = 0
             except pygame.error:
                 pass  # Sound system not available or failed
-        for particle in self.particles[:]:
+        clones = []
+        nearby = (planet_grid or PlanetGrid(planets)).nearby
+        for particle in self.particles:
             # Process pending clones from this particle
             if hasattr(particle, '_pending_clones') and particle._pending_clones:
                 for clone_data in particle._pending_clones:
@@ -1455,7 +1785,7 @@ class ParticleEmitter:
                     cloned_particle.lifetime = clone_data['lifetime']
                     # Mark as cloned to prevent re-cloning
                     cloned_particle._cloned_from_planet = True
-                    self.particles.append(cloned_particle)
+                    clones.append(cloned_particle)
                 # Clear pending clones
                 particle._pending_clones = []
             
@@ -1464,7 +1794,7 @@ class ParticleEmitter:
                 if camera:
                     dx = particle.x - camera.x
                     dy = particle.y - camera.y
-                    distance = math.sqrt(dx*dx + dy*dy)
+                    distance = math.hypot(dx, dy)
                     if distance < 400:
                         base_volume = max(0.05, 1.0 / (distance / 400 + 1))
                     else:
@@ -1474,16 +1804,18 @@ class ParticleEmitter:
                 final_volume = base_volume * sfx_volume
                 try:
                     if final_volume > 0.01:
-                        sound = generate_explosion_sound()
+                        sound = get_explosion_sound()
                         sound.set_volume(min(0.5, final_volume))
                         sound.play()
                 except pygame.error:
                     pass  # Sound system not available or failed
                 particle._explosion_sound_played = True
             # Collision detection is handled in particle.update() method
-            particle.update(dt, planets, gravity_distance, air_resistance_intensity, camera, sfx_volume, walls)
-            if not particle.alive:
-                self.particles.remove(particle)
+            particle.update(dt, nearby(particle.x, particle.y), gravity_distance, air_resistance_intensity, camera, sfx_volume)
+        # Drop dead particles in one pass before the wall test sees them; clones join at the end and start moving next frame
+        self.particles = [particle for particle in self.particles if particle.alive]
+        bounce_off_walls(self.particles, walls)
+        self.particles.extend(clones)
     
     def draw(self, screen, camera, planets=None):
         # Draw all particles - removed aggressive culling that was causing particles to disappear
@@ -1500,25 +1832,29 @@ class ParticleSpawner:
         self.particles: List[Particle] = []
         self.radius = 15  # Visual radius
         
-    def update(self, dt: float, planets: List[Planet], walls: List[Wall] = None):
+    def update(self, dt: float, planets: List[Planet], walls: List[Wall] = None, planet_grid: PlanetGrid = None):
         """Update spawner and spawn particles"""
         self.spawn_timer += dt
         spawn_interval = 1.0 / self.spawn_rate
         
-        while self.spawn_timer >= spawn_interval:
-            self.spawn_timer -= spawn_interval
-            # Spawn particle near the spawner location
+        count = int(self.spawn_timer // spawn_interval)
+        if count > 0:
+            self.spawn_timer -= count * spawn_interval
+            # Spawn particles near the spawner location
             offset = 20
-            px = self.x + random.uniform(-offset, offset)
-            py = self.y + random.uniform(-offset, offset)
-            pz = random.uniform(0.3, 1.0)
-            self.particles.append(Particle(px, py, pz))
+            xs = (self.x + np.random.uniform(-offset, offset, count)).tolist()
+            ys = (self.y + np.random.uniform(-offset, offset, count)).tolist()
+            zs = np.random.uniform(0.3, 1.0, count).tolist()
+            colors = random.choices(PARTICLE_COLORS, k=count)
+            self.particles.extend(Particle(px, py, pz, color=color) for px, py, pz, color in zip(xs, ys, zs, colors))
         
         # Update particles
-        for particle in self.particles[:]:
-            particle.update(dt, planets, 500.0, 0.5, None, 0.5, walls)
-            if not particle.alive:
-                self.particles.remove(particle)
+        nearby = (planet_grid or PlanetGrid(planets)).nearby
+        for particle in self.particles:
+            particle.update(dt, nearby(particle.x, particle.y), 500.0, 0.5, None, 0.5)
+        # Drop dead particles in one pass, then bounce the survivors
+        self.particles = [particle for particle in self.particles if particle.alive]
+        bounce_off_walls(self.particles, walls)
     
     def draw(self, screen, camera):
         """Draw the spawner"""
@@ -1539,8 +1875,58 @@ class ParticleSpawner:
         scaled_radius = max(3, int(self.radius * camera.zoom * pulse))
         color = (int(255 * pulse), int(255 * pulse), 0)  # Yellow with pulsing intensity
         
-        pygame.draw.circle(screen, color, (int(screen_x), int(screen_y)), scaled_radius)
-        pygame.draw.circle(screen, WHITE, (int(screen_x), int(screen_y)), scaled_radius, 2)
+        center = (int(screen_x), int(screen_y))
+        pygame.draw.circle(screen, color, center, scaled_radius)
+        pygame.draw.circle(screen, WHITE, center, scaled_radius, 2)
+
+# Sine lookup table for the star twinkle: phase * TWINKLE_TABLE_SCALE, wrapped to the table, indexes it
+TWINKLE_TABLE_SIZE = 1024  # Power of two, so wrapping is a bit mask
+TWINKLE_TABLE_SCALE = TWINKLE_TABLE_SIZE / (2 * math.pi)
+_twinkle_sin = np.sin(np.arange(TWINKLE_TABLE_SIZE) / TWINKLE_TABLE_SCALE)
+
+if HAS_NUMBA:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _star_frame_numba(x, y, depth, size, twinkle_speed, twinkle_phase, cam_x, cam_y, zoom, half_w, half_h,
+                          screen_w, screen_h, t, sin_table, out_px, out_py, out_size, out_shade, out_visible):
+        mask = sin_table.shape[0] - 1
+        for i in prange(x.shape[0]):
+            sx = (x[i] - cam_x * depth[i]) * zoom + half_w
+            sy = (y[i] - cam_y * depth[i]) * zoom + half_h
+            out_px[i] = sx
+            out_py[i] = sy
+            visible = sx >= 0.0 and sx < screen_w and sy >= 0.0 and sy < screen_h
+            out_visible[i] = visible
+            if visible:
+                out_size[i] = max(1, int(size[i] * zoom * (1.2 - depth[i])))
+                index = np.int64((t * twinkle_speed[i] + twinkle_phase[i]) * TWINKLE_TABLE_SCALE) & mask
+                out_shade[i] = 0.7 + 0.3 * (0.5 + 0.5 * sin_table[index])
+
+def star_frame(x, y, depth, size, twinkle_speed, twinkle_phase, cam_x, cam_y, zoom, half_w, half_h, screen_w, screen_h, t,
+               out_px, out_py, out_size, out_shade, out_visible):
+    """Screen position of every star and whether it is on screen, written into the out_ arrays.
+    Drawn size and twinkle shade (0.7-1.0) are only worked out for the on-screen stars."""
+    if HAS_NUMBA:
+        _star_frame_numba(x, y, depth, size, twinkle_speed, twinkle_phase, float(cam_x), float(cam_y), float(zoom),
+                          float(half_w), float(half_h), float(screen_w), float(screen_h), float(t), _twinkle_sin,
+                          out_px, out_py, out_size, out_shade, out_visible)
+        return
+    # Positions in place on the output buffers
+    np.multiply(depth, cam_x, out=out_px)
+    np.subtract(x, out_px, out=out_px)
+    out_px *= zoom
+    out_px += half_w
+    np.multiply(depth, cam_y, out=out_py)
+    np.subtract(y, out_py, out=out_py)
+    out_py *= zoom
+    out_py += half_h
+    np.logical_and((out_px >= 0) & (out_px < screen_w), (out_py >= 0) & (out_py < screen_h), out=out_visible)
+    # Most of the field is usually off screen, so size and twinkle skip those stars
+    shown = np.flatnonzero(out_visible)
+    depth = depth[shown]
+    out_size[shown] = np.maximum(1, (size[shown] * zoom * (1.2 - depth)).astype(np.int64))
+    index = ((t * twinkle_speed[shown] + twinkle_phase[shown]) * TWINKLE_TABLE_SCALE).astype(np.int64)
+    index &= TWINKLE_TABLE_SIZE - 1
+    out_shade[shown] = 0.7 + 0.3 * (0.5 + 0.5 * _twinkle_sin[index])
 
 class StarField:
     def __init__(self, num_stars=300, width=80000, height=80000, min_depth=0.3, max_depth=1.0):
@@ -1555,59 +1941,71 @@ class StarField:
             color = (base_brightness, base_brightness, base_brightness)
             twinkle_speed = random.uniform(0.5, 2.0)
             self.stars.append({'x': x, 'y': y, 'depth': depth, 'base_brightness': base_brightness, 'size': size, 'color': color, 'twinkle_speed': twinkle_speed, 'twinkle_phase': random.uniform(0, 2 * math.pi)})
+        # Star attributes as parallel arrays (color is (N, 3)) so the per-frame math runs in bulk
+        for name in ('x', 'y', 'depth', 'size', 'color', 'twinkle_speed', 'twinkle_phase'):
+            setattr(self, name, np.array([star[name] for star in self.stars]))
+        # Per-frame star_frame output, allocated once
+        self._px = np.empty(num_stars)
+        self._py = np.empty(num_stars)
+        self._sizes = np.empty(num_stars, np.int64)
+        self._shade = np.empty(num_stars)
+        self._visible = np.empty(num_stars, bool)
+            
     def draw(self, screen, camera):
         t = pygame.time.get_ticks() / 1000.0
-        for star in self.stars:
-            px = (star['x'] - camera.x * star['depth']) * camera.zoom + camera.screen_width // 2
-            py = (star['y'] - camera.y * star['depth']) * camera.zoom + camera.screen_height // 2
-            size = max(1, int(star['size'] * camera.zoom * (1.2 - star['depth'])))
-            
-            # Enhanced twinkle
-            twinkle = 0.5 + 0.5 * math.sin(t * star['twinkle_speed'] + star['twinkle_phase'])
-            brightness = int(star['base_brightness'] * (0.7 + 0.3 * twinkle))
-            color = tuple(min(255, int(c * (0.7 + 0.3 * twinkle))) for c in star['color'])
-            
-            # Enhanced star rendering with lens flares
-            if 0 <= px < camera.screen_width and 0 <= py < camera.screen_height:
-                # Multiple glow layers for depth
-                if size > 1:
-                    for glow_size, alpha in [(size*8, 15), (size*6, 25), (size*4, 40)]:
-                        glow_surf = pygame.Surface((glow_size*2, glow_size*2), pygame.SRCALPHA)
-                        glow_color = (*color, alpha)
-                        pygame.draw.circle(glow_surf, glow_color, (glow_size, glow_size), glow_size)
-                        screen.blit(glow_surf, (int(px) - glow_size, int(py) - glow_size))
-                
-                # Lens flare effects (cross pattern) for larger stars
-                if size >= 2:
-                    flare_length = size * 4
-                    flare_color = (*color, 80)
-                    # Horizontal flare
-                    pygame.draw.line(screen, flare_color, 
-                                   (int(px) - flare_length, int(py)), (int(px) + flare_length, int(py)), 1)
-                    # Vertical flare
-                    pygame.draw.line(screen, flare_color, 
-                                   (int(px), int(py) - flare_length), (int(px), int(py) + flare_length), 1)
-                    
-                    # Diagonal flares for brighter stars
-                    if size >= 3:
-                        diag_len = int(flare_length * 0.7)
-                        pygame.draw.line(screen, (*color, 60), 
-                                       (int(px) - diag_len, int(py) - diag_len), (int(px) + diag_len, int(py) + diag_len), 1)
-                        pygame.draw.line(screen, (*color, 60), 
-                                       (int(px) - diag_len, int(py) + diag_len), (int(px) + diag_len, int(py) - diag_len), 1)
-                
-                # Main star (bright core)
-                pygame.draw.circle(screen, color, (int(px), int(py)), size)
-                if size > 1:
-                    # Bright center
-                    center_color = tuple(min(255, int(c * 1.3)) for c in color)
-                    pygame.draw.circle(screen, center_color, (int(px), int(py)), max(1, size//2))
+        px, py = self._px, self._py
+        # Positions and culling for every star, sizes and enhanced twinkle for the visible ones
+        star_frame(self.x, self.y, self.depth, self.size, self.twinkle_speed, self.twinkle_phase,
+                   camera.x, camera.y, camera.zoom, camera.screen_width // 2, camera.screen_height // 2,
+                   camera.screen_width, camera.screen_height, t, px, py, self._sizes, self._shade, self._visible)
+        visible = np.flatnonzero(self._visible)
+        if len(visible) == 0:
+            return
+        sizes = self._sizes[visible]
+        colors = (self.color[visible] * self._shade[visible, None]).astype(np.int64)
+        colors = np.minimum(255, colors - colors % STAR_COLOR_STEP + STAR_COLOR_STEP // 2)
+        
+        # Enhanced star rendering with lens flares, only for the stars on screen, in layers:
+        # every glow, then every flare, then every core
+        stars = list(zip(px[visible].astype(np.int64).tolist(), py[visible].astype(np.int64).tolist(),
+                         sizes.tolist(), map(tuple, colors.tolist())))
+        # Multiple glow layers for depth, pre-composited into one cached sprite per star
+        screen.blits([(get_star_glow_sprite(size, color), (x - size * 8, y - size * 8))
+                      for x, y, size, color in stars if size > 1], doreturn=False)
+        
+        # Lens flare effects (cross pattern) for larger stars
+        line = pygame.draw.line
+        for x, y, size, color in stars:
+            if size < 2:
+                continue
+            flare_length = size * 4
+            flare_color = (*color, 80)
+            # Horizontal flare
+            line(screen, flare_color, (x - flare_length, y), (x + flare_length, y), 1)
+            # Vertical flare
+            line(screen, flare_color, (x, y - flare_length), (x, y + flare_length), 1)
+            
+            # Diagonal flares for brighter stars
+            if size >= 3:
+                diag_len = int(flare_length * 0.7)
+                line(screen, (*color, 60), (x - diag_len, y - diag_len), (x + diag_len, y + diag_len), 1)
+                line(screen, (*color, 60), (x - diag_len, y + diag_len), (x + diag_len, y - diag_len), 1)
+        
+        # Main star (bright core)
+        screen.blits([(get_star_core_sprite(size, color), (x - size, y - size)) for x, y, size, color in stars],
+                     doreturn=False)
+
+# Scaled background tiles kept by TiledBackground (one per on-screen tile size)
+TILE_CACHE_SIZE = 8
+# Keep background at consistent 50% opacity
+BACKGROUND_ALPHA = 128
 
 class TiledBackground:
     def __init__(self, image_path: str = "Backround.png"):
         self.image_path = image_path
         self.background_image = None
         self.scale = 7.0  # Default scale
+        self._tile_cache = OrderedDict()  # (width, height) -> scaled, translucent tile
         self.load_image()
     
     def load_image(self):
@@ -1615,7 +2013,12 @@ class TiledBackground:
         try:
             # Load image and ensure it has proper format for transparency
             original_image = pygame.image.load(self.image_path)
-            self.background_image = original_image.convert()  # Convert without alpha first
+            # Opaque convert() plus a surface alpha blends a whole tile at once, which measured faster
+            # than per-pixel alpha (over 4x faster than a convert_alpha() copy with set_alpha)
+            self.background_image = original_image.convert()
+            # transform.scale keeps the surface alpha, so every scaled tile inherits it
+            self.background_image.set_alpha(BACKGROUND_ALPHA)
+            self._tile_cache.clear()
             print(f"Loaded background image: {self.image_path} (size: {self.background_image.get_size()})")
         except pygame.error as e:
             print(f"Could not load background image {self.image_path}: {e}")
@@ -1625,6 +2028,19 @@ class TiledBackground:
         """Set the scale of the background tiles"""
         self.scale = max(3.0, min(10.0, scale))  # Clamp between 3.0 and 10.0
     
+    def get_scaled_tile(self, width: int, height: int):
+        """The background image scaled to a screen tile size, scaled once and reused while the zoom holds"""
+        key = (width, height)
+        tile = self._tile_cache.get(key)
+        if tile is None:
+            tile = pygame.transform.scale(self.background_image, key)
+            self._tile_cache[key] = tile
+            if len(self._tile_cache) > TILE_CACHE_SIZE:
+                self._tile_cache.popitem(last=False)
+        else:
+            self._tile_cache.move_to_end(key)
+        return tile
+    
     def draw(self, screen, camera):
         """Draw the tiled background with performance optimizations"""
         if self.background_image is None:
@@ -1668,44 +2084,60 @@ class TiledBackground:
             start_tile_y = center_y - max_tiles_per_axis // 2
             end_tile_y = center_y + max_tiles_per_axis // 2
         
-        # Draw tiles
-        for tile_x in range(start_tile_x, end_tile_x):
-            for tile_y in range(start_tile_y, end_tile_y):
-                # Calculate world position of this tile
-                world_x = tile_x * world_tile_width
-                world_y = tile_y * world_tile_height
-                
-                # Convert to screen coordinates
-                screen_x, screen_y = camera.world_to_screen(world_x, world_y)
-                
-                # Calculate screen tile size (world tile size * camera zoom)
-                screen_tile_width = int(world_tile_width * camera.zoom)
-                screen_tile_height = int(world_tile_height * camera.zoom)
-                
-                # Skip very small tiles for performance
-                if screen_tile_width < 4 or screen_tile_height < 4:
-                    continue
-                
-                # Only draw if tile is visible on screen
-                if (screen_x + screen_tile_width >= 0 and screen_x < camera.screen_width and
-                    screen_y + screen_tile_height >= 0 and screen_y < camera.screen_height):
-                    
-                    if screen_tile_width > 0 and screen_tile_height > 0:
-                        # Scale the image to screen size
-                        screen_scaled_image = pygame.transform.scale(self.background_image, (screen_tile_width, screen_tile_height))
-                        # Keep background at consistent 50% opacity - simple approach
-                        screen_scaled_image.set_alpha(128)  # 50% transparency
-                        screen.blit(screen_scaled_image, (screen_x, screen_y))
+        # Calculate screen tile size (world tile size * camera zoom)
+        screen_tile_width = int(world_tile_width * camera.zoom)
+        screen_tile_height = int(world_tile_height * camera.zoom)
+        
+        # Skip very small tiles for performance
+        if screen_tile_width < 4 or screen_tile_height < 4:
+            return
+        
+        # Every tile shares one scaled image
+        tile_image = self.get_scaled_tile(screen_tile_width, screen_tile_height)
+        
+        # A tile's screen x only depends on its column and its screen y on its row, so each is
+        # converted once (the camera.world_to_screen arithmetic) and off-screen ones dropped
+        zoom = camera.zoom
+        half_width = camera.screen_width // 2
+        half_height = camera.screen_height // 2
+        columns = [int((tile_x * world_tile_width - camera.x) * zoom + half_width)
+                   for tile_x in range(start_tile_x, end_tile_x)]
+        columns = [x for x in columns if x + screen_tile_width >= 0 and x < camera.screen_width]
+        rows = [int((tile_y * world_tile_height - camera.y) * zoom + half_height)
+                for tile_y in range(start_tile_y, end_tile_y)]
+        rows = [y for y in rows if y + screen_tile_height >= 0 and y < camera.screen_height]
+        
+        # Draw the visible tiles in one blits() call
+        screen.blits([(tile_image, (x, y)) for x in columns for y in rows], doreturn=False)
+
+
+# Lines shown on the first-boot tutorial panel
+TUTORIAL_LINES = [
+    "• Left-click and drag to move around the space",
+    "• Scroll wheel to zoom in and out",
+    "• Buy planets to collect particles and earn money",
+    "• Click on planets to select and upgrade them",
+    "• Use the Stats button to toggle information display",
+    "• Access Settings for audio controls and fullscreen (F key)",
+    "",
+    "Build your particle collection empire!"
+]
+
+# Maximum number of rendered text surfaces kept by Game.render_text
+TEXT_CACHE_SIZE = 256
+
 
 class Game:
     def __init__(self):
         self.fullscreen = False
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        # Cached display size, only refreshed when the display mode changes
+        self.screen_width, self.screen_height = self.screen.get_size()
         pygame.display.set_caption("Particle Tycoon - Left Click & Drag to Move, Scroll to Zoom")
         self.clock = pygame.time.Clock()
         
         # Camera system
-        self.camera = Camera(SCREEN_WIDTH, SCREEN_HEIGHT)
+        self.camera = Camera(self.screen_width, self.screen_height)
         
         # Star field
         self.starfield = StarField()
@@ -1713,6 +2145,13 @@ class Game:
         # Tiled background
         self.tiled_background = TiledBackground()
         
+        # Synthesise the catch chimes and reserve their channels up front instead of on the first catch
+        try:
+            get_catch_sound()
+            get_catch_channels()
+        except pygame.error:
+            pass
+        
         # Game state
         self.money = 100
         self.planets: List[Planet] = []
@@ -1735,6 +2174,8 @@ class Game:
         self.spawn_rate_cost = 100
         self.font = pygame.font.Font(None, 36)
         self.small_font = pygame.font.Font(None, 24)
+        self._text_cache = OrderedDict()  # (font, text, color) -> rendered Surface
+        self._overlay_cache = {}  # (width, height, alpha) -> menu overlay Surface
         
         # Settings menu
         self.show_settings = False
@@ -1783,7 +2224,7 @@ class Game:
         self.money_popups = []  # List of active money popups
         
         # Money tracking for graph
-        self.money_history = []  # List of (time, money) tuples
+        self.money_history = deque(maxlen=100)  # Last 100 (time, money) tuples; old ones drop off the front
         self.money_history_timer = 0
         self.show_money_graph = False
         
@@ -1808,6 +2249,40 @@ class Game:
             {"name": "Spawner", "key": "3", "color": YELLOW},
             {"name": "Dwarf", "key": "4", "color": (150, 100, 50)},  # Brown color for dwarf planets
         ]
+        # Hotkey lookup (K_1 -> 1, ...) built from the number keys listed above
+        self._key_to_tool = {getattr(pygame, f"K_{tool['key']}"): i
+                             for i, tool in enumerate(self.hotbar_tools) if tool["key"].isdigit()}
+        
+        # Pre-render static UI text once; draw_hotbar/draw_ui only blit these
+        self._tool_name_surfs = {color: [self.small_font.render(tool["name"], True, color) for tool in self.hotbar_tools]
+                                 for color in (WHITE, GRAY)}
+        self._tool_key_surfs = {color: [self.small_font.render(tool["key"], True, color) for tool in self.hotbar_tools]
+                                for color in (WHITE, GRAY)}
+        self._tutorial_line_surfs = [self.small_font.render(line, True, WHITE) for line in TUTORIAL_LINES]
+        self._stats_btn_surf = self.small_font.render("Stats", True, WHITE)
+        
+    def render_text(self, font, text, color):
+        """Render text through a small LRU cache so unchanged labels are not re-rasterised every frame"""
+        key = (font, text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            surface = font.render(text, True, color)
+            self._text_cache[key] = surface
+            if len(self._text_cache) > TEXT_CACHE_SIZE:
+                self._text_cache.popitem(last=False)
+        else:
+            self._text_cache.move_to_end(key)
+        return surface
+        
+    def get_overlay(self, alpha):
+        """Full-screen translucent black overlay, rebuilt only when the screen size changes"""
+        key = (self.screen_width, self.screen_height, alpha)
+        overlay = self._overlay_cache.get(key)
+        if overlay is None:
+            overlay = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
+            overlay.fill((0, 0, 0, alpha))
+            self._overlay_cache[key] = overlay
+        return overlay
         
     def handle_events(self):
         for event in pygame.event.get():
@@ -1870,9 +2345,9 @@ class Game:
                     # Check tutorial dismissal
                     if self.show_tutorial:
                         panel_h = 400
-                        panel_y = SCREEN_HEIGHT // 2 - panel_h // 2
+                        panel_y = self.screen_height // 2 - panel_h // 2
                         ok_y = panel_y + panel_h - 80
-                        if SCREEN_WIDTH // 2 - 50 <= mouse_x <= SCREEN_WIDTH // 2 + 50 and ok_y <= mouse_y <= ok_y + 40:  # OK button
+                        if self.screen_width // 2 - 50 <= mouse_x <= self.screen_width // 2 + 50 and ok_y <= mouse_y <= ok_y + 40:  # OK button
                             self.show_tutorial = False
                             self.tutorial_completed = True
                         return True  # Don't process other clicks during tutorial
@@ -1970,8 +2445,8 @@ class Game:
                         # Calculate panel positions for new layout
                         panel_width = 800
                         panel_height = 600
-                        panel_x = (SCREEN_WIDTH - panel_width) // 2
-                        panel_y = (SCREEN_HEIGHT - panel_height) // 2
+                        panel_x = (self.screen_width - panel_width) // 2
+                        panel_y = (self.screen_height - panel_height) // 2
                         col1_x = panel_x + 30
                         col2_x = panel_x + 400
                         col2_y = panel_y + 60
@@ -2028,10 +2503,11 @@ class Game:
                         world_x, world_y = self.camera.screen_to_world(mouse_x, mouse_y)
                         clicked_planet = None
                         for planet in self.planets:
-                            distance = math.sqrt((world_x - planet.x)**2 + (world_y - planet.y)**2)
+                            dx = world_x - planet.x
+                            dy = world_y - planet.y
                             hover_scale = 1.15 if planet == self.hovered_planet else 1.0
                             visual_radius = planet.get_visual_radius(self.camera, hover_scale)
-                            if distance <= visual_radius:
+                            if dx*dx + dy*dy <= visual_radius * visual_radius:
                                 clicked_planet = planet
                                 break
                         
@@ -2061,15 +2537,11 @@ class Game:
                         self.selected_tool = 0  # Reset to no tool
                 elif event.key == pygame.K_f:
                     self.toggle_fullscreen()
+                elif event.key == pygame.K_F3:
+                    self.camera.show_debug = not self.camera.show_debug
                 # Hotbar hotkeys
-                elif event.key == pygame.K_1:
-                    self.select_tool(1)  # Planets
-                elif event.key == pygame.K_2:
-                    self.select_tool(2)  # Walls
-                elif event.key == pygame.K_3:
-                    self.select_tool(3)  # Future tool
-                elif event.key == pygame.K_4:
-                    self.select_tool(4)  # Future tool
+                elif event.key in self._key_to_tool:
+                    self.select_tool(self._key_to_tool[event.key])
         
         return True
     
@@ -2126,9 +2598,11 @@ class Game:
         
         # Check distance from other planets - reduced minimum distance for smaller planets
         min_distance = 50  # Reduced from previous calculation for smaller planets
+        min_distance_sq = min_distance * min_distance
         for planet in self.planets:
-            planet_dist = math.sqrt((x - planet.x)**2 + (y - planet.y)**2)
-            if planet_dist < min_distance:
+            dx = x - planet.x
+            dy = y - planet.y
+            if dx*dx + dy*dy < min_distance_sq:
                 self.placement_error_message = "Too close to another planet!"
                 self.placement_error_timer = 3.0  # Show message for 3 seconds
                 return False
@@ -2152,10 +2626,10 @@ class Game:
         return 20 <= x <= 200 and 220 <= y <= 260
     
     def is_click_on_settings_button(self, x: int, y: int) -> bool:
-        return SCREEN_WIDTH - 120 <= x <= SCREEN_WIDTH - 20 and 60 <= y <= 100
+        return self.screen_width - 120 <= x <= self.screen_width - 20 and 60 <= y <= 100
     
     def is_click_on_stats_button(self, x: int, y: int) -> bool:
-        return 20 <= x <= 120 and SCREEN_HEIGHT - 50 <= y <= SCREEN_HEIGHT - 10
+        return 20 <= x <= 120 and self.screen_height - 50 <= y <= self.screen_height - 10
     
     def is_click_on_buy_wall_button(self, x: int, y: int) -> bool:
         return 200 <= x <= 340 and 20 <= y <= 60
@@ -2163,8 +2637,8 @@ class Game:
     def is_click_on_hotbar(self, x: int, y: int) -> int:
         """Check if click is on hotbar, return tool index or -1 if not on hotbar"""
         hotbar_width = len(self.hotbar_tools) * 60 + (len(self.hotbar_tools) - 1) * 10
-        hotbar_x = SCREEN_WIDTH // 2 - hotbar_width // 2
-        hotbar_y = SCREEN_HEIGHT - 120
+        hotbar_x = self.screen_width // 2 - hotbar_width // 2
+        hotbar_y = self.screen_height - 120
         
         for i in range(len(self.hotbar_tools)):
             slot_x = hotbar_x + i * 70
@@ -2182,7 +2656,7 @@ class Game:
             return 0
         dx = end_pos[0] - start_pos[0]
         dy = end_pos[1] - start_pos[1]
-        length = math.sqrt(dx*dx + dy*dy)
+        length = math.hypot(dx, dy)
         cost = length * self.wall_cost_per_unit
         # Minimum cost of 1 for any wall, but require minimum length of 10 units
         return max(1, int(cost)) if length >= 10 else 0
@@ -2198,9 +2672,10 @@ class Game:
         
         self.hovered_planet = None
         for planet in self.planets:
-            distance = math.sqrt((world_x - planet.x)**2 + (world_y - planet.y)**2)
+            dx = world_x - planet.x
+            dy = world_y - planet.y
             visual_radius = planet.get_visual_radius(self.camera)
-            if distance <= visual_radius:
+            if dx*dx + dy*dy <= visual_radius * visual_radius:
                 self.hovered_planet = planet
                 break
     
@@ -2221,11 +2696,13 @@ class Game:
         # Add game reference to camera for light ray effects
         self.camera._game_ref = self
         
-        self.emitter.update(dt, self.planets, self.sfx_volume, self.camera, self.gravity_distance, self.air_resistance_intensity, self.walls)
+        # One planet grid per frame, shared by the emitter and every spawner
+        planet_grid = PlanetGrid(self.planets)
+        self.emitter.update(dt, self.planets, self.sfx_volume, self.camera, self.gravity_distance, self.air_resistance_intensity, self.walls, planet_grid)
         
         # Update spawners
         for spawner in self.spawners:
-            spawner.update(dt, self.planets, self.walls)
+            spawner.update(dt, self.planets, self.walls, planet_grid)
         
         self.music_selector.play_music(self.music_volume)
         
@@ -2244,7 +2721,7 @@ class Game:
             # Play tick sound for each money increase
             for _ in range(min(money_increase, 10)):  # Limit to 10 sounds max to avoid spam
                 try:
-                    tick_sound = generate_tick_sound()
+                    tick_sound = get_tick_sound()
                     tick_sound.set_volume(min(0.3, self.sfx_volume * 0.6))  # Quieter than other sounds
                     tick_sound.play()
                 except pygame.error:
@@ -2259,10 +2736,10 @@ class Game:
         
         self.last_money_amount = self.money
         
-        # Animate money display
+        # Animate money display - exponential ease, never overshoots even on a long frame
         money_diff = self.money - self.display_money
         if abs(money_diff) > 0.1:
-            self.display_money += money_diff * self.money_animation_speed * dt
+            self.display_money += money_diff * (1.0 - math.exp(-self.money_animation_speed * dt))
         else:
             self.display_money = self.money
             
@@ -2286,9 +2763,6 @@ class Game:
             self.money_history_timer = 0
             current_time = pygame.time.get_ticks() / 1000.0
             self.money_history.append((current_time, self.money))
-            # Keep only last 100 data points
-            if len(self.money_history) > 100:
-                self.money_history.pop(0)
     
     def draw(self):
         self.screen.fill(BLACK)
@@ -2343,7 +2817,7 @@ class Game:
             
             # Add text label above cursor
             status_text = "PLANET" + (" ✓" if (can_place and has_money) else " ✗")
-            text_surface = self.small_font.render(status_text, True, color)
+            text_surface = self.render_text(self.small_font, status_text, color)
             self.screen.blit(text_surface, (mouse_x - 30, mouse_y - 40))
         
         elif self.placing_wall:
@@ -2362,7 +2836,7 @@ class Game:
                 pygame.draw.line(self.screen, color, (start_screen_x, start_screen_y), (mouse_x, mouse_y), 5)  # Thicker line
                 
                 # Draw cost text near mouse
-                cost_text = self.small_font.render(f"${wall_cost}", True, color)
+                cost_text = self.render_text(self.small_font, f"${wall_cost}", color)
                 self.screen.blit(cost_text, (mouse_x + 10, mouse_y - 20))
             else:
                 # Draw start point indicator
@@ -2380,7 +2854,7 @@ class Game:
             
             # Add text label above cursor
             status_text = "SPAWNER" + (" ✓" if self.money >= self.spawner_cost else " ✗")
-            text_surface = self.small_font.render(status_text, True, color)
+            text_surface = self.render_text(self.small_font, status_text, color)
             self.screen.blit(text_surface, (mouse_x - 35, mouse_y - 40))
         
         elif self.placing_dwarf_planet:
@@ -2398,61 +2872,59 @@ class Game:
             
             # Add text label above cursor
             status_text = "DWARF" + (" ✓" if (can_place and has_money) else " ✗")
-            text_surface = self.small_font.render(status_text, True, color)
+            text_surface = self.render_text(self.small_font, status_text, color)
             self.screen.blit(text_surface, (mouse_x - 25, mouse_y - 40))
         
         pygame.display.flip()
     
     def draw_ui(self):
         # Money display (with smooth animation)
-        money_text = self.font.render(f"Money: ${int(self.display_money)}", True, WHITE)
-        self.screen.blit(money_text, (SCREEN_WIDTH - 200, 20))
+        money_text = self.render_text(self.font, f"Money: ${int(self.display_money)}", WHITE)
+        self.screen.blit(money_text, (self.screen_width - 200, 20))
         
         # Map mode indicator
         if self.camera.is_map_mode():
             # Draw map mode indicator
-            indicator_x = SCREEN_WIDTH - 250
+            indicator_x = self.screen_width - 250
             indicator_y = 60
             pygame.draw.circle(self.screen, (0, 255, 0), (indicator_x, indicator_y), 8)
             pygame.draw.circle(self.screen, WHITE, (indicator_x, indicator_y), 8, 2)
-            map_text = self.small_font.render("MAP MODE", True, (0, 255, 0))
+            map_text = self.render_text(self.small_font, "MAP MODE", (0, 255, 0))
             self.screen.blit(map_text, (indicator_x + 15, indicator_y - 8))
         
         # Settings button
-        pygame.draw.rect(self.screen, DARK_GRAY, (SCREEN_WIDTH - 120, 60, 100, 40))
-        pygame.draw.rect(self.screen, WHITE, (SCREEN_WIDTH - 120, 60, 100, 40), 2)
-        settings_text = self.small_font.render("Settings", True, WHITE)
-        self.screen.blit(settings_text, (SCREEN_WIDTH - 110, 72))
+        pygame.draw.rect(self.screen, DARK_GRAY, (self.screen_width - 120, 60, 100, 40))
+        pygame.draw.rect(self.screen, WHITE, (self.screen_width - 120, 60, 100, 40), 2)
+        settings_text = self.render_text(self.small_font, "Settings", WHITE)
+        self.screen.blit(settings_text, (self.screen_width - 110, 72))
         
         # Settings menu
         if self.show_settings:
             # Semi-transparent overlay
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 128))
-            self.screen.blit(overlay, (0, 0))
+            self.screen.blit(self.get_overlay(128), (0, 0))
             
             # Larger settings panel to prevent crowding
             panel_width = 800
             panel_height = 600
-            panel_x = (SCREEN_WIDTH - panel_width) // 2
-            panel_y = (SCREEN_HEIGHT - panel_height) // 2
+            panel_x = (self.screen_width - panel_width) // 2
+            panel_y = (self.screen_height - panel_height) // 2
             panel_rect = pygame.Rect(panel_x, panel_y, panel_width, panel_height)
             pygame.draw.rect(self.screen, DARK_GRAY, panel_rect)
             pygame.draw.rect(self.screen, WHITE, panel_rect, 3)
             
             # Settings title
-            title_text = self.font.render("Settings", True, WHITE)
+            title_text = self.render_text(self.font, "Settings", WHITE)
             self.screen.blit(title_text, (panel_x + 20, panel_y + 15))
             
             # Left Column - Audio Controls
             col1_x = panel_x + 30
             col1_y = panel_y + 60
             
-            audio_title = self.small_font.render("Audio Controls", True, YELLOW)
+            audio_title = self.render_text(self.small_font, "Audio Controls", YELLOW)
             self.screen.blit(audio_title, (col1_x, col1_y))
             
             # SFX Volume
-            sfx_label = self.small_font.render("SFX Volume:", True, WHITE)
+            sfx_label = self.render_text(self.small_font, "SFX Volume:", WHITE)
             self.screen.blit(sfx_label, (col1_x, col1_y + 40))
             # Update slider position
             self.sfx_slider.x = col1_x
@@ -2460,7 +2932,7 @@ class Game:
             self.sfx_slider.draw(self.screen)
             
             # Music Volume
-            music_label = self.small_font.render("Music Volume:", True, WHITE)
+            music_label = self.render_text(self.small_font, "Music Volume:", WHITE)
             self.screen.blit(music_label, (col1_x, col1_y + 100))
             # Update slider position
             self.music_slider.x = col1_x
@@ -2468,7 +2940,7 @@ class Game:
             self.music_slider.draw(self.screen)
             
             # Music Selection
-            music_select_label = self.small_font.render("Background Music:", True, WHITE)
+            music_select_label = self.render_text(self.small_font, "Background Music:", WHITE)
             self.screen.blit(music_select_label, (col1_x, col1_y + 160))
             # Update music selector position
             self.music_selector.x = col1_x
@@ -2479,11 +2951,11 @@ class Game:
             col2_x = panel_x + 400
             col2_y = panel_y + 60
             
-            game_title = self.small_font.render("Game Controls", True, YELLOW)
+            game_title = self.render_text(self.small_font, "Game Controls", YELLOW)
             self.screen.blit(game_title, (col2_x, col2_y))
             
             # Gravity Distance
-            gravity_label = self.small_font.render(f"Gravity Distance: {int(self.gravity_distance)}", True, WHITE)
+            gravity_label = self.render_text(self.small_font, f"Gravity Distance: {int(self.gravity_distance)}", WHITE)
             self.screen.blit(gravity_label, (col2_x, col2_y + 40))
             # Update gravity slider position
             self.gravity_slider.x = col2_x
@@ -2491,7 +2963,7 @@ class Game:
             self.gravity_slider.draw(self.screen)
             
             # Air Resistance Intensity
-            air_label = self.small_font.render(f"Air Resistance: {self.air_resistance_intensity:.1f}", True, WHITE)
+            air_label = self.render_text(self.small_font, f"Air Resistance: {self.air_resistance_intensity:.1f}", WHITE)
             self.screen.blit(air_label, (col2_x, col2_y + 100))
             # Update air resistance slider position
             self.air_resistance_slider.x = col2_x
@@ -2499,7 +2971,7 @@ class Game:
             self.air_resistance_slider.draw(self.screen)
             
             # Background Scale
-            bg_label = self.small_font.render(f"Background Scale: {self.background_scale:.1f}", True, WHITE)
+            bg_label = self.render_text(self.small_font, f"Background Scale: {self.background_scale:.1f}", WHITE)
             self.screen.blit(bg_label, (col2_x, col2_y + 140))
             # Update background slider position
             self.background_slider.x = col2_x
@@ -2511,21 +2983,21 @@ class Game:
             star_color = GREEN if self.show_stars else GRAY
             pygame.draw.rect(self.screen, star_color, (col2_x, col2_y + 190, 180, 35))
             pygame.draw.rect(self.screen, WHITE, (col2_x, col2_y + 190, 180, 35), 2)
-            star_text = self.small_font.render(star_label, True, BLACK if self.show_stars else WHITE)
+            star_text = self.render_text(self.small_font, star_label, BLACK if self.show_stars else WHITE)
             self.screen.blit(star_text, (col2_x + 10, col2_y + 200))
             
             # Fullscreen toggle button
             fs_label = "Go Windowed" if self.fullscreen else "Go Fullscreen"
             pygame.draw.rect(self.screen, LIGHT_GRAY, (col2_x, col2_y + 235, 180, 35))
             pygame.draw.rect(self.screen, WHITE, (col2_x, col2_y + 235, 180, 35), 2)
-            fs_text = self.small_font.render(fs_label + " (F)", True, BLACK)
+            fs_text = self.render_text(self.small_font, fs_label + " (F)", BLACK)
             self.screen.blit(fs_text, (col2_x + 10, col2_y + 245))
             
             # Windowed mode button (only show in fullscreen)
             if self.fullscreen:
                 pygame.draw.rect(self.screen, LIGHT_GRAY, (col2_x, col2_y + 280, 180, 35))
                 pygame.draw.rect(self.screen, WHITE, (col2_x, col2_y + 280, 180, 35), 2)
-                windowed_text = self.small_font.render("Windowed Mode", True, BLACK)
+                windowed_text = self.render_text(self.small_font, "Windowed Mode", BLACK)
                 self.screen.blit(windowed_text, (col2_x + 10, col2_y + 290))
             
             # Bottom Row - Action Buttons
@@ -2535,30 +3007,30 @@ class Game:
             # Test money button
             pygame.draw.rect(self.screen, YELLOW, (col1_x, button_y, 120, 35))
             pygame.draw.rect(self.screen, WHITE, (col1_x, button_y, 120, 35), 2)
-            test_text = self.small_font.render("Test +$100", True, BLACK)
+            test_text = self.render_text(self.small_font, "Test +$100", BLACK)
             self.screen.blit(test_text, (col1_x + 10, button_y + 8))
             
             # Tutorial button
             pygame.draw.rect(self.screen, BLUE, (col1_x + button_spacing, button_y, 120, 35))
             pygame.draw.rect(self.screen, WHITE, (col1_x + button_spacing, button_y, 120, 35), 2)
-            tutorial_text = self.small_font.render("Show Tutorial", True, WHITE)
+            tutorial_text = self.render_text(self.small_font, "Show Tutorial", WHITE)
             self.screen.blit(tutorial_text, (col1_x + button_spacing + 5, button_y + 8))
             
             # Money Graph button
             graph_color = GREEN if self.show_money_graph else GRAY
             pygame.draw.rect(self.screen, graph_color, (col1_x + button_spacing * 2, button_y, 120, 35))
             pygame.draw.rect(self.screen, WHITE, (col1_x + button_spacing * 2, button_y, 120, 35), 2)
-            graph_text = self.small_font.render("Money Graph", True, WHITE)
+            graph_text = self.render_text(self.small_font, "Money Graph", WHITE)
             self.screen.blit(graph_text, (col1_x + button_spacing * 2 + 5, button_y + 8))
             
             # Quit button
             pygame.draw.rect(self.screen, (200, 50, 50), (col1_x + button_spacing * 3, button_y, 120, 35))
             pygame.draw.rect(self.screen, WHITE, (col1_x + button_spacing * 3, button_y, 120, 35), 2)
-            quit_text = self.small_font.render("Quit Game", True, WHITE)
+            quit_text = self.render_text(self.small_font, "Quit Game", WHITE)
             self.screen.blit(quit_text, (col1_x + button_spacing * 3 + 15, button_y + 8))
             
             # Close instruction
-            close_text = self.small_font.render("Click Settings again to close", True, YELLOW)
+            close_text = self.render_text(self.small_font, "Click Settings again to close", YELLOW)
             close_rect = close_text.get_rect(center=(panel_x + panel_width//2, panel_y + panel_height - 25))
             self.screen.blit(close_text, close_rect)
         
@@ -2568,22 +3040,21 @@ class Game:
             spawn_color = GREEN if self.money >= self.spawn_rate_cost else GRAY
             pygame.draw.rect(self.screen, spawn_color, (20, 70, 210, 40))
             pygame.draw.rect(self.screen, WHITE, (20, 70, 210, 40), 2)
-            spawn_text = self.small_font.render(f"Upgrade Spawn Rate (${self.spawn_rate_cost})", True, WHITE)
+            spawn_text = self.render_text(self.small_font, f"Upgrade Spawn Rate (${self.spawn_rate_cost})", WHITE)
             self.screen.blit(spawn_text, (25, 82))
             
             # Stats toggle button
             stats_color = GREEN if self.show_stats else GRAY
-            pygame.draw.rect(self.screen, stats_color, (20, SCREEN_HEIGHT - 50, 100, 40))
-            pygame.draw.rect(self.screen, WHITE, (20, SCREEN_HEIGHT - 50, 100, 40), 2)
-            stats_text = self.small_font.render("Stats", True, WHITE)
-            self.screen.blit(stats_text, (45, SCREEN_HEIGHT - 38))
+            pygame.draw.rect(self.screen, stats_color, (20, self.screen_height - 50, 100, 40))
+            pygame.draw.rect(self.screen, WHITE, (20, self.screen_height - 50, 100, 40), 2)
+            self.screen.blit(self._stats_btn_surf, (45, self.screen_height - 38))
             
             # Upgrade gravity button (only show if planet is selected)
             if self.selected_planet:
                 gravity_color = GREEN if self.money >= self.selected_planet.upgrade_cost else GRAY
                 pygame.draw.rect(self.screen, gravity_color, (20, 170, 180, 40))
                 pygame.draw.rect(self.screen, WHITE, (20, 170, 180, 40), 2)
-                gravity_text = self.small_font.render(f"Upgrade Gravity (${self.selected_planet.upgrade_cost})", True, WHITE)
+                gravity_text = self.render_text(self.small_font, f"Upgrade Gravity (${self.selected_planet.upgrade_cost})", WHITE)
                 self.screen.blit(gravity_text, (25, 182))
                 
                 # Clone orbit upgrade button (only show if planet doesn't have clone orbit yet)
@@ -2591,17 +3062,17 @@ class Game:
                     clone_color = GREEN if self.money >= self.selected_planet.clone_orbit_cost else GRAY
                     pygame.draw.rect(self.screen, clone_color, (20, 220, 180, 40))
                     pygame.draw.rect(self.screen, WHITE, (20, 220, 180, 40), 2)
-                    clone_text = self.small_font.render(f"Add Clone Orbit (${self.selected_planet.clone_orbit_cost})", True, WHITE)
+                    clone_text = self.render_text(self.small_font, f"Add Clone Orbit (${self.selected_planet.clone_orbit_cost})", WHITE)
                     self.screen.blit(clone_text, (25, 232))
                 
                 # Selected planet info
                 planet_info_y = 270 if not self.selected_planet.has_clone_orbit else 220
-                info_text = self.small_font.render(f"Selected: Level {self.selected_planet.gravity_level} Planet", True, YELLOW)
+                info_text = self.render_text(self.small_font, f"Selected: Level {self.selected_planet.gravity_level} Planet", YELLOW)
                 self.screen.blit(info_text, (20, planet_info_y))
                 
                 # Show clone orbit status
                 if self.selected_planet.has_clone_orbit:
-                    clone_info = self.small_font.render("Clone Orbit: ACTIVE", True, (255, 0, 255))
+                    clone_info = self.render_text(self.small_font, "Clone Orbit: ACTIVE", (255, 0, 255))
                     self.screen.blit(clone_info, (20, planet_info_y + 20))
             
             # Stats (only show if toggled on)
@@ -2616,43 +3087,43 @@ class Game:
                 ]
                 
                 for i, stat in enumerate(stats):
-                    stat_text = self.small_font.render(stat, True, WHITE)
+                    stat_text = self.render_text(self.small_font, stat, WHITE)
                     self.screen.blit(stat_text, (20, stats_y + i * 20))
             
             # Only show essential placement instructions
             if self.placing_planet:
-                instruction_text = self.small_font.render("Click to place planet (ESC to cancel)", True, YELLOW)
-                self.screen.blit(instruction_text, (SCREEN_WIDTH // 2 - 150, SCREEN_HEIGHT - 30))
+                instruction_text = self.render_text(self.small_font, "Click to place planet (ESC to cancel)", YELLOW)
+                self.screen.blit(instruction_text, (self.screen_width // 2 - 150, self.screen_height - 30))
             elif self.placing_wall:
                 if self.wall_start_pos is None:
-                    instruction_text = self.small_font.render("Click to set wall start point (ESC to cancel)", True, YELLOW)
+                    instruction_text = self.render_text(self.small_font, "Click to set wall start point (ESC to cancel)", YELLOW)
                 else:
-                    instruction_text = self.small_font.render("Click to set wall end point (ESC to cancel)", True, YELLOW)
-                self.screen.blit(instruction_text, (SCREEN_WIDTH // 2 - 150, SCREEN_HEIGHT - 30))
+                    instruction_text = self.render_text(self.small_font, "Click to set wall end point (ESC to cancel)", YELLOW)
+                self.screen.blit(instruction_text, (self.screen_width // 2 - 150, self.screen_height - 30))
             elif self.placing_spawner:
-                instruction_text = self.small_font.render("Click to place particle spawner (ESC to cancel)", True, YELLOW)
-                self.screen.blit(instruction_text, (SCREEN_WIDTH // 2 - 150, SCREEN_HEIGHT - 30))
+                instruction_text = self.render_text(self.small_font, "Click to place particle spawner (ESC to cancel)", YELLOW)
+                self.screen.blit(instruction_text, (self.screen_width // 2 - 150, self.screen_height - 30))
             elif self.placing_dwarf_planet:
-                instruction_text = self.small_font.render("Click to place dwarf planet (ESC to cancel)", True, YELLOW)
-                self.screen.blit(instruction_text, (SCREEN_WIDTH // 2 - 150, SCREEN_HEIGHT - 30))
+                instruction_text = self.render_text(self.small_font, "Click to place dwarf planet (ESC to cancel)", YELLOW)
+                self.screen.blit(instruction_text, (self.screen_width // 2 - 150, self.screen_height - 30))
             
             # Show placement error message
             if self.placement_error_timer > 0 and self.placement_error_message:
-                error_text = self.small_font.render(self.placement_error_message, True, RED)
-                self.screen.blit(error_text, (SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT - 60))
+                error_text = self.render_text(self.small_font, self.placement_error_message, RED)
+                self.screen.blit(error_text, (self.screen_width // 2 - 100, self.screen_height - 60))
             
             # Draw hotbar
             self.draw_hotbar()
         
         # Draw planet menu on the right
         if self.planet_menu_visible:
-            menu_x = SCREEN_WIDTH - 300
+            menu_x = self.screen_width - 300
             menu_y = 120
             menu_w = 280
             menu_h = 60 * max(1, len(self.planets)) + 40
             pygame.draw.rect(self.screen, (30, 30, 60), (menu_x, menu_y, menu_w, menu_h))
             pygame.draw.rect(self.screen, WHITE, (menu_x, menu_y, menu_w, menu_h), 2)
-            title = self.small_font.render("Your Planets", True, YELLOW)
+            title = self.render_text(self.small_font, "Your Planets", YELLOW)
             self.screen.blit(title, (menu_x + 10, menu_y + 10))
             for i, planet in enumerate(self.planets):
                 y = menu_y + 40 + i * 60
@@ -2662,61 +3133,47 @@ class Game:
                 planet.draw_preview(self.screen, menu_x + 30, y + 15, 12)
                 
                 # Draw planet info
-                name_text = self.small_font.render(planet.name, True, color)
+                name_text = self.render_text(self.small_font, planet.name, color)
                 self.screen.blit(name_text, (menu_x + 55, y))
-                type_text = self.small_font.render(f"({planet.planet_type['name']})", True, GRAY)
+                type_text = self.render_text(self.small_font, f"({planet.planet_type.name})", GRAY)
                 self.screen.blit(type_text, (menu_x + 55, y + 15))
-                count_text = self.small_font.render(f"$ {planet.particles_collected}", True, color)
+                count_text = self.render_text(self.small_font, f"$ {planet.particles_collected}", color)
                 self.screen.blit(count_text, (menu_x + 180, y + 8))
         
         # Tutorial screen
         if self.show_tutorial:
             # Semi-transparent overlay
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 180))
-            self.screen.blit(overlay, (0, 0))
+            self.screen.blit(self.get_overlay(180), (0, 0))
             
             # Tutorial panel
             panel_w, panel_h = 600, 400
-            panel_x = SCREEN_WIDTH // 2 - panel_w // 2
-            panel_y = SCREEN_HEIGHT // 2 - panel_h // 2
+            panel_x = self.screen_width // 2 - panel_w // 2
+            panel_y = self.screen_height // 2 - panel_h // 2
             pygame.draw.rect(self.screen, (20, 20, 40), (panel_x, panel_y, panel_w, panel_h))
             pygame.draw.rect(self.screen, WHITE, (panel_x, panel_y, panel_w, panel_h), 3)
             
             # Tutorial title
-            title = self.font.render("Welcome to Particle Tycoon!", True, YELLOW)
-            title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, panel_y + 40))
+            title = self.render_text(self.font, "Welcome to Particle Tycoon!", YELLOW)
+            title_rect = title.get_rect(center=(self.screen_width // 2, panel_y + 40))
             self.screen.blit(title, title_rect)
             
             # Tutorial text
-            tutorial_lines = [
-                "• Left-click and drag to move around the space",
-                "• Scroll wheel to zoom in and out",
-                "• Buy planets to collect particles and earn money",
-                "• Click on planets to select and upgrade them",
-                "• Use the Stats button to toggle information display",
-                "• Access Settings for audio controls and fullscreen (F key)",
-                "",
-                "Build your particle collection empire!"
-            ]
-            
-            for i, line in enumerate(tutorial_lines):
-                text = self.small_font.render(line, True, WHITE)
+            for i, text in enumerate(self._tutorial_line_surfs):
                 self.screen.blit(text, (panel_x + 40, panel_y + 100 + i * 30))
             
             # OK button
-            ok_button = pygame.Rect(SCREEN_WIDTH // 2 - 50, panel_y + panel_h - 80, 100, 40)
+            ok_button = pygame.Rect(self.screen_width // 2 - 50, panel_y + panel_h - 80, 100, 40)
             pygame.draw.rect(self.screen, GREEN, ok_button)
             pygame.draw.rect(self.screen, WHITE, ok_button, 2)
-            ok_text = self.small_font.render("OK", True, BLACK)
+            ok_text = self.render_text(self.small_font, "OK", BLACK)
             ok_rect = ok_text.get_rect(center=ok_button.center)
             self.screen.blit(ok_text, ok_rect)
     
     def draw_hotbar(self):
         """Draw the hotbar at the bottom center of the screen"""
         hotbar_width = len(self.hotbar_tools) * 60 + (len(self.hotbar_tools) - 1) * 10
-        hotbar_x = SCREEN_WIDTH // 2 - hotbar_width // 2
-        hotbar_y = SCREEN_HEIGHT - 120
+        hotbar_x = self.screen_width // 2 - hotbar_width // 2
+        hotbar_y = self.screen_height - 120
         
         for i, tool in enumerate(self.hotbar_tools):
             slot_x = hotbar_x + i * 70
@@ -2745,18 +3202,18 @@ class Game:
             pygame.draw.rect(self.screen, border_color, (slot_x, slot_y, slot_size, slot_size), 3)
             
             # Draw tool name
-            name_text = self.small_font.render(tool["name"], True, text_color)
+            name_text = self._tool_name_surfs[text_color][i]
             name_rect = name_text.get_rect(center=(slot_x + slot_size//2, slot_y + slot_size//2 - 10))
             self.screen.blit(name_text, name_rect)
             
             # Draw hotkey
-            key_text = self.small_font.render(tool["key"], True, text_color)
+            key_text = self._tool_key_surfs[text_color][i]
             key_rect = key_text.get_rect(center=(slot_x + slot_size//2, slot_y + slot_size//2 + 10))
             self.screen.blit(key_text, key_rect)
             
             # Draw cost for planet tool
             if i == 1:  # Planet tool
-                cost_text = self.small_font.render(f"${self.planet_cost}", True, text_color)
+                cost_text = self.render_text(self.small_font, f"${self.planet_cost}", text_color)
                 cost_rect = cost_text.get_rect(center=(slot_x + slot_size//2, slot_y + slot_size + 15))
                 self.screen.blit(cost_text, cost_rect)
     
@@ -2769,15 +3226,14 @@ class Game:
         self.starfield.draw(self.screen, self.camera)
         
         # Draw map boundary
-        if hasattr(self, 'draw_map_boundary'):
-            self.draw_map_boundary()
+        self.draw_map_boundary()
         
         # Draw walls
         for wall in self.walls:
             wall.draw(self.screen, self.camera, self.gravity_distance, self.air_resistance_intensity)
         
-        # Draw planets
-        for planet in self.planets:
+        # Draw planets (off-screen ones are culled up front)
+        for planet in visible_planets(self.camera, self.planets):
             planet.draw(self.screen, self.camera, self.gravity_distance, self.air_resistance_intensity)
         
         # Draw spawners
@@ -2795,33 +3251,8 @@ class Game:
         for money_popup in self.money_popups:
             money_popup.draw(self.screen, self.camera, self.font)
         
-        # Draw UI elements
-        if hasattr(self, 'draw_ui'):
-            self.draw_ui()
-        
-        # Draw placement previews
-        if hasattr(self, 'draw_placement_previews'):
-            self.draw_placement_previews()
-        
-        # Draw settings menu
-        if self.show_settings and hasattr(self, 'draw_settings_menu'):
-            self.draw_settings_menu()
-        
-        # Draw tutorial
-        if hasattr(self, 'show_tutorial') and self.show_tutorial and hasattr(self, 'draw_tutorial'):
-            self.draw_tutorial()
-        
-        # Draw stats menu
-        if hasattr(self, 'show_stats') and self.show_stats and hasattr(self, 'draw_stats_menu'):
-            self.draw_stats_menu()
-        
-        # Draw money graph
-        if self.show_money_graph and hasattr(self, 'draw_money_graph'):
-            self.draw_money_graph()
-        
-        # Draw hotbar
-        if hasattr(self, 'draw_hotbar'):
-            self.draw_hotbar()
+        # Draw UI elements (settings, stats, tutorial and hotbar are all drawn by draw_ui)
+        self.draw_ui()
         
         # Update display
         pygame.display.flip()
@@ -2830,17 +3261,15 @@ class Game:
         self.fullscreen = not self.fullscreen
         if self.fullscreen:
             self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.FULLSCREEN)
-            # Update camera screen size for fullscreen
-            self.camera.screen_width = SCREEN_WIDTH
-            self.camera.screen_height = SCREEN_HEIGHT
         else:
             # Make windowed mode much smaller so user can grab title bar and move window
             windowed_width = min(1400, SCREEN_WIDTH - 400)
             windowed_height = min(1000, SCREEN_HEIGHT - 300)
             self.screen = pygame.display.set_mode((windowed_width, windowed_height))
-            # Update camera screen dimensions for windowed mode
-            self.camera.screen_width = windowed_width
-            self.camera.screen_height = windowed_height
+        # Refresh the cached display size and keep the camera in sync
+        self.screen_width, self.screen_height = self.screen.get_size()
+        self.camera.screen_width = self.screen_width
+        self.camera.screen_height = self.screen_height
     
     def run(self):
         running = True
@@ -2848,7 +3277,9 @@ class Game:
             dt = self.clock.tick(FPS) / 1000.0  # Delta time in seconds
             
             running = self.handle_events()
-            self.update(dt)
+            # The world is paused while the tutorial or settings menu is shown
+            if not (self.show_tutorial or self.show_settings):
+                self.update(dt)
             self.draw()
         
         pygame.quit()
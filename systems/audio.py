@@ -3,8 +3,10 @@ import pygame
 import numpy as np
 import random
 
-# Initialize Pygame mixer
-pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
+def _ensure_mixer():
+    """Initialise the mixer on first use instead of at import time"""
+    if not pygame.mixer.get_init():
+        pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
 
 def generate_tick_sound():
     """Generate a short tick sound for money increases"""
@@ -25,6 +27,7 @@ def generate_tick_sound():
         arr[i] = [wave * envelope, wave * envelope]
     
     arr = (arr * 32767).astype(np.int16)
+    _ensure_mixer()
     sound = pygame.sndarray.make_sound(arr)
     return sound
 
@@ -44,6 +47,7 @@ def generate_spawn_sound():
         arr[i] = [wave * fade * 0.1, wave * fade * 0.1]  # Low volume
     
     arr = (arr * 32767).astype(np.int16)
+    _ensure_mixer()
     sound = pygame.sndarray.make_sound(arr)
     return sound
 
@@ -67,6 +71,7 @@ def generate_catch_sound():
         arr[i] = [wave * fade * 0.08, wave * fade * 0.08]  # Low volume
     
     arr = (arr * 32767).astype(np.int16)
+    _ensure_mixer()
     sound = pygame.sndarray.make_sound(arr)
     return sound
 
@@ -91,11 +96,13 @@ def generate_explosion_sound():
         arr[i] = [noise * envelope * 0.15, noise * envelope * 0.15]  # Low volume
     
     arr = (arr * 32767).astype(np.int16)
+    _ensure_mixer()
     sound = pygame.sndarray.make_sound(arr)
     return sound
 
+PLANET_NAME_PREFIXES = ("Alpha", "Beta", "Gamma", "Delta", "Epsilon", "Zeta", "Theta", "Nova", "Stellar", "Cosmic")
+PLANET_NAME_SUFFIXES = ("Prime", "Major", "Minor", "Core", "Edge", "Central", "Outer", "Inner", "Deep", "Far")
+
 def generate_planet_name():
     """Generate a random planet name"""
-    prefixes = ["Alpha", "Beta", "Gamma", "Delta", "Epsilon", "Zeta", "Theta", "Nova", "Stellar", "Cosmic"]
-    suffixes = ["Prime", "Major", "Minor", "Core", "Edge", "Central", "Outer", "Inner", "Deep", "Far"]
-    return f"{random.choice(prefixes)} {random.choice(suffixes)}"
+    return f"{random.choice(PLANET_NAME_PREFIXES)} {random.choice(PLANET_NAME_SUFFIXES)}"
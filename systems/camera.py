@@ -14,6 +14,7 @@ class Camera:
         self.screen_height = screen_height
         self.dragging = False
         self.last_mouse_pos = (0, 0)
+        self.show_debug = True  # Draw the gravity/air range rings around planets (F3 toggles)
         
         # Zoom limits - allow much more zoom out for bigger map
         self.min_zoom = 0.05
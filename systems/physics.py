@@ -0,0 +1,125 @@
+"""
+Physics utilities - vectorized particle/planet helpers built on NumPy
+"""
+from operator import attrgetter
+import numpy as np
+
+from systems.physics_kernel import CELL_KEY_STRIDE  # Packs (cell_x, cell_y) into one int64 key
+from systems.physics_kernel import HAS_NUMBA, PHYSICS_DTYPE, first_planet_hits
+
+
+def planet_arrays(planets):
+    """Pack planet positions, radii and masses into PHYSICS_DTYPE arrays (rebuilt when planets change)"""
+    count = len(planets)
+    planet_x = np.fromiter(map(attrgetter('x'), planets), PHYSICS_DTYPE, count)
+    planet_y = np.fromiter(map(attrgetter('y'), planets), PHYSICS_DTYPE, count)
+    planet_r = np.fromiter(map(attrgetter('radius'), planets), PHYSICS_DTYPE, count)
+    planet_mass = np.fromiter(map(attrgetter('mass'), planets), PHYSICS_DTYPE, count)
+    return planet_x, planet_y, planet_r, planet_mass
+
+
+def find_planet_hits(px, py, pr, palive, planet_x, planet_y, planet_r, grid=None):
+    """Return (particle indices, planet indices) for every live particle touching a planet.
+
+    Each particle is credited to the first planet it overlaps, matching the
+    order of the planet list. When a PlanetGrid is given, only particles in a
+    cell next to a planet are tested.
+    """
+    if len(px) == 0 or len(planet_x) == 0:
+        empty = np.empty(0, np.intp)
+        return empty, empty
+
+    if HAS_NUMBA:
+        return first_planet_hits(px, py, pr, palive, planet_x, planet_y, planet_r, grid)
+
+    if grid is not None:
+        candidates = np.flatnonzero(palive & grid.candidate_mask(px, py))
+        hit_idx, planet_idx = find_planet_hits(px[candidates], py[candidates], pr[candidates],
+                                               palive[candidates], planet_x, planet_y, planet_r)
+        return candidates[hit_idx], planet_idx
+
+    dx = px[:, None] - planet_x[None, :]
+    dy = py[:, None] - planet_y[None, :]
+    reach = planet_r[None, :] + pr[:, None]
+    hit = (dx * dx + dy * dy) < reach * reach
+    hit &= palive[:, None]
+
+    mask = hit.any(axis=1)
+    first_hit = hit.argmax(axis=1)
+    particle_idx = np.flatnonzero(mask)
+    return particle_idx, first_hit[particle_idx]
+
+
+def find_planet_at(x, y, planet_x, planet_y, reach_sq):
+    """Index of the first planet whose squared reach contains (x, y), or -1"""
+    if len(planet_x) == 0:
+        return -1
+    dx = planet_x - x
+    dy = planet_y - y
+    inside = dx * dx + dy * dy < reach_sq
+    index = int(inside.argmax())
+    return index if inside[index] else -1
+
+
+class PlanetGrid:
+    """Uniform grid over planet positions for constant-time neighbourhood lookups.
+
+    By default the cell size is twice the largest planet radius, so anything
+    touching a planet lies in the 3x3 block of cells around its own cell. Built with the gravity range as cell
+    size, the same 3x3 block holds every planet that can pull on a particle.
+    """
+    def __init__(self):
+        self.cell_size = 1.0
+        self.keys = np.empty(0, np.int64)
+        # Planet cell keys in sorted order and the planet index behind each one
+        self.planet_keys = np.empty(0, np.int64)
+        self.order = np.empty(0, np.intp)
+
+    def build(self, planets, cell_size=None):
+        """Rebuild the grid - call whenever planets are added, removed or resized"""
+        if cell_size is None:
+            cell_size = max(map(attrgetter('radius'), planets), default=1.0) * 2
+        self.cell_size = float(cell_size)
+        cells = set()
+        planet_keys = np.empty(len(planets), np.int64)
+        for i, planet in enumerate(planets):
+            cell = (int(planet.x // self.cell_size), int(planet.y // self.cell_size))
+            cells.add(cell)
+            planet_keys[i] = cell[0] * CELL_KEY_STRIDE + cell[1]
+        self.order = np.argsort(planet_keys, kind='stable')
+        self.planet_keys = planet_keys[self.order]
+
+        # Keys of every cell in the neighbourhood of an occupied cell
+        keys = {(cx + ox) * CELL_KEY_STRIDE + (cy + oy)
+                for cx, cy in cells for ox in (-1, 0, 1) for oy in (-1, 0, 1)}
+        self.keys = np.fromiter(keys, np.int64, len(keys))
+
+    def candidate_mask(self, px, py):
+        """Boolean mask of the particles that sit in a cell next to any planet"""
+        cx = np.floor_divide(px, self.cell_size).astype(np.int64)
+        cy = np.floor_divide(py, self.cell_size).astype(np.int64)
+        return np.isin(cx * CELL_KEY_STRIDE + cy, self.keys)
+
+    def neighbour_pairs(self, px, py):
+        """(particle indices, planet indices) for every planet in the 3x3 cells around each particle"""
+        cx = np.floor_divide(px, self.cell_size).astype(np.int64)
+        cy = np.floor_divide(py, self.cell_size).astype(np.int64)
+        particles = []
+        planets = []
+        for ox in (-1, 0, 1):
+            for oy in (-1, 0, 1):
+                keys = (cx + ox) * CELL_KEY_STRIDE + (cy + oy)
+                lo = np.searchsorted(self.planet_keys, keys, 'left')
+                counts = np.searchsorted(self.planet_keys, keys, 'right') - lo
+                total = int(counts.sum())
+                if total == 0:
+                    continue
+                # Expand each particle's [lo, hi) run of sorted planets into flat pairs
+                starts = np.repeat(lo, counts)
+                run_offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+                particles.append(np.repeat(np.arange(len(px)), counts))
+                planets.append(self.order[starts + run_offsets])
+        if not particles:
+            empty = np.empty(0, np.intp)
+            return empty, empty
+        return np.concatenate(particles), np.concatenate(planets)
@@ -0,0 +1,46 @@
+"""
+Optional GPU gravity - evaluates the dense particle x planet force pass with CuPy
+when a CUDA device is available. Only worth the transfer cost for large systems.
+"""
+from systems.physics_kernel import GRAVITY_SCALE
+
+# Try to import cupy for GPU arrays
+try:
+    import cupy as cp
+    HAS_CUPY = bool(cp.cuda.is_available())
+except ImportError:
+    HAS_CUPY = False
+
+# Particle x planet pairs per step before the upload/download round trip pays off
+GPU_PAIR_THRESHOLD = 50_000
+
+
+def use_gpu(particle_count, planet_count):
+    """True if the force pass for this many particles and planets should run on the GPU"""
+    return HAS_CUPY and particle_count * planet_count > GPU_PAIR_THRESHOLD
+
+
+def planet_forces_gpu(px, py, pr, pm, planet_x, planet_y, planet_r, planet_mass, gravity_distance, air_resistance, dt):
+    """GPU version of physics_kernel._planet_forces_dense; takes and returns NumPy arrays"""
+    px, py, pr, pm = cp.asarray(px), cp.asarray(py), cp.asarray(pr), cp.asarray(pm)
+    planet_x, planet_y = cp.asarray(planet_x), cp.asarray(planet_y)
+    planet_r, planet_mass = cp.asarray(planet_r), cp.asarray(planet_mass)
+
+    dx = planet_x[None, :] - px[:, None]
+    dy = planet_y[None, :] - py[:, None]
+    dist_sq = dx * dx + dy * dy
+
+    surface = planet_r[None, :] + pr[:, None]
+    in_range = (dist_sq < gravity_distance * gravity_distance) & (dist_sq > surface * surface)
+    air_radius = planet_r[None, :] * 3
+    in_air = dist_sq < air_radius * air_radius
+    distance = cp.sqrt(dist_sq)
+    safe_dist = cp.where(in_range, distance, 1.0)
+    force = cp.where(in_range, planet_mass[None, :] * pm[:, None] / (safe_dist * safe_dist) * GRAVITY_SCALE, 0.0)
+    scale = force / safe_dist
+    ax = (dx * scale).sum(axis=1)
+    ay = (dy * scale).sum(axis=1)
+    damping = cp.where(in_air, 1.0 - air_resistance * (1.0 - distance / air_radius) * dt, 1.0).prod(axis=1)
+
+    # One copy back per result column
+    return cp.asnumpy(ax), cp.asnumpy(ay), cp.asnumpy(damping)
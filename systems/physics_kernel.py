@@ -0,0 +1,299 @@
+"""
+Particle physics kernel - gravity, air resistance, integration, wall bounces
+and planet catches on Structure-of-Arrays particle data. Compiled with Numba when it is installed,
+otherwise a NumPy implementation with the same semantics is used.
+"""
+import math
+from operator import attrgetter
+import numpy as np
+
+# Try to import numba for a compiled kernel
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+GRAVITY_SCALE = 0.1      # Scales planet.mass * particle.mass / d^2
+WALL_RESTITUTION = -0.8  # Velocity multiplier when bouncing off a wall
+WALL_PUSH_OUT = 10.0     # How far (in dt units) a bounced particle is pushed off the wall
+CELL_KEY_STRIDE = 1 << 32  # Packs (cell_x, cell_y) into one int64 key, shared with PlanetGrid
+# Particle, planet and wall columns are single precision - positions only ever become integer pixels
+PHYSICS_DTYPE = np.float32
+
+
+# Wall attributes packed by wall_arrays: end points, then the unit normal (nx, ny) and offset c of the
+# wall's line (nx * x + ny * y + c is the signed distance to it) and 1/length^2, all zero for a
+# degenerate wall, which is then tested as a point
+WALL_FIELDS = ('x1', 'y1', 'x2', 'y2', 'nx', 'ny', 'c', 'inv_length_sq')
+
+
+def wall_arrays(walls):
+    """Pack each of WALL_FIELDS into a PHYSICS_DTYPE array (rebuilt when walls change)"""
+    count = len(walls)
+    return tuple(np.fromiter(map(attrgetter(name), walls), PHYSICS_DTYPE, count) for name in WALL_FIELDS)
+
+
+def _planet_forces_dense(px, py, pr, pm, planet_x, planet_y, planet_r, planet_mass, gravity_distance, air_resistance, dt):
+    """Gravity acceleration and air damping from every planet on every particle"""
+    dx = planet_x[None, :] - px[:, None]
+    dy = planet_y[None, :] - py[:, None]
+    dist_sq = dx * dx + dy * dy
+
+    # Gravity only between the planet surface and the gravity range
+    surface = planet_r[None, :] + pr[:, None]
+    in_range = (dist_sq < gravity_distance * gravity_distance) & (dist_sq > surface * surface)
+    air_radius = planet_r[None, :] * 3
+    in_air = dist_sq < air_radius * air_radius
+    # Range tests above are on squared distances; only pairs that pass one take a square root
+    distance = np.sqrt(dist_sq, out=np.ones_like(dist_sq), where=in_range | in_air)
+    safe_dist = np.where(in_range, distance, 1.0)
+    force = np.where(in_range, planet_mass[None, :] * pm[:, None] / (safe_dist * safe_dist) * GRAVITY_SCALE, 0.0)
+    scale = force / safe_dist  # One division normalises both components
+    ax = (dx * scale).sum(axis=1)
+    ay = (dy * scale).sum(axis=1)
+
+    # Air resistance compounds over every atmosphere the particle is inside
+    damping = np.where(in_air, 1.0 - air_resistance * (1.0 - distance / air_radius) * dt, 1.0).prod(axis=1)
+    return ax, ay, damping
+
+
+def _planet_forces_pairs(px, py, pr, pm, planet_x, planet_y, planet_r, planet_mass, gravity_distance, air_resistance,
+                         dt, pairs):
+    """Same as _planet_forces_dense, restricted to the (particle, planet) pairs from a PlanetGrid"""
+    count = len(px)
+    i, j = pairs
+    dx = planet_x[j] - px[i]
+    dy = planet_y[j] - py[i]
+    dist_sq = dx * dx + dy * dy
+    distance = np.sqrt(dist_sq)
+
+    surface = planet_r[j] + pr[i]
+    in_range = (dist_sq < gravity_distance * gravity_distance) & (dist_sq > surface * surface)
+    safe_dist = np.where(in_range, distance, 1.0)
+    force = np.where(in_range, planet_mass[j] * pm[i] / (safe_dist * safe_dist) * GRAVITY_SCALE, 0.0)
+    scale = force / safe_dist
+    ax = np.bincount(i, weights=dx * scale, minlength=count)
+    ay = np.bincount(i, weights=dy * scale, minlength=count)
+
+    air_radius = planet_r[j] * 3
+    in_air = dist_sq < air_radius * air_radius
+    damping = np.ones(count)
+    np.multiply.at(damping, i[in_air], 1.0 - air_resistance * (1.0 - distance[in_air] / air_radius[in_air]) * dt)
+    return ax, ay, damping
+
+
+def _step_numpy(px, py, vx, vy, pr, pm, planet_x, planet_y, planet_r, planet_mass,
+                wall_x1, wall_y1, wall_x2, wall_y2, wall_nx, wall_ny, wall_c, wall_inv_length_sq,
+                gravity_distance, air_resistance, dt, grid=None, planet_forces=_planet_forces_dense):
+    if len(planet_x):
+        if grid is None:
+            ax, ay, damping = planet_forces(px, py, pr, pm, planet_x, planet_y, planet_r, planet_mass,
+                                            gravity_distance, air_resistance, dt)
+        else:
+            # Only particles in a cell next to a planet can feel one; the rest just coast
+            near = np.flatnonzero(grid.candidate_mask(px, py))
+            i, j = grid.neighbour_pairs(px[near], py[near])
+            ax, ay, damping = _planet_forces_pairs(px, py, pr, pm, planet_x, planet_y, planet_r, planet_mass,
+                                                   gravity_distance, air_resistance, dt, (near[i], j))
+        vx += ax * dt
+        vy += ay * dt
+        vx *= damping
+        vy *= damping
+
+    px += vx * dt * 60
+    py += vy * dt * 60
+
+    # Walls are resolved one after another, like the scalar loop they replace
+    for k in range(len(wall_x1)):
+        # Only particles within a radius of the wall's line can touch the segment
+        d = wall_nx[k] * px + wall_ny[k] * py + wall_c[k]
+        near = np.flatnonzero(d * d < pr * pr)
+        if len(near) == 0:
+            continue
+        ex = wall_x2[k] - wall_x1[k]
+        ey = wall_y2[k] - wall_y1[k]
+        t = np.clip(((px[near] - wall_x1[k]) * ex + (py[near] - wall_y1[k]) * ey) * wall_inv_length_sq[k], 0.0, 1.0)
+        cx = px[near] - (wall_x1[k] + t * ex)
+        cy = py[near] - (wall_y1[k] + t * ey)
+        hit = near[cx * cx + cy * cy < pr[near] * pr[near]]
+        if len(hit):
+            vx[hit] *= WALL_RESTITUTION
+            vy[hit] *= WALL_RESTITUTION
+            px[hit] += vx[hit] * dt * WALL_PUSH_OUT
+            py[hit] += vy[hit] * dt * WALL_PUSH_OUT
+
+
+if HAS_NUMBA:
+    @njit(inline='always')
+    def _planet_pull(j, x, y, pri, pmi, planet_x, planet_y, planet_r, planet_mass,
+                     gravity_distance_sq, air_resistance, dt):
+        """Gravity (fx, fy) and air damping factor of planet j on one particle"""
+        dx = planet_x[j] - x
+        dy = planet_y[j] - y
+        dist_sq = dx * dx + dy * dy
+        fx = 0.0
+        fy = 0.0
+        damping = 1.0
+        surface = planet_r[j] + pri
+        air_radius = planet_r[j] * 3
+        in_range = dist_sq < gravity_distance_sq and dist_sq > surface * surface
+        in_air = dist_sq < air_radius * air_radius
+        if in_range or in_air:
+            # One square root serves both gravity and air resistance
+            distance = math.sqrt(dist_sq)
+            if in_range:
+                inv_distance = 1.0 / distance  # 1/d^3 from one division instead of two
+                scale = planet_mass[j] * pmi * GRAVITY_SCALE * inv_distance * inv_distance * inv_distance
+                fx = dx * scale
+                fy = dy * scale
+            if in_air:
+                damping = 1.0 - air_resistance * (1.0 - distance / air_radius) * dt
+        return fx, fy, damping
+
+    @njit(parallel=True, cache=True, fastmath=True)
+    def _step_numba(px, py, vx, vy, pr, pm, planet_x, planet_y, planet_r, planet_mass,
+                    wall_x1, wall_y1, wall_x2, wall_y2, wall_nx, wall_ny, wall_c, wall_inv_length_sq,
+                    gravity_distance, air_resistance, dt, cell_size, planet_keys, planet_order):
+        gravity_distance_sq = gravity_distance * gravity_distance
+        for i in prange(px.shape[0]):
+            x = px[i]
+            y = py[i]
+            fx = 0.0
+            fy = 0.0
+            damping = 1.0
+            if cell_size > 0.0:
+                # Only the planets in the 3x3 cells around the particle can reach it
+                cx = np.int64(math.floor(x / cell_size))
+                cy = np.int64(math.floor(y / cell_size))
+                for ox in range(-1, 2):
+                    for oy in range(-1, 2):
+                        key = (cx + ox) * CELL_KEY_STRIDE + (cy + oy)
+                        lo = np.searchsorted(planet_keys, key)
+                        hi = np.searchsorted(planet_keys, key, side='right')
+                        for s in range(lo, hi):
+                            gx, gy, d = _planet_pull(planet_order[s], x, y, pr[i], pm[i], planet_x, planet_y,
+                                                     planet_r, planet_mass, gravity_distance_sq, air_resistance, dt)
+                            fx += gx
+                            fy += gy
+                            damping *= d
+            else:
+                for j in range(planet_x.shape[0]):
+                    gx, gy, d = _planet_pull(j, x, y, pr[i], pm[i], planet_x, planet_y,
+                                             planet_r, planet_mass, gravity_distance_sq, air_resistance, dt)
+                    fx += gx
+                    fy += gy
+                    damping *= d
+            vxi = (vx[i] + fx * dt) * damping
+            vyi = (vy[i] + fy * dt) * damping
+
+            x += vxi * dt * 60
+            y += vyi * dt * 60
+
+            for k in range(wall_x1.shape[0]):
+                # Too far from the wall's line to touch the segment
+                d = wall_nx[k] * x + wall_ny[k] * y + wall_c[k]
+                if d * d >= pr[i] * pr[i]:
+                    continue
+                ex = wall_x2[k] - wall_x1[k]
+                ey = wall_y2[k] - wall_y1[k]
+                t = ((x - wall_x1[k]) * ex + (y - wall_y1[k]) * ey) * wall_inv_length_sq[k]
+                t = min(1.0, max(0.0, t))
+                cx = x - (wall_x1[k] + t * ex)
+                cy = y - (wall_y1[k] + t * ey)
+                if cx * cx + cy * cy < pr[i] * pr[i]:
+                    vxi *= WALL_RESTITUTION
+                    vyi *= WALL_RESTITUTION
+                    x += vxi * dt * WALL_PUSH_OUT
+                    y += vyi * dt * WALL_PUSH_OUT
+
+            px[i] = x
+            py[i] = y
+            vx[i] = vxi
+            vy[i] = vyi
+
+    @njit(inline='always')
+    def _touches(j, x, y, pri, planet_x, planet_y, planet_r):
+        """True if a particle at (x, y) with radius pri overlaps planet j"""
+        dx = x - planet_x[j]
+        dy = y - planet_y[j]
+        reach = planet_r[j] + pri
+        return dx * dx + dy * dy < reach * reach
+
+    @njit(parallel=True, cache=True, fastmath=True)
+    def _first_hits_numba(px, py, pr, palive, planet_x, planet_y, planet_r, cell_size, planet_keys, planet_order, out):
+        for i in prange(px.shape[0]):
+            first = -1
+            if palive[i]:
+                if cell_size > 0.0:
+                    # Lowest-numbered touching planet among those in the 3x3 cells around the particle
+                    cx = np.int64(math.floor(px[i] / cell_size))
+                    cy = np.int64(math.floor(py[i] / cell_size))
+                    for ox in range(-1, 2):
+                        for oy in range(-1, 2):
+                            key = (cx + ox) * CELL_KEY_STRIDE + (cy + oy)
+                            lo = np.searchsorted(planet_keys, key)
+                            hi = np.searchsorted(planet_keys, key, side='right')
+                            for s in range(lo, hi):
+                                j = planet_order[s]
+                                if (first < 0 or j < first) and _touches(j, px[i], py[i], pr[i],
+                                                                         planet_x, planet_y, planet_r):
+                                    first = j
+                else:
+                    for j in range(planet_x.shape[0]):
+                        if _touches(j, px[i], py[i], pr[i], planet_x, planet_y, planet_r):
+                            first = j
+                            break
+            out[i] = first
+
+
+_NO_KEYS = np.empty(0, np.int64)
+_NO_ORDER = np.empty(0, np.intp)
+
+
+def first_planet_hits(px, py, pr, palive, planet_x, planet_y, planet_r, grid=None):
+    """Compiled systems.physics.find_planet_hits: (particle indices, planet indices), Numba only.
+
+    grid is an optional PlanetGrid built with its default (touch-range) cell size.
+    """
+    if grid is None:
+        cell_size, planet_keys, planet_order = 0.0, _NO_KEYS, _NO_ORDER
+    else:
+        cell_size, planet_keys, planet_order = grid.cell_size, grid.planet_keys, grid.order
+    first = np.empty(len(px), np.intp)
+    _first_hits_numba(px, py, pr, palive, planet_x, planet_y, planet_r,
+                      float(cell_size), planet_keys, planet_order, first)
+    particle_idx = np.flatnonzero(first >= 0)
+    return particle_idx, first[particle_idx]
+
+
+def step_particles(px, py, vx, vy, pr, pm, planet_x, planet_y, planet_r, planet_mass,
+                   wall_x1, wall_y1, wall_x2, wall_y2, wall_nx, wall_ny, wall_c, wall_inv_length_sq,
+                   gravity_distance, air_resistance, dt, grid=None, planet_forces=None):
+    """Advance particle positions and velocities in place by one frame.
+
+    All particle and planet arguments are PHYSICS_DTYPE arrays; walls are the eight
+    arrays returned by wall_arrays(). grid is an optional systems.physics.PlanetGrid
+    built with a cell size of at least the gravity range (and three planet radii),
+    so each particle only looks at planets in its own 3x3 block of cells.
+    planet_forces optionally replaces the dense force pass (e.g.
+    systems.physics_gpu.planet_forces_gpu); the grid is not used then.
+    """
+    if len(px) == 0:
+        return
+    if planet_forces is not None:
+        _step_numpy(px, py, vx, vy, pr, pm, planet_x, planet_y, planet_r, planet_mass,
+                    wall_x1, wall_y1, wall_x2, wall_y2, wall_nx, wall_ny, wall_c, wall_inv_length_sq,
+                    float(gravity_distance), float(air_resistance), float(dt), None, planet_forces)
+    elif HAS_NUMBA:
+        if grid is None:
+            cell_size, planet_keys, planet_order = 0.0, _NO_KEYS, _NO_ORDER
+        else:
+            cell_size, planet_keys, planet_order = grid.cell_size, grid.planet_keys, grid.order
+        _step_numba(px, py, vx, vy, pr, pm, planet_x, planet_y, planet_r, planet_mass,
+                    wall_x1, wall_y1, wall_x2, wall_y2, wall_nx, wall_ny, wall_c, wall_inv_length_sq,
+                    float(gravity_distance), float(air_resistance), float(dt), float(cell_size), planet_keys, planet_order)
+    else:
+        _step_numpy(px, py, vx, vy, pr, pm, planet_x, planet_y, planet_r, planet_mass,
+                    wall_x1, wall_y1, wall_x2, wall_y2, wall_nx, wall_ny, wall_c, wall_inv_length_sq,
+                    float(gravity_distance), float(air_resistance), float(dt), grid)
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""Check that the physics kernel paths agree: grid vs dense, Numba vs NumPy
+
+The Numba checks skip unless numba is installed. With NUMBA_DISABLE_JIT=1 the
+kernel bodies run as plain Python, which exercises their loops without
+compiling (CI runs both ways, see .github/workflows/tests.yml).
+"""
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+import systems.physics as physics
+import systems.physics_kernel as physics_kernel
+from systems.physics import PlanetGrid, planet_arrays, find_planet_hits
+from systems.physics_kernel import HAS_NUMBA, PHYSICS_DTYPE, step_particles, wall_arrays
+
+GRAVITY_DISTANCE = 300.0
+AIR_RESISTANCE = 0.5
+DT = 1 / 60
+STEPS = 30
+
+needs_numba = pytest.mark.skipif(not HAS_NUMBA, reason="numba is not installed")
+
+
+def _wall(x1, y1, x2, y2):
+    """Stand-in for core.game.Wall with the attributes wall_arrays() packs"""
+    dx, dy = x2 - x1, y2 - y1
+    length_sq = dx * dx + dy * dy
+    length = length_sq ** 0.5
+    nx = dy / length if length > 0 else 0.0
+    ny = -dx / length if length > 0 else 0.0
+    return SimpleNamespace(x1=x1, y1=y1, x2=x2, y2=y2, nx=nx, ny=ny, c=-(nx * x1 + ny * y1),
+                           inv_length_sq=1.0 / length_sq if length_sq > 0 else 0.0)
+
+
+def _scene(seed=7, count=3000):
+    """Particles, planets and walls spread over a few gravity ranges"""
+    rng = np.random.default_rng(seed)
+    column = lambda low, high, size=count: rng.uniform(low, high, size).astype(PHYSICS_DTYPE)
+    particles = [column(-1500, 1500), column(-1500, 1500), column(-3, 3), column(-3, 3),
+                 np.full(count, 5, PHYSICS_DTYPE), column(0.5, 1.5)]
+    planets = [SimpleNamespace(x=x, y=y, radius=r, mass=r * 0.8)
+               for x, y, r in zip(rng.uniform(-1200, 1200, 12), rng.uniform(-1200, 1200, 12), rng.uniform(15, 60, 12))]
+    walls = [_wall(*rng.uniform(-1500, 1500, 4)) for _ in range(8)] + [_wall(40.0, 40.0, 40.0, 40.0)]
+    return particles, planets, walls
+
+
+def _run_steps(particles, planets, walls, grid=None):
+    """Copy of the particle columns after STEPS frames of step_particles"""
+    px, py, vx, vy, pr, pm = (column.copy() for column in particles)
+    planet_data = planet_arrays(planets)
+    wall_data = wall_arrays(walls)
+    for _ in range(STEPS):
+        step_particles(px, py, vx, vy, pr, pm, *planet_data, *wall_data,
+                       GRAVITY_DISTANCE, AIR_RESISTANCE, DT, grid)
+    return np.stack([px, py, vx, vy])
+
+
+def _hits(particles, planets, grid=None):
+    px, py, _, _, pr, _ = particles
+    palive = np.ones(len(px), bool)
+    palive[::5] = False  # Some particles are already exploding or fading
+    planet_x, planet_y, planet_r, _ = planet_arrays(planets)
+    hit_idx, planet_idx = find_planet_hits(px, py, pr, palive, planet_x, planet_y, planet_r, grid)
+    order = np.argsort(hit_idx)
+    return hit_idx[order], planet_idx[order]
+
+
+def _gravity_grid(planets):
+    """PlanetGrid sized like Game's: covering the gravity range and every atmosphere"""
+    grid = PlanetGrid()
+    grid.build(planets, max(GRAVITY_DISTANCE, 3 * max(planet.radius for planet in planets)))
+    return grid
+
+
+def _touch_grid(planets):
+    grid = PlanetGrid()
+    grid.build(planets)
+    return grid
+
+
+@contextmanager
+def _numpy_kernels():
+    """Route step_particles and find_planet_hits through their NumPy implementations"""
+    physics_kernel.HAS_NUMBA = physics.HAS_NUMBA = False
+    try:
+        yield
+    finally:
+        physics_kernel.HAS_NUMBA = physics.HAS_NUMBA = HAS_NUMBA
+
+
+def test_step_grid_matches_dense():
+    particles, planets, walls = _scene()
+    dense = _run_steps(particles, planets, walls)
+    gridded = _run_steps(particles, planets, walls, _gravity_grid(planets))
+    np.testing.assert_allclose(gridded, dense, rtol=1e-4, atol=1e-3)
+
+
+def test_hits_grid_matches_dense():
+    particles, planets, _ = _scene()
+    dense = _hits(particles, planets)
+    gridded = _hits(particles, planets, _touch_grid(planets))
+    assert len(dense[0]) > 0
+    np.testing.assert_array_equal(gridded[0], dense[0])
+    np.testing.assert_array_equal(gridded[1], dense[1])
+
+
+@needs_numba
+def test_step_numba_matches_numpy():
+    particles, planets, walls = _scene()
+    for grid in (None, _gravity_grid(planets)):
+        compiled = _run_steps(particles, planets, walls, grid)
+        with _numpy_kernels():
+            reference = _run_steps(particles, planets, walls, grid)
+        np.testing.assert_allclose(compiled, reference, rtol=1e-4, atol=1e-3)
+
+
+@needs_numba
+def test_hits_numba_matches_numpy():
+    particles, planets, _ = _scene()
+    for grid in (None, _touch_grid(planets)):
+        compiled = _hits(particles, planets, grid)
+        with _numpy_kernels():
+            reference = _hits(particles, planets, grid)
+        np.testing.assert_array_equal(compiled[0], reference[0])
+        np.testing.assert_array_equal(compiled[1], reference[1])
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-v"]))
@@ -6,7 +6,7 @@ def test_imports():
     print("🧪 Testing module imports...")
     
     try:
-        from config.constants import SCREEN_WIDTH, PARTICLE_COLORS
+        from config.constants import get_screen_size, PARTICLE_COLORS
         print("✅ config.constants imported successfully")
         
         from systems.audio import generate_tick_sound
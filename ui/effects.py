@@ -61,6 +61,9 @@ class LightRay:
         self.x = x
         self.y = y
         self.angle = angle
+        # Unit direction, fixed for the ray's lifetime
+        self.dir_x = math.cos(angle)
+        self.dir_y = math.sin(angle)
         self.length = 0
         self.max_length = 25  # Even smaller light rays - less tall
         self.timer = 0
@@ -90,8 +93,8 @@ class LightRay:
         screen_x, screen_y = camera.world_to_screen(self.x, self.y)
         
         # Calculate end point of the ray
-        end_x = screen_x + math.cos(self.angle) * self.length
-        end_y = screen_y + math.sin(self.angle) * self.length
+        end_x = screen_x + self.dir_x * self.length
+        end_y = screen_y + self.dir_y * self.length
         
         # Calculate color with intensity
         alpha = int(255 * self.intensity)